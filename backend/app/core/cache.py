@@ -0,0 +1,190 @@
+"""
+In-process response caches
+Versioned LRU cache of serialised responses keyed by (kind, project_id);
+an entry is only served while its version matches the caller's version,
+so bumping the version in the DB invalidates it without any explicit eviction.
+
+Lookups that would otherwise cost a query per request (project code → id,
+tree versions, dashboard results) live in NotifiedCaches, which are evicted by
+the change bus (LISTEN/NOTIFY) and only served while its listener is connected.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from app.core.notify import CLASSIFICATIONS_CHANNEL, PROJECTS_CHANNEL, TASKS_CHANNEL, ChangeBus
+from app.settings import READ_YOUR_WRITES_WINDOW_S, TREE_CACHE_SIZE
+
+
+class VersionedLRUCache:
+    """LRU of (version, bytes) per key; one entry per key, older versions are overwritten"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[int, bytes]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, version: int) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, version: int, value: bytes) -> None:
+        current = self._data.get(key)
+        # 더 새로운 버전이 이미 있으면 덮어쓰지 않음 (동시 요청 간 역전 방지)
+        if current is not None and current[0] > version:
+            return
+        self._data[key] = (version, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def evict(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class NotifiedCache:
+    """
+    LRU evicted by change notifications; served only while `active` (listener connected)
+    A value is not stored when its key (or the whole cache) was evicted after
+    `started - settle_s`: the caller may have read it before the change committed, or
+    from a replica that has not replayed the change yet.
+    """
+
+    def __init__(self, maxsize: int, settle_s: float):
+        self.maxsize = maxsize
+        self.settle_s = settle_s
+        self.active = False
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._evicted_at: Dict[Hashable, float] = {}
+        self._cleared_at = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        if not self.active or key not in self._data:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return self._data[key]
+
+    def set(self, key: Hashable, value: Any, started: float) -> None:
+        """`started`: time.monotonic() taken before the value was read from the DB"""
+        if not self.active:
+            return
+        since = started - self.settle_s
+        if self._cleared_at > since or self._evicted_at.get(key, 0.0) > since:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def evict(self, keys: Iterable[Hashable]) -> None:
+        now = time.monotonic()
+        for key in keys:
+            self._data.pop(key, None)
+            self._evicted_at[key] = now
+        if len(self._evicted_at) > self.maxsize:
+            # settle 창이 지난 기록은 더 이상 필요 없음
+            self._evicted_at = {k: t for k, t in self._evicted_at.items() if t > now - self.settle_s}
+
+    def evict_values(self, values: Iterable[Any]) -> None:
+        values = set(values)
+        self.evict([k for k, v in self._data.items() if v in values])
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._evicted_at.clear()
+        self._cleared_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# 분류 트리 응답 캐시 (/classifications/tree, /projects/{code}/classifications/tree|flat 공용)
+tree_cache = VersionedLRUCache(TREE_CACHE_SIZE)
+TREE_CACHE_KINDS = ("tree", "legacy-tree", "legacy-flat")
+
+# 알림으로 무효화되는 조회 캐시
+project_ids_by_code = NotifiedCache(4096, READ_YOUR_WRITES_WINDOW_S)    # project code → id
+tree_versions = NotifiedCache(4096, READ_YOUR_WRITES_WINDOW_S)          # project id → 분류 트리 버전
+dashboard_cache = NotifiedCache(64, READ_YOUR_WRITES_WINDOW_S)          # 대시보드 응답 (전체 프로젝트 대상)
+NOTIFIED_CACHES = (project_ids_by_code, tree_versions, dashboard_cache)
+
+
+def _evict_trees(project_ids) -> None:
+    tree_versions.evict(project_ids)
+    for pid in project_ids:
+        for kind in TREE_CACHE_KINDS:
+            tree_cache.evict((kind, pid))
+
+
+def _on_projects(message: Dict[str, Any]) -> None:
+    project_ids = message.get("project_ids")
+    dashboard_cache.clear()
+    if project_ids is None:
+        project_ids_by_code.clear()
+        tree_versions.clear()
+        tree_cache.clear()
+        return
+    project_ids_by_code.evict_values(project_ids)
+    _evict_trees(project_ids)
+
+
+def _on_classifications(message: Dict[str, Any]) -> None:
+    project_ids = message.get("project_ids")
+    if project_ids is None:
+        tree_versions.clear()
+        tree_cache.clear()
+        return
+    _evict_trees(project_ids)
+
+
+def _on_tasks(message: Dict[str, Any]) -> None:
+    # 대시보드 진행률 (project_progress) 은 tasks 변경으로 바뀜
+    dashboard_cache.clear()
+
+
+def _on_state_change(connected: bool) -> None:
+    # 끊긴 동안의 알림은 유실되므로 연결/단절 시 모두 비우고, 연결된 동안에만 사용
+    for cache in NOTIFIED_CACHES:
+        cache.clear()
+        cache.active = connected
+
+
+def install_invalidation(bus: ChangeBus) -> None:
+    """Subscribe the caches above to the change bus (call once at startup)"""
+    bus.subscribe(PROJECTS_CHANNEL, _on_projects)
+    bus.subscribe(CLASSIFICATIONS_CHANNEL, _on_classifications)
+    bus.subscribe(TASKS_CHANNEL, _on_tasks)
+    bus.on_state_change(_on_state_change)
+
+
+def tree_etag(kind: str, project_id: int, version: int) -> str:
+    return f'"{kind}-{project_id}-v{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (comma separated list, weak validators, '*')"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
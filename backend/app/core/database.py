@@ -1,17 +1,100 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from app.settings import DATABASE_URL
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=False,
-    pool_pre_ping=True,
+from fastapi import HTTPException, Request
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession
+from app.core.metrics import RequestDBStats, instrument_engine, request_db_stats
+from app.core.pool_metrics import PoolMetrics, pool_metrics, read_pool_metrics
+from app.core.read_routing import USER_HEADER, PrimaryStickiness
+from app.core.slow_queries import slow_query_log
+from app.settings import (
+    DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE,
+    DB_STATEMENT_CACHE_SIZE, DB_STATEMENT_TIMEOUT_MS,
+    DATABASE_READ_URL, DB_READ_POOL_SIZE, DB_READ_MAX_OVERFLOW, READ_YOUR_WRITES_WINDOW_S,
 )
 
+
+def _create_engine(url: str, pool_size: int, max_overflow: int, read_only: bool = False) -> AsyncEngine:
+    server_settings = {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+    if read_only:
+        # 복제본이 아닌 같은 DB 를 가리켜도 읽기 세션에서의 쓰기는 오류로 드러나도록
+        server_settings["default_transaction_read_only"] = "on"
+    return create_async_engine(
+        url,
+        echo=False,
+        pool_pre_ping=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        connect_args={
+            # SQLAlchemy asyncpg 어댑터의 prepared statement 캐시 + asyncpg 자체 캐시
+            "prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+            "server_settings": server_settings,
+        },
+    )
+
+
+# 기본(쓰기) DB
+engine = _create_engine(DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW)
+# 읽기 DB (복제본, 미설정 시 같은 DB 의 별도 풀)
+read_engine = _create_engine(DATABASE_READ_URL, DB_READ_POOL_SIZE, DB_READ_MAX_OVERFLOW, read_only=True)
+
+for _engine, _pool_metrics in ((engine, pool_metrics), (read_engine, read_pool_metrics)):
+    _pool_metrics.instrument(_engine)
+    instrument_engine(_engine)
+    slow_query_log.instrument(_engine)
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     expire_on_commit=False,
 )
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    expire_on_commit=False,
+)
+
+primary_stickiness = PrimaryStickiness(READ_YOUR_WRITES_WINDOW_S)
 
-async def get_db() -> AsyncSession:
-    async with AsyncSessionLocal() as session:
+
+@asynccontextmanager
+async def _open_session(sessionmaker: async_sessionmaker, metrics: PoolMetrics) -> AsyncIterator[AsyncSession]:
+    # 요청 단위 쿼리 카운터 (MetricsMiddleware 없이 앱을 구성한 경우에도 집계)
+    if request_db_stats.get() is None:
+        request_db_stats.set(RequestDBStats())
+    async with sessionmaker() as session:
+        # 연결을 먼저 확보하여 풀 대기 시간을 측정 (풀 고갈 시 503)
+        started = time.perf_counter()
+        try:
+            await session.connection()
+        except PoolTimeoutError:
+            metrics.timeouts += 1
+            raise HTTPException(status_code=503, detail="Database connection pool exhausted, retry later")
+        metrics.observe_wait((time.perf_counter() - started) * 1000)
         yield session
+
+
+async def get_write_db(request: Request) -> AsyncIterator[AsyncSession]:
+    """Session on the primary; the caller's reads stick to the primary for a short window"""
+    user_id = request.headers.get(USER_HEADER)
+    primary_stickiness.mark_write(user_id)
+    try:
+        async with _open_session(AsyncSessionLocal, pool_metrics) as session:
+            yield session
+    finally:
+        # 창은 쓰기 완료 시점부터
+        primary_stickiness.mark_write(user_id)
+
+
+async def get_read_db(request: Request) -> AsyncIterator[AsyncSession]:
+    """Read-only session on the replica, or on the primary right after the same X-User-Id wrote"""
+    if primary_stickiness.is_sticky(request.headers.get(USER_HEADER)):
+        sessionmaker, metrics = AsyncSessionLocal, pool_metrics
+    else:
+        sessionmaker, metrics = ReadSessionLocal, read_pool_metrics
+    async with _open_session(sessionmaker, metrics) as session:
+        yield session
+
@@ -0,0 +1,139 @@
+"""
+Project change events (SSE fan-out)
+The 022 triggers write one project_change_log row per changed project and
+statement and NOTIFY it; the worker's single change-bus listener hands every
+notification to ProjectEventHub, which copies it into the bounded queue of each
+subscriber of that project. Subscribers hold no DB connection while idle: they
+only touch the DB to replay missed events (Last-Event-ID, queue overflow or a
+listener reconnect) from project_change_log, which is pruned here after
+CHANGE_LOG_RETENTION_HOURS.
+"""
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Mapping, Optional, Set
+
+from sqlalchemy import text
+
+from app.core.database import AsyncSessionLocal
+from app.core.notify import PROJECT_CHANGES_CHANNEL, ChangeBus
+from app.settings import CHANGE_LOG_RETENTION_HOURS, SSE_QUEUE_SIZE
+
+logger = logging.getLogger(__name__)
+
+EVENT_FIELDS = ("id", "project_id", "entity", "op", "entity_ids", "row_count", "created_at")
+
+
+class Subscription:
+    __slots__ = ("project_id", "queue", "catch_up")
+
+    def __init__(self, project_id: int, maxsize: int):
+        self.project_id = project_id
+        self.queue: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue(maxsize)
+        # True → 큐가 아닌 DB(project_change_log) 에서 이어서 읽어야 함
+        self.catch_up = False
+
+    def wake(self) -> None:
+        try:
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass  # 큐가 차 있으면 이미 깨어 있음
+
+
+class ProjectEventHub:
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subs: Dict[int, Set[Subscription]] = {}
+        self.published = 0
+        self.overflows = 0
+
+    def subscribe(self, project_id: int) -> Subscription:
+        sub = Subscription(project_id, self.queue_size)
+        self._subs.setdefault(project_id, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        subs = self._subs.get(sub.project_id)
+        if subs is not None:
+            subs.discard(sub)
+            if not subs:
+                del self._subs[sub.project_id]
+
+    def publish(self, message: Dict[str, Any]) -> None:
+        """Change-bus handler: fan one change-log notification out to the project's subscribers"""
+        self.published += 1
+        for sub in self._subs.get(message.get("project_id"), ()):
+            if sub.catch_up:
+                continue
+            try:
+                sub.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # 느린 구독자: 이벤트를 버리지 않고 DB 에서 다시 읽도록 전환
+                self.overflows += 1
+                sub.catch_up = True
+
+    def on_state_change(self, connected: bool) -> None:
+        # 리스너가 끊긴 동안의 알림은 유실 → 재연결 시 모든 구독자가 DB 에서 이어서 읽음
+        if not connected:
+            return
+        for subs in self._subs.values():
+            for sub in subs:
+                sub.catch_up = True
+                sub.wake()
+
+    def install(self, bus: ChangeBus) -> None:
+        bus.subscribe(PROJECT_CHANGES_CHANNEL, self.publish)
+        bus.on_state_change(self.on_state_change)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "projects": len(self._subs),
+            "subscribers": sum(len(s) for s in self._subs.values()),
+            "published": self.published,
+            "overflows": self.overflows,
+        }
+
+
+def sse_event(change: Mapping[str, Any]) -> bytes:
+    """One change as an SSE message (event name = entity, id = change id)"""
+    data = {k: change.get(k) for k in EVENT_FIELDS}
+    if isinstance(data["created_at"], datetime):
+        data["created_at"] = data["created_at"].isoformat()
+    return (
+        f"id: {data['id']}\n"
+        f"event: {data['entity']}\n"
+        f"data: {json.dumps(data, ensure_ascii=False, separators=(',', ':'))}\n\n"
+    ).encode("utf-8")
+
+
+def sse_reset(last_id: int) -> bytes:
+    """Events before `last_id` can no longer be replayed: the client should refetch everything"""
+    return f"id: {last_id}\nevent: reset\ndata: {json.dumps({'id': last_id})}\n\n".encode("utf-8")
+
+
+SSE_KEEPALIVE = b": keepalive\n\n"
+
+
+project_event_hub = ProjectEventHub(SSE_QUEUE_SIZE)
+
+PRUNE_CHANGE_LOG_QUERY = text("""
+    DELETE FROM project_change_log
+    WHERE created_at < now() - make_interval(secs => :retention_s)
+""")
+
+
+async def run_change_log_retention(interval_s: float = 3600) -> None:
+    """Background task: delete change-log rows older than the retention window (every `interval_s`)"""
+    while True:
+        try:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(PRUNE_CHANGE_LOG_QUERY, {"retention_s": CHANGE_LOG_RETENTION_HOURS * 3600})
+                await session.commit()
+            if result.rowcount:
+                logger.info("Pruned %d project_change_log rows", result.rowcount)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("project_change_log retention failed", exc_info=True)
+        await asyncio.sleep(interval_s)
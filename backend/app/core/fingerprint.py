@@ -0,0 +1,31 @@
+"""
+SQL statement fingerprints
+Normalises a statement so every execution of the same query shape maps to one
+key: literals and bind parameters become ?, IN lists collapse, whitespace and
+comments are dropped. Results are memoised per statement string, so the hot
+path is a dict lookup for the fixed text() queries used by the routers.
+"""
+import hashlib
+import re
+from functools import lru_cache
+from typing import Tuple
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_BINDS = re.compile(r"\$\d+|(?<![:\w]):\w+|%\(\w+\)s|\?")
+_NUMBERS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LISTS = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.I)
+_SPACES = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> Tuple[str, str]:
+    """(short id, normalised statement)"""
+    normalised = _COMMENTS.sub(" ", statement)
+    normalised = _STRINGS.sub("?", normalised)
+    normalised = _BINDS.sub("?", normalised)
+    normalised = _NUMBERS.sub("?", normalised)
+    normalised = _IN_LISTS.sub("IN (...)", normalised)
+    normalised = _SPACES.sub(" ", normalised).strip()
+    digest = hashlib.sha1(normalised.encode("utf-8")).hexdigest()[:12]
+    return digest, normalised
@@ -0,0 +1,38 @@
+"""
+Per-project transaction advisory locks
+One bigint key per (lock name, project): the name's hashtext in the high 32 bits,
+the project id OR-ed into the low bits. The two-int form would need
+project_id::int, which overflows once BIGSERIAL ids pass 2^31-1; the bigint form
+only risks a harmless collision (extra serialisation) for ids beyond 2^32.
+The DB triggers (022, 023) build the same key, so API and trigger locks match.
+"""
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# 분류 트리의 path/id_path 를 바꾸거나 계산하는 모든 쓰기 (생성, 수정, 이동, 대량 생성)
+CLASSIFICATION_TREE_LOCK = "masterplan.classification_tree"
+# 작업 선후행 관계 추가 (023 트리거와 같은 이름)
+TASK_DEPENDENCIES_LOCK = "masterplan.task_dependencies"
+
+PROJECT_LOCK_QUERY = text("""
+    SELECT pg_advisory_xact_lock((hashtext(:name)::bigint << 32) | CAST(:project_id AS bigint))
+""")
+
+CLASSIFICATION_PROJECT_LOCK_QUERY = text("""
+    SELECT pg_advisory_xact_lock((hashtext(:name)::bigint << 32) | project_id)
+    FROM classifications
+    WHERE id = :classification_id
+""")
+
+
+async def lock_project(db: AsyncSession, name: str, project_id: int) -> None:
+    """Hold `name` for `project_id` until the transaction ends"""
+    await db.execute(PROJECT_LOCK_QUERY, {"name": name, "project_id": project_id})
+
+
+async def lock_classification_tree(db: AsyncSession, classification_id: int) -> None:
+    """Hold the classification tree lock of the classification's project (no-op if it does not exist)"""
+    await db.execute(CLASSIFICATION_PROJECT_LOCK_QUERY, {
+        "name": CLASSIFICATION_TREE_LOCK,
+        "classification_id": classification_id,
+    })
@@ -0,0 +1,165 @@
+"""
+Prometheus metrics (text exposition format 0.0.4, no client library)
+- HTTP: request count / latency per route template, method and status
+- DB: statement count / latency per statement fingerprint (cursor execute events),
+  statements per request (request-scoped counter in a ContextVar)
+Everything runs on the event loop thread, so plain ints/lists are enough; an
+observation is a bisect plus a few increments.
+"""
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.fingerprint import fingerprint
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, labels: Tuple[str, ...] = (), amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in self._values.items():
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels → [bucket counts..., +Inf count, sum, count]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, series in self._series.items():
+            cumulative = 0
+            for le, count in zip(self.buckets + ("+Inf",), series[:-2]):
+                cumulative += count
+                le_label = 'le="+Inf"' if le == "+Inf" else f'le="{le}"'
+                yield f"{self.name}_bucket{_labels(self.labelnames, labels, le_label)} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(series[-2])}"
+            yield f"{self.name}_count{_labels(self.labelnames, labels)} {series[-1]}"
+
+
+class RequestDBStats:
+    """Statements executed while serving one request"""
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+
+# 현재 요청의 DB 통계 (MetricsMiddleware 가 요청마다 설정)
+request_db_stats: ContextVar[Optional[RequestDBStats]] = ContextVar("request_db_stats", default=None)
+
+http_requests = Counter(
+    "masterplan_http_requests_total", "HTTP requests", ("method", "route", "status"),
+)
+http_latency = Histogram(
+    "masterplan_http_request_duration_seconds", "HTTP request latency", ("method", "route", "status"),
+)
+db_statements = Histogram(
+    "masterplan_db_statement_duration_seconds", "DB statement execution time by fingerprint",
+    ("fingerprint",), DB_LATENCY_BUCKETS,
+)
+db_queries_per_request = Histogram(
+    "masterplan_db_queries_per_request", "DB statements executed per HTTP request",
+    ("route",), QUERY_COUNT_BUCKETS,
+)
+# fingerprint → 정규화된 SQL (info metric, 값은 항상 1)
+_statement_info: Dict[str, str] = {}
+
+
+def observe_request(method: str, route: str, status: int, seconds: float, stats: Optional[RequestDBStats]) -> None:
+    labels = (method, route, str(status))
+    http_requests.inc(labels)
+    http_latency.observe(labels, seconds)
+    if stats is not None:
+        db_queries_per_request.observe((route,), stats.queries)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Time every cursor execute by statement fingerprint (call once per engine)"""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["metrics_started"].pop()
+        elapsed = time.perf_counter() - started
+        digest, normalised = fingerprint(statement)
+        if digest not in _statement_info:
+            _statement_info[digest] = normalised
+        db_statements.observe((digest,), elapsed)
+
+        stats = request_db_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.seconds += elapsed
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _on_error(context):
+        # 실패한 문장은 after_cursor_execute 가 호출되지 않으므로 시작 시각만 정리
+        started = context.connection.info.get("metrics_started") if context.connection is not None else None
+        if started:
+            started.pop()
+
+
+def render(extra: Iterable[str] = ()) -> str:
+    lines: List[str] = []
+    for metric in (http_requests, http_latency, db_statements, db_queries_per_request):
+        lines.extend(metric.render())
+    lines.append("# HELP masterplan_db_statement_info Normalised SQL of each statement fingerprint")
+    lines.append("# TYPE masterplan_db_statement_info gauge")
+    for digest, normalised in _statement_info.items():
+        lines.append(f"masterplan_db_statement_info{_labels(('fingerprint', 'statement'), (digest, normalised))} 1")
+    lines.extend(extra)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,96 @@
+"""
+ASGI middlewares
+Pure ASGI (no BaseHTTPMiddleware): responses pass through without an extra
+task per request or body re-wrapping, and streaming responses stay streaming.
+"""
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import RequestDBStats, observe_request, request_db_stats
+from app.core.query_budget import BUDGET_HEADER, QUERIES_HEADER, TIME_HEADER, check_budget
+from app.settings import DEV_MODE
+
+JSON_UTF8 = b"application/json; charset=utf-8"
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class ForceJSONUTF8Middleware:
+    """Add charset=utf-8 to application/json responses that do not declare a charset"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                for i, (name, value) in enumerate(headers):
+                    if name.lower() == b"content-type":
+                        if value.startswith(b"application/json") and b"charset" not in value:
+                            headers[i] = (name, JSON_UTF8)
+                            message = {**message, "headers": headers}
+                        break
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class MetricsMiddleware:
+    """
+    Request count / latency per route template and status, plus DB statements per request
+    The route template comes from the matched route (scope["route"]) after the app ran,
+    so /tasks/1 and /tasks/2 share one series; unmatched paths are grouped together.
+    With `dev_mode` the statement count / DB time so far and the route's @query_budget
+    are added as response headers, and budget overruns are logged.
+    """
+
+    def __init__(self, app: ASGIApp, dev_mode: bool = DEV_MODE):
+        self.app = app
+        self.dev_mode = dev_mode
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestDBStats()
+        token = request_db_stats.set(stats)
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.dev_mode:
+                    message = {**message, "headers": self._dev_headers(message, scope.get("route"), stats)}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_db_stats.reset(token)
+            route = scope.get("route")
+            observe_request(
+                scope["method"],
+                getattr(route, "path", None) or UNMATCHED_ROUTE,
+                status,
+                time.perf_counter() - started,
+                stats,
+            )
+
+    @staticmethod
+    def _dev_headers(message: Message, route, stats: RequestDBStats) -> list:
+        # 스트리밍 응답은 헤더 전송 시점까지의 값
+        headers = list(message.get("headers", []))
+        headers.append((QUERIES_HEADER.lower().encode(), str(stats.queries).encode()))
+        headers.append((TIME_HEADER.lower().encode(), f"{stats.seconds * 1000:.2f}".encode()))
+        budget = check_budget(route, stats)
+        if budget is not None:
+            headers.append((BUDGET_HEADER.lower().encode(), str(budget).encode()))
+        return headers
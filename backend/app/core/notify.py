@@ -0,0 +1,151 @@
+"""
+Change notification bus (Postgres LISTEN/NOTIFY)
+Each worker keeps one dedicated asyncpg connection to the primary that LISTENs
+on the change channels fed by the 021/022 triggers, and dispatches every payload
+to the subscribed handlers (cache eviction, SSE fan-out). A dropped connection is detected via
+the termination callback or a periodic ping and re-established with exponential
+backoff; state handlers are told about every connect/disconnect, because
+notifications sent while disconnected are lost.
+"""
+import asyncio
+import json
+import logging
+import random
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import asyncpg
+
+from app.settings import CHANGE_BUS_PING_S, CHANGE_BUS_RECONNECT_MAX_S, DATABASE_URL
+
+logger = logging.getLogger(__name__)
+
+PROJECTS_CHANNEL = "masterplan_projects"
+CLASSIFICATIONS_CHANNEL = "masterplan_classifications"
+TASKS_CHANNEL = "masterplan_tasks"
+PROJECT_CHANGES_CHANNEL = "masterplan_project_changes"  # 022 변경 로그 (SSE 이벤트)
+CHANNELS = (PROJECTS_CHANNEL, CLASSIFICATIONS_CHANNEL, TASKS_CHANNEL, PROJECT_CHANGES_CHANNEL)
+
+Handler = Callable[[Dict[str, Any]], None]
+StateHandler = Callable[[bool], None]
+
+
+class ChangeBus:
+    def __init__(
+        self,
+        dsn: str,
+        channels=CHANNELS,
+        reconnect_min_s: float = 0.5,
+        reconnect_max_s: float = 30.0,
+        ping_interval_s: float = 30.0,
+    ):
+        self.dsn = dsn
+        self.reconnect_min_s = reconnect_min_s
+        self.reconnect_max_s = reconnect_max_s
+        self.ping_interval_s = ping_interval_s
+        self._handlers: Dict[str, List[Handler]] = {c: [] for c in channels}
+        self._state_handlers: List[StateHandler] = []
+        self._task: Optional[asyncio.Task] = None
+        self.connected = False
+        self.connects = 0
+        self.received: Dict[str, int] = {c: 0 for c in channels}
+        self.last_error: Optional[str] = None
+        self.last_notification_at: Optional[str] = None
+
+    def subscribe(self, channel: str, handler: Handler) -> None:
+        self._handlers[channel].append(handler)
+
+    def on_state_change(self, handler: StateHandler) -> None:
+        self._state_handlers.append(handler)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="change-bus")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        delay = self.reconnect_min_s
+        while True:
+            conn: Optional[asyncpg.Connection] = None
+            lost = asyncio.Event()
+            try:
+                conn = await asyncpg.connect(self.dsn, timeout=10)
+                conn.add_termination_listener(lambda _conn: lost.set())
+                for channel in self._handlers:
+                    await conn.add_listener(channel, self._dispatch)
+                self.connects += 1
+                self._set_connected(True)
+                delay = self.reconnect_min_s
+                while not lost.is_set():
+                    try:
+                        await asyncio.wait_for(lost.wait(), self.ping_interval_s)
+                    except asyncio.TimeoutError:
+                        # 조용히 끊긴 TCP 연결 감지
+                        await conn.execute("SELECT 1", timeout=self.ping_interval_s)
+                self.last_error = "listener connection closed"
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.last_error = f"{type(exc).__name__}: {exc}"
+            finally:
+                self._set_connected(False)
+                if conn is not None and not conn.is_closed():
+                    conn.terminate()
+
+            logger.warning("Change bus disconnected (%s), reconnecting in %.1fs", self.last_error, delay)
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(delay * 2, self.reconnect_max_s)
+
+    def _set_connected(self, connected: bool) -> None:
+        if connected == self.connected:
+            return
+        self.connected = connected
+        for handler in self._state_handlers:
+            try:
+                handler(connected)
+            except Exception:
+                logger.exception("Change bus state handler failed")
+
+    def _dispatch(self, _conn, _pid: int, channel: str, payload: str) -> None:
+        self.received[channel] = self.received.get(channel, 0) + 1
+        self.last_notification_at = datetime.now(timezone.utc).isoformat()
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            # 형식을 알 수 없으면 전체 무효화로 처리
+            message = {"op": None, "project_ids": None}
+        for handler in self._handlers.get(channel, ()):
+            try:
+                handler(message)
+            except Exception:
+                logger.exception("Change bus handler failed for %s", channel)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "enabled": self._task is not None,
+            "connected": self.connected,
+            "connects": self.connects,
+            "received": dict(self.received),
+            "last_notification_at": self.last_notification_at,
+            "last_error": self.last_error,
+        }
+
+
+def listener_dsn() -> str:
+    # NOTIFY 는 기본(쓰기) DB 에서만 발생하므로 복제본이 아닌 기본 DB 에 연결
+    return DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+change_bus = ChangeBus(
+    listener_dsn(),
+    reconnect_max_s=CHANGE_BUS_RECONNECT_MAX_S,
+    ping_interval_s=CHANGE_BUS_PING_S,
+)
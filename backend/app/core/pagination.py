@@ -0,0 +1,129 @@
+"""
+Keyset (cursor) pagination helpers
+The cursor is an opaque, URL-safe token holding the sort spec and the sort-key
+values of the last row of the previous page; `id` is always appended as the
+tie-breaker so the ordering is total and pages never repeat or skip rows.
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+
+SortKeys = List[Tuple[str, str]]
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def sort_keys(sort: str, tiebreaker: str = "id") -> SortKeys:
+    """
+    Parse an already-validated sort string ("col dir" or "col dir, col dir")
+    and append the tie-breaker column (same direction as the first key)
+    """
+    keys: SortKeys = []
+    for part in sort.split(","):
+        col, direction = part.split()
+        keys.append((col, direction))
+    if all(col != tiebreaker for col, _ in keys):
+        keys.append((tiebreaker, keys[0][1]))
+    return keys
+
+
+def order_by_clause(keys: SortKeys, prefix: str = "") -> str:
+    """ORDER BY body for the sort keys (NULLS placement follows PostgreSQL defaults)"""
+    return ", ".join(f"{prefix}{col} {direction}" for col, direction in keys)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "$dt" in value:
+            return datetime.fromisoformat(value["$dt"])
+        if "$d" in value:
+            return date.fromisoformat(value["$d"])
+    return value
+
+
+def encode_cursor(keys: SortKeys, row: Mapping[str, Any]) -> str:
+    """Build the cursor pointing just after `row`"""
+    payload = {
+        "s": order_by_clause(keys),
+        "v": [_encode_value(row[col]) for col, _ in keys],
+    }
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: SortKeys) -> List[Any]:
+    """Decode a cursor; it must have been issued for the same sort order"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = [_decode_value(v) for v in payload["v"]]
+        sort = payload["s"]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if sort != order_by_clause(keys) or len(values) != len(keys):
+        raise HTTPException(status_code=400, detail="Cursor does not match the requested sort order")
+    return values
+
+
+def keyset_condition(
+    keys: SortKeys,
+    values: Sequence[Any],
+    nullable: Iterable[str] = (),
+    prefix: str = "",
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    WHERE condition selecting rows strictly after `values` in `keys` order
+
+    Uniform direction over NOT NULL columns uses a row-value comparison,
+    e.g. (t.updated_at, t.id) < (:_k0, :_k1), which PostgreSQL answers with a
+    single index seek. Mixed directions or nullable columns fall back to the
+    expanded OR form, honouring PostgreSQL's NULLS LAST (asc) / NULLS FIRST (desc).
+    """
+    nullable = set(nullable)
+    params = {f"_k{i}": v for i, v in enumerate(values)}
+    directions = {direction for _, direction in keys}
+
+    if len(directions) == 1 and not any(col in nullable for col, _ in keys):
+        op = ">" if directions == {"asc"} else "<"
+        cols = ", ".join(f"{prefix}{col}" for col, _ in keys)
+        binds = ", ".join(f":_k{i}" for i in range(len(keys)))
+        return f"({cols}) {op} ({binds})", params
+
+    alternatives: List[str] = []
+    equal_so_far: List[str] = []
+    for i, (col, direction) in enumerate(keys):
+        column = f"{prefix}{col}"
+        value = values[i]
+        bind = f":_k{i}"
+
+        if value is None:
+            # asc: NULL 이 마지막 → 이후 값 없음 / desc: NULL 이 처음 → NOT NULL 은 모두 이후
+            after: Optional[str] = None if direction == "asc" else f"{column} IS NOT NULL"
+            same = f"{column} IS NULL"
+            params.pop(f"_k{i}")
+        else:
+            op = ">" if direction == "asc" else "<"
+            after = f"{column} {op} {bind}"
+            if direction == "asc" and col in nullable:
+                after = f"({after} OR {column} IS NULL)"
+            same = f"{column} = {bind}"
+
+        if after is not None:
+            alternatives.append("(" + " AND ".join(equal_so_far + [after]) + ")")
+        equal_so_far.append(same)
+
+    if not alternatives:
+        return "FALSE", params
+    return "(" + " OR ".join(alternatives) + ")", params
@@ -0,0 +1,89 @@
+"""
+Connection pool metrics
+Counters fed by get_read_db / get_write_db (checkout wait time / timeouts) and by engine events
+(new connections, invalidations, failed pre-pings); snapshot() adds the
+pool's live checked-out / idle / overflow numbers for /internal/pool.
+"""
+from bisect import bisect_left
+from typing import Any, Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# 연결 대기 시간 히스토그램 경계(ms)
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolMetrics:
+    def __init__(self, buckets_ms=WAIT_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self.reset()
+
+    def reset(self) -> None:
+        self._wait_counts: List[int] = [0] * (len(self.buckets_ms) + 1)  # 마지막 칸: +Inf
+        self.wait_count = 0
+        self.wait_sum_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.pre_ping_failures = 0
+
+    def observe_wait(self, wait_ms: float) -> None:
+        self._wait_counts[bisect_left(self.buckets_ms, wait_ms)] += 1
+        self.wait_count += 1
+        self.wait_sum_ms += wait_ms
+        self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+
+    def wait_histogram(self) -> Dict[str, Any]:
+        """Cumulative buckets (Prometheus style: count of waits <= le)"""
+        buckets = []
+        cumulative = 0
+        for le, count in zip(list(self.buckets_ms) + ["+Inf"], self._wait_counts):
+            cumulative += count
+            buckets.append({"le": le, "count": cumulative})
+        return {
+            "buckets": buckets,
+            "count": self.wait_count,
+            "sum_ms": round(self.wait_sum_ms, 3),
+            "max_ms": round(self.wait_max_ms, 3),
+        }
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        """Register engine / pool event listeners (call once per engine)"""
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            self.connects += 1
+
+        @event.listens_for(sync_engine, "invalidate")
+        def _on_invalidate(dbapi_connection, connection_record, exception):
+            self.invalidations += 1
+
+        @event.listens_for(sync_engine, "handle_error")
+        def _on_error(context):
+            # pool_pre_ping 실패 → 연결 폐기 후 재연결 (요청은 실패하지 않음)
+            if context.is_pre_ping:
+                self.pre_ping_failures += 1
+
+    def snapshot(self, engine: AsyncEngine) -> Dict[str, Any]:
+        pool = engine.pool
+        checked_out = pool.checkedout()
+        return {
+            "size": pool.size(),
+            "checked_out": checked_out,
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "timeout_s": pool.timeout(),
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "pre_ping_failures": self.pre_ping_failures,
+            "checkout_timeouts": self.timeouts,
+            "checkout_wait_ms": self.wait_histogram(),
+        }
+
+
+# 기본(쓰기) 풀 / 읽기 풀
+pool_metrics = PoolMetrics()
+read_pool_metrics = PoolMetrics()
@@ -0,0 +1,64 @@
+"""
+SQL query registry
+Loads every db/sql/queries/*.sql file once at startup and keeps one compiled
+text() per file, so request handlers skip the disk read and SQL parsing; the
+identical statement string also keeps hitting SQLAlchemy's compiled cache and
+asyncpg's per-connection prepared-statement cache.
+"""
+from pathlib import Path
+from typing import Dict, Iterable, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+
+from app.settings import SQL_HOT_RELOAD, SQL_QUERIES_DIR
+
+
+class QueryRegistry:
+    """Named SQL files (file stem → text()); optional mtime-based reload for development"""
+
+    def __init__(self, directory: Path, hot_reload: bool = False):
+        self.directory = directory
+        self.hot_reload = hot_reload
+        self._required: Set[str] = set()
+        self._queries: Dict[str, Tuple[float, TextClause]] = {}
+
+    def require(self, *names: str) -> None:
+        """Declare queries a module depends on; load() fails if any file is missing"""
+        self._required.update(names)
+
+    def _read(self, path: Path) -> Tuple[float, TextClause]:
+        return path.stat().st_mtime, text(path.read_text(encoding="utf-8"))
+
+    def load(self) -> None:
+        """(Re)load the whole directory; raises RuntimeError on a missing directory or required file"""
+        if not self.directory.is_dir():
+            raise RuntimeError(f"SQL query directory not found: {self.directory}")
+
+        queries = {path.stem: self._read(path) for path in sorted(self.directory.glob("*.sql"))}
+        missing = sorted(self._required - queries.keys())
+        if missing:
+            raise RuntimeError(
+                f"Missing SQL query files in {self.directory}: " + ", ".join(f"{name}.sql" for name in missing)
+            )
+        self._queries = queries
+
+    def names(self) -> Iterable[str]:
+        return self._queries.keys()
+
+    def get(self, name: str) -> TextClause:
+        entry = self._queries.get(name)
+        if entry is None:
+            raise RuntimeError(f"SQL query '{name}' is not loaded (call load() at startup / add {name}.sql)")
+
+        if self.hot_reload:
+            # 개발 모드: 파일이 바뀌었으면 다시 읽음 (요청당 stat 1회)
+            path = self.directory / f"{name}.sql"
+            if path.stat().st_mtime != entry[0]:
+                entry = self._read(path)
+                self._queries[name] = entry
+
+        return entry[1]
+
+
+queries = QueryRegistry(SQL_QUERIES_DIR, hot_reload=SQL_HOT_RELOAD)
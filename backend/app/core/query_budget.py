@@ -0,0 +1,120 @@
+"""
+Per-route DB query budgets (N+1 / extra round-trip guard)
+Routes declare the most statements they may execute with @query_budget(n).
+The request-scoped counter (app.core.metrics.request_db_stats, bound by
+MetricsMiddleware and the DB session dependencies) is compared against it after each request; in
+DEV_MODE the counts are returned as X-DB-Queries / X-DB-Time-ms /
+X-DB-Query-Budget headers and overruns are logged.
+
+Tests can assert the budget on any response (DEV_MODE=true) or around direct calls:
+
+    response = client.get("/tasks?project_id=1")
+    assert_query_budget(response)
+
+    with count_queries() as stats:
+        await some_service(db)
+    assert stats.queries <= 2
+
+unbudgeted_routes() lists DB-backed routes without a budget (checked by
+tests/test_query_budgets.py, so a new endpoint cannot skip the guard).
+"""
+import logging
+from contextlib import contextmanager
+from typing import Any, Callable, Collection, Iterable, Iterator, List, Mapping, Optional, TypeVar
+
+from fastapi.routing import APIRoute
+
+from app.core.metrics import RequestDBStats, request_db_stats
+
+logger = logging.getLogger(__name__)
+
+QUERIES_HEADER = "X-DB-Queries"
+TIME_HEADER = "X-DB-Time-ms"
+BUDGET_HEADER = "X-DB-Query-Budget"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def query_budget(max_queries: int) -> Callable[[F], F]:
+    """Declare the maximum number of DB statements an endpoint may execute per request"""
+    def decorate(endpoint: F) -> F:
+        endpoint.__query_budget__ = max_queries
+        return endpoint
+    return decorate
+
+
+def budget_of(route: Any) -> Optional[int]:
+    """Budget declared on a matched route's endpoint (None if undeclared)"""
+    return getattr(getattr(route, "endpoint", None), "__query_budget__", None)
+
+
+def check_budget(route: Any, stats: RequestDBStats) -> Optional[int]:
+    """Log and return the budget when `stats` exceeds it"""
+    budget = budget_of(route)
+    if budget is not None and stats.queries > budget:
+        logger.warning(
+            "Query budget exceeded on %s: %d statements (budget %d)",
+            getattr(route, "path", route), stats.queries, budget,
+        )
+    return budget
+
+
+def iter_api_routes(routes: Iterable[Any]) -> Iterator[APIRoute]:
+    """Every APIRoute, descending into included routers"""
+    for route in routes:
+        if isinstance(route, APIRoute):
+            yield route
+            continue
+        nested = getattr(route, "original_router", None) or getattr(route, "router", None)
+        if nested is not None:
+            yield from iter_api_routes(nested.routes)
+
+
+def _calls(dependant: Any) -> Iterator[Callable[..., Any]]:
+    for sub in dependant.dependencies:
+        yield sub.call
+        yield from _calls(sub)
+
+
+def unbudgeted_routes(routes: Iterable[Any], db_dependencies: Collection[Callable[..., Any]]) -> List[str]:
+    """"METHOD /path" of routes that depend on a DB session but declare no @query_budget"""
+    missing = []
+    for route in iter_api_routes(routes):
+        if budget_of(route) is None and any(call in db_dependencies for call in _calls(route.dependant)):
+            for method in sorted(route.methods):
+                missing.append(f"{method} {route.path}")
+    return missing
+
+
+@contextmanager
+def count_queries() -> Iterator[RequestDBStats]:
+    """Count statements executed inside the block (outside of a request, e.g. in tests)"""
+    stats = RequestDBStats()
+    token = request_db_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        request_db_stats.reset(token)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def assert_query_budget(response: Any, max_queries: Optional[int] = None) -> int:
+    """
+    Fail when a response used more statements than its route's budget (or `max_queries`)
+    Needs the DEV_MODE headers; returns the statement count.
+    """
+    headers: Mapping[str, str] = response.headers
+    if QUERIES_HEADER not in headers:
+        raise QueryBudgetExceeded(f"{QUERIES_HEADER} header missing (run the app with DEV_MODE=true)")
+    queries = int(headers[QUERIES_HEADER])
+    budget = max_queries if max_queries is not None else (
+        int(headers[BUDGET_HEADER]) if BUDGET_HEADER in headers else None
+    )
+    if budget is None:
+        raise QueryBudgetExceeded("route declares no @query_budget and no max_queries was given")
+    if queries > budget:
+        raise QueryBudgetExceeded(f"{queries} DB statements executed, budget is {budget}")
+    return queries
@@ -0,0 +1,49 @@
+"""
+Read-your-writes routing
+After a client (X-User-Id) goes through a write session, its reads stay on the
+primary for a short window, so it never reads its own change back from a
+lagging replica. State is per process; with several workers a client's write
+and read may land on different processes, so keep the window above the
+replica lag you actually observe rather than relying on it exactly.
+"""
+import time
+from typing import Dict, Optional
+
+USER_HEADER = "x-user-id"
+
+
+class PrimaryStickiness:
+    def __init__(self, window_s: float, max_entries: int = 10000):
+        self.window_s = window_s
+        self.max_entries = max_entries
+        self._until: Dict[str, float] = {}  # user id → 만료 시각 (monotonic)
+
+    def mark_write(self, user_id: Optional[str]) -> None:
+        if not user_id or self.window_s <= 0:
+            return
+        now = time.monotonic()
+        if len(self._until) >= self.max_entries:
+            self.prune(now)
+        self._until[user_id] = now + self.window_s
+
+    def is_sticky(self, user_id: Optional[str]) -> bool:
+        if not user_id:
+            return False
+        until = self._until.get(user_id)
+        if until is None:
+            return False
+        if until <= time.monotonic():
+            del self._until[user_id]
+            return False
+        return True
+
+    def prune(self, now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        self._until = {k: v for k, v in self._until.items() if v > now}
+        # 모두 유효한 경우에도 상한 유지 (가장 먼저 만료될 항목부터 제거)
+        if len(self._until) >= self.max_entries:
+            keep = sorted(self._until.items(), key=lambda kv: kv[1])[len(self._until) - self.max_entries + 1:]
+            self._until = dict(keep)
+
+    def __len__(self) -> int:
+        return len(self._until)
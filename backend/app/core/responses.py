@@ -0,0 +1,58 @@
+"""
+orjson fast path for list responses
+Serialises DB rows (RowMapping) straight to JSON in the field order of the
+response model, skipping the per-row Model(**row) construction and FastAPI's
+second validation/serialisation pass. Output is byte-identical to the Pydantic
+path for these flat models (OPT_UTC_Z renders UTC datetimes as ...Z like Pydantic).
+Endpoints keep `response_model=`, so the OpenAPI schema does not change.
+"""
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Type
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+JSON_MEDIA_TYPE = "application/json; charset=utf-8"
+
+_fields_cache: Dict[Type[BaseModel], Tuple[Tuple[str, Any], ...]] = {}
+
+
+def _model_fields(model: Type[BaseModel]) -> Tuple[Tuple[str, Any], ...]:
+    """(field name, default for columns the query does not select) in declaration order"""
+    fields = _fields_cache.get(model)
+    if fields is None:
+        fields = tuple(
+            (name, None if info.is_required() else info.get_default(call_default_factory=True))
+            for name, info in model.model_fields.items()
+        )
+        _fields_cache[model] = fields
+    return fields
+
+
+def dump_rows(rows: Iterable[Mapping[str, Any]], model: Type[BaseModel]) -> bytes:
+    fields = _model_fields(model)
+    return orjson.dumps(
+        [{name: row.get(name, default) for name, default in fields} for row in rows],
+        option=orjson.OPT_UTC_Z,
+    )
+
+
+def rows_response(
+    rows: Iterable[Mapping[str, Any]],
+    model: Type[BaseModel],
+    response: Optional[Response] = None,
+) -> Response:
+    """
+    JSON array response for `rows` shaped like List[model]
+    Headers already set on the injected `response` (e.g. X-Next-Cursor) are carried over,
+    since FastAPI does not merge them into a returned Response.
+    """
+    headers = None
+    if response is not None:
+        headers = {k: v for k, v in response.headers.items() if k not in ("content-length", "content-type")}
+    return Response(content=dump_rows(rows, model), media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+def json_response(content: Any) -> Response:
+    """JSON response for an already-shaped dict/list (dates, datetimes rendered like Pydantic)"""
+    return Response(content=orjson.dumps(content, option=orjson.OPT_UTC_Z), media_type=JSON_MEDIA_TYPE)
@@ -0,0 +1,208 @@
+"""
+Slow-query log
+Statements slower than SLOW_QUERY_MS are recorded (fingerprint, redacted binds,
+duration) in a ring buffer, aggregated per fingerprint and optionally appended
+to a JSONL file. A sampled share of slow read-only statements is re-run in the
+background as EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) on a separate pooled
+connection of the engine it ran on (primary or read replica), inside a
+transaction that is always rolled back. The EXPLAIN goes through the raw
+asyncpg connection, so it never re-enters these event hooks.
+"""
+import asyncio
+import json
+import logging
+import random
+import re
+import time
+from collections import deque
+from datetime import date, datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.fingerprint import fingerprint
+from app.settings import (
+    SLOW_QUERY_BUFFER_SIZE, SLOW_QUERY_EXPLAIN_SAMPLE, SLOW_QUERY_EXPLAIN_TIMEOUT_MS,
+    SLOW_QUERY_LOG_FILE, SLOW_QUERY_MS,
+)
+
+logger = logging.getLogger(__name__)
+
+# EXPLAIN ANALYZE 는 문장을 실제로 실행하므로 읽기 전용 문장만 대상
+_READ_ONLY = re.compile(r"^\s*(SELECT|WITH)\b", re.I)
+_WRITES = re.compile(r"\b(INSERT|UPDATE|DELETE|MERGE|COPY|CALL|NEXTVAL|SETVAL|SET_CONFIG)\b|\bFOR\s+(UPDATE|SHARE)\b", re.I)
+
+
+def redact(value: Any) -> Any:
+    """Keep the shape of bind values, not their content (numbers/bools/dates are kept)"""
+    if value is None or isinstance(value, (bool, int, float, date)):
+        return value
+    if isinstance(value, str):
+        return f"<str:{len(value)}>"
+    if isinstance(value, (list, tuple)):
+        return f"<{type(value).__name__}:{len(value)}>"
+    if isinstance(value, dict):
+        return {k: redact(v) for k, v in value.items()}
+    return f"<{type(value).__name__}>"
+
+
+def redact_params(parameters: Any) -> Any:
+    if isinstance(parameters, dict):
+        return {k: redact(v) for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact(v) for v in parameters]
+    return redact(parameters)
+
+
+def is_explainable(statement: str) -> bool:
+    return bool(_READ_ONLY.match(statement)) and not _WRITES.search(statement)
+
+
+class SlowQueryLog:
+    def __init__(
+        self,
+        threshold_ms: float,
+        explain_sample: float,
+        buffer_size: int,
+        log_file: Optional[str] = None,
+        explain_timeout_ms: int = 10000,
+    ):
+        self.threshold_ms = threshold_ms
+        self.explain_sample = explain_sample
+        self.explain_timeout_ms = explain_timeout_ms
+        self.log_file = log_file
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
+        self.by_fingerprint: Dict[str, Dict[str, Any]] = {}
+        self._explaining = False
+        self._tasks: set = set()
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        """Register cursor execute hooks (call once per engine)"""
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _before(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("slowlog_started", []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def _after(conn, cursor, statement, parameters, context, executemany):
+            elapsed_ms = (time.perf_counter() - conn.info["slowlog_started"].pop()) * 1000
+            if elapsed_ms >= self.threshold_ms:
+                self.record(statement, parameters, elapsed_ms, executemany, engine)
+
+        @event.listens_for(sync_engine, "handle_error")
+        def _on_error(context):
+            started = context.connection.info.get("slowlog_started") if context.connection is not None else None
+            if started:
+                started.pop()
+
+    def record(
+        self, statement: str, parameters: Any, duration_ms: float, executemany: bool = False,
+        engine: Optional[AsyncEngine] = None,
+    ) -> None:
+        digest, normalised = fingerprint(statement)
+        entry = {
+            "at": datetime.now(timezone.utc).isoformat(),
+            "fingerprint": digest,
+            "statement": normalised,
+            "duration_ms": round(duration_ms, 3),
+            "params": None if executemany else redact_params(parameters),
+            "plan": None,
+        }
+        self.recent.append(entry)
+
+        stats = self.by_fingerprint.get(digest)
+        if stats is None:
+            stats = self.by_fingerprint[digest] = {
+                "fingerprint": digest,
+                "statement": normalised,
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "last_at": None,
+                "last_params": None,
+                "plan": None,
+                "plan_at": None,
+            }
+        stats["count"] += 1
+        stats["total_ms"] += duration_ms
+        stats["max_ms"] = max(stats["max_ms"], duration_ms)
+        stats["last_at"] = entry["at"]
+        stats["last_params"] = entry["params"]
+
+        if engine is not None and self._should_explain(statement, executemany):
+            self._schedule_explain(engine, entry, stats, statement, parameters)
+        else:
+            self._write(entry)
+
+    def _should_explain(self, statement: str, executemany: bool) -> bool:
+        return (
+            not executemany
+            and not self._explaining  # 동시에 1건만 (풀 연결 1개 이상 점유하지 않음)
+            and random.random() < self.explain_sample
+            and is_explainable(statement)
+        )
+
+    def _schedule_explain(self, engine: AsyncEngine, entry: Dict[str, Any], stats: Dict[str, Any], statement: str, parameters: Any) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write(entry)
+            return
+        self._explaining = True
+        params = list(parameters) if isinstance(parameters, (list, tuple)) else []
+        task = loop.create_task(self._explain(engine, entry, stats, statement, params))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _explain(self, engine: AsyncEngine, entry: Dict[str, Any], stats: Dict[str, Any], statement: str, params: List[Any]) -> None:
+        try:
+            async with engine.connect() as conn:
+                raw = await conn.get_raw_connection()
+                driver = raw.driver_connection
+                tr = driver.transaction()
+                await tr.start()
+                try:
+                    await driver.execute(f"SET LOCAL statement_timeout = {int(self.explain_timeout_ms)}")
+                    plan = await driver.fetchval(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", *params)
+                finally:
+                    await tr.rollback()
+            entry["plan"] = json.loads(plan) if isinstance(plan, str) else plan
+            stats["plan"] = entry["plan"]
+            stats["plan_at"] = entry["at"]
+        except Exception:
+            logger.warning("EXPLAIN capture failed for slow query %s", entry["fingerprint"], exc_info=True)
+        finally:
+            self._explaining = False
+            self._write(entry)
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        if not self.log_file:
+            return
+        try:
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+        except OSError:
+            logger.warning("Cannot write slow query log %s", self.log_file, exc_info=True)
+
+    def top(self, limit: int = 20, order: str = "total_ms") -> List[Dict[str, Any]]:
+        ranked = sorted(self.by_fingerprint.values(), key=lambda s: s[order], reverse=True)[:limit]
+        return [
+            {**s, "total_ms": round(s["total_ms"], 3), "max_ms": round(s["max_ms"], 3),
+             "avg_ms": round(s["total_ms"] / s["count"], 3)}
+            for s in ranked
+        ]
+
+    def clear(self) -> None:
+        self.recent.clear()
+        self.by_fingerprint.clear()
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=SLOW_QUERY_MS,
+    explain_sample=SLOW_QUERY_EXPLAIN_SAMPLE,
+    buffer_size=SLOW_QUERY_BUFFER_SIZE,
+    log_file=SLOW_QUERY_LOG_FILE or None,
+    explain_timeout_ms=SLOW_QUERY_EXPLAIN_TIMEOUT_MS,
+)
@@ -1,9 +1,37 @@
-from fastapi import FastAPI, Request
-from fastapi.responses import Response
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import projects, categories, schedules, dashboard, projects_new, tasks, classifications
+from app.core.cache import install_invalidation
+from app.core.database import engine, read_engine
+from app.core.events import project_event_hub, run_change_log_retention
+from app.core.middleware import ForceJSONUTF8Middleware, MetricsMiddleware
+from app.core.notify import change_bus
+from app.core.queries import queries
+from app.settings import CHANGE_BUS_ENABLED
+from app.routers import projects, categories, schedules, dashboard, projects_new, tasks, classifications, project_tasks, project_events, task_dependencies, departments, internal, metrics
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # SQL 파일은 기동 시 1회 로드 (누락 시 기동 실패)
+    queries.load()
+    # 변경 알림 수신 (LISTEN/NOTIFY) → 인프로세스 캐시 무효화 / SSE 이벤트 전달; 연결 실패 시 백그라운드에서 재시도
+    if CHANGE_BUS_ENABLED:
+        install_invalidation(change_bus)
+        project_event_hub.install(change_bus)
+        await change_bus.start()
+    # 022 트리거는 버스 설정과 무관하게 project_change_log 에 기록하므로 보존 정리는 항상 실행
+    retention = asyncio.create_task(run_change_log_retention(), name="change-log-retention")
+    yield
+    retention.cancel()
+    await change_bus.stop()
+    await engine.dispose()
+    await read_engine.dispose()
 
-app = FastAPI(title="MasterPlan API", version="0.1.0")
+
+app = FastAPI(title="MasterPlan API", version="0.1.0", lifespan=lifespan)
 
 # CORS 설정
 app.add_middleware(
@@ -12,15 +40,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-DB-Queries", "X-DB-Time-ms", "X-DB-Query-Budget"],
 )
 
-@app.middleware("http")
-async def force_json_utf8(request: Request, call_next):
-    resp: Response = await call_next(request)
-    ct = resp.headers.get("content-type", "")
-    if ct.startswith("application/json") and "charset" not in ct:
-        resp.headers["content-type"] = "application/json; charset=utf-8"
-    return resp
+# application/json → charset=utf-8 명시 (pure ASGI)
+app.add_middleware(ForceJSONUTF8Middleware)
+
+# 요청 수/지연시간, 요청당 DB 쿼리 수 (/metrics) — 가장 바깥에서 측정
+app.add_middleware(MetricsMiddleware)
 
 # Health check
 @app.get("/health")
@@ -31,9 +58,17 @@ async def health():
 app.include_router(projects.router)  # Projects CRUD API (id 기반)
 app.include_router(tasks.router)
 app.include_router(classifications.router)
+app.include_router(project_tasks.router)  # 프로젝트 단위 task 대량 처리 (bulk import)
+app.include_router(project_events.router)  # 프로젝트 변경 이벤트 (SSE)
+app.include_router(task_dependencies.router)  # 작업 선후행 관계 + critical path (CPM)
+app.include_router(departments.router)  # 부서별 작업 부하 (전체 프로젝트)
 
 # 기존 라우터 (프로젝트별 API) - 하위 호환성 유지
 app.include_router(projects_new.router)  # 프로젝트 코드 기반 API (프론트엔드 호환)
 app.include_router(categories.router)
 app.include_router(schedules.router)
 app.include_router(dashboard.router)
+
+# 운영 진단 API (/internal/*, /metrics)
+app.include_router(internal.router)
+app.include_router(metrics.router)
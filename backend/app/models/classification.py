@@ -2,9 +2,9 @@
 Classification Pydantic Models
 Based on actual schema: classifications table
 """
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class ClassificationCreate(BaseModel):
@@ -64,8 +64,18 @@ class ClassificationOut(BaseModel):
         from_attributes = True
 
 
+class ClassificationProgress(BaseModel):
+    """Task progress of a node including its whole subtree"""
+    closed: int = Field(..., description="Tasks with status 'closed'")
+    total: int
+    percent: Optional[float] = Field(None, description="closed / total * 100 (1 decimal), null without tasks")
+    earliest_start: Optional[date] = Field(None, description="Earliest baseline start in the subtree")
+    latest_end: Optional[date] = Field(None, description="Latest baseline end in the subtree")
+
+
 class ClassificationTreeNode(ClassificationOut):
     """Classification tree node with children"""
+    progress: Optional[ClassificationProgress] = Field(None, description="Only with ?progress=true")
     children: List['ClassificationTreeNode'] = Field(default_factory=list)
 
     class Config:
@@ -75,3 +85,88 @@ class ClassificationTreeNode(ClassificationOut):
 # Forward reference resolution
 ClassificationTreeNode.model_rebuild()
 
+
+
+class ClassificationTreeInput(BaseModel):
+    """Nested node of a bulk subtree import"""
+    name: str = Field(..., min_length=1, max_length=200, description="Classification name")
+    sort_no: int = Field(default=0, description="Sort order (default: 0)")
+    is_active: bool = Field(default=True, description="Active status (default: true)")
+    owner_dept_id: Optional[int] = Field(None, description="Owner department ID")
+    children: List['ClassificationTreeInput'] = Field(default_factory=list)
+
+    @field_validator('name')
+    @classmethod
+    def validate_name_no_slash(cls, v: str) -> str:
+        """Validate that name does not contain '/' character"""
+        if '/' in v:
+            raise ValueError("Classification name cannot contain '/'")
+        return v
+
+
+ClassificationTreeInput.model_rebuild()
+
+
+class ClassificationBulkCreate(BaseModel):
+    """Bulk subtree import input: nested nodes under parent_id (default ROOT) and/or slash paths"""
+    project_id: int = Field(..., ge=1, description="Project ID (required)")
+    parent_id: Optional[int] = Field(None, ge=1, description="Anchor for `nodes` (NULL → project ROOT)")
+    nodes: List[ClassificationTreeInput] = Field(default_factory=list, description="Nested subtree(s) under parent_id")
+    paths: List[str] = Field(default_factory=list, description="Slash paths under ROOT, e.g. /ROOT/X축/TABLE BED/가공")
+
+    @field_validator('paths')
+    @classmethod
+    def validate_paths(cls, v: List[str]) -> List[str]:
+        """Validate that every path is /ROOT/... with non-empty segments"""
+        for path in v:
+            segments = path.split('/')
+            if len(segments) < 2 or segments[0] != '' or segments[1] != 'ROOT':
+                raise ValueError(f"Path must start with /ROOT: {path!r}")
+            if any(not s or len(s) > 200 for s in segments[1:]):
+                raise ValueError(f"Path segments must be 1-200 characters: {path!r}")
+        return v
+
+    @model_validator(mode="after")
+    def validate_not_empty(self):
+        """At least one of nodes/paths is required"""
+        if not self.nodes and not self.paths:
+            raise ValueError("nodes or paths is required")
+        return self
+
+
+class ClassificationBulkNode(BaseModel):
+    """Id mapping entry of a bulk subtree import"""
+    id: int
+    path: str
+    created: bool
+
+
+class ClassificationBulkResult(BaseModel):
+    """Bulk subtree import output"""
+    project_id: int
+    created: int
+    existing: int
+    nodes: List[ClassificationBulkNode]
+
+
+class ClassificationMove(BaseModel):
+    """Subtree move input model"""
+    parent_id: int = Field(..., ge=1, description="New parent classification ID")
+    sort_no: Optional[int] = Field(None, description="New sort order of the moved node (default: unchanged)")
+
+
+class ClassificationMoveResult(BaseModel):
+    """Subtree move output model"""
+    id: int
+    parent_id: int
+    path: str
+    depth: int
+    rows_updated: int = Field(..., description="Moved node + rewritten descendants")
+
+
+class ClassificationDescendantCount(BaseModel):
+    """Descendant count output model"""
+    id: int
+    descendant_count: int = Field(..., description="All nodes below this one (self excluded)")
+    active_count: int = Field(..., description="Active nodes among the descendants")
+    max_depth: int = Field(..., description="Deepest descendant level relative to this node (0 = leaf)")
@@ -0,0 +1,32 @@
+"""
+Department Pydantic Models
+Workload of a department (classifications.owner_dept_id) across all projects
+"""
+from datetime import date
+from typing import List, Literal
+from pydantic import BaseModel, Field
+
+LoadBucket = Literal["day", "week"]
+
+
+class DepartmentLoadBucket(BaseModel):
+    """Load of one day or one (ISO, Monday start) week"""
+    start_date: date
+    end_date: date
+    active_tasks: int = Field(..., description="Tasks running at any time in the bucket")
+    peak: int = Field(..., description="Most tasks running on a single day of the bucket")
+    task_days: int = Field(..., description="Sum of the daily concurrent-task counts")
+    overloaded: bool = Field(..., description="peak > capacity")
+
+
+class DepartmentLoadOut(BaseModel):
+    """Department load output model"""
+    department_id: int
+    from_date: date
+    to_date: date
+    bucket: LoadBucket
+    capacity: int
+    task_count: int = Field(..., description="Tasks of the department overlapping the window")
+    peak: int
+    overloaded_buckets: int
+    buckets: List[DepartmentLoadBucket]
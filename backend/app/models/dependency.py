@@ -0,0 +1,70 @@
+"""
+Task Dependency Pydantic Models
+Based on actual schema: task_dependencies table; critical path (CPM) output
+"""
+from datetime import date, datetime
+from typing import List, Literal
+
+from pydantic import BaseModel, Field, model_validator
+
+DependencyType = Literal["FS", "SS", "FF", "SF"]
+
+
+class TaskDependencyCreate(BaseModel):
+    """Dependency link input model (predecessor → successor)"""
+    predecessor_id: int = Field(..., ge=1, description="Predecessor task ID")
+    successor_id: int = Field(..., ge=1, description="Successor task ID")
+    type: DependencyType = Field("FS", description="FS (finish→start), SS (start→start), FF (finish→finish), SF (start→finish)")
+    lag_days: int = Field(0, ge=-3650, le=3650, description="Lag in days (negative = lead)")
+
+    @model_validator(mode="after")
+    def not_self(self):
+        if self.predecessor_id == self.successor_id:
+            raise ValueError("predecessor_id and successor_id must differ")
+        return self
+
+
+class TaskDependencyBulkCreate(BaseModel):
+    """Links to add to a project in one transaction (all or nothing)"""
+    links: List[TaskDependencyCreate] = Field(..., min_length=1, max_length=5000)
+
+
+class TaskDependencyOut(BaseModel):
+    """Dependency link output model"""
+    id: int
+    project_id: int
+    predecessor_id: int
+    successor_id: int
+    type: DependencyType
+    lag_days: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class CriticalPathTask(BaseModel):
+    """CPM result of one task (dates are inclusive days; milestones start and finish on the same day)"""
+    task_id: int
+    title: str
+    duration_days: int
+    early_start: date
+    early_finish: date
+    late_start: date
+    late_finish: date
+    total_float: int = Field(..., description="Days the task can slip without delaying the project")
+    free_float: int = Field(..., description="Days the task can slip without delaying any successor")
+    is_critical: bool
+
+
+class CriticalPathOut(BaseModel):
+    """Project critical path output model"""
+    project_id: int
+    start_date: date
+    finish_date: date
+    duration_days: int
+    task_count: int
+    dependency_count: int
+    critical_path: List[int] = Field(..., description="Task IDs of the driving chain, start → finish")
+    undated_task_ids: List[int] = Field(..., description="Tasks without baseline dates (scheduled as 0-day milestones)")
+    tasks: List[CriticalPathTask]
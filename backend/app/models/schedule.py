@@ -0,0 +1,53 @@
+"""
+Schedule Pydantic Models
+Gantt schedule response (docs/schedule_design.md)
+"""
+from datetime import date
+from typing import Optional, List
+from pydantic import BaseModel, Field
+
+from app.models.classification import ClassificationProgress
+
+
+class ScheduleMonth(BaseModel):
+    """Month header cell"""
+    year: int
+    month: int
+    colspan: int = Field(..., description="Number of day columns of this month inside the range")
+
+
+class ScheduleBar(BaseModel):
+    """Task bar (PLAN, optional ACTUAL) placed in a lane"""
+    task_id: int
+    title: str
+    status: str
+    plan_start: date
+    plan_end: date
+    actual_start: Optional[date] = None  # both actual dates set, otherwise NULL
+    actual_end: Optional[date] = None
+    lane_index: int
+
+
+class ScheduleRow(BaseModel):
+    """Schedule row (one per active classification, tree order)"""
+    classification_id: int
+    parent_id: Optional[int] = None
+    name: str
+    depth: int
+    path: str
+    sort_no: int
+    is_task_row: bool = Field(..., description="Leaf with depth >= 3 (bars are drawn only on task rows)")
+    lane_count: int
+    row_height: int = Field(..., description="BASE_ROW_HEIGHT + lane_count * LANE_HEIGHT (px)")
+    progress: Optional[ClassificationProgress] = Field(None, description="Subtree task progress, only with ?progress=true")
+    bars: List[ScheduleBar] = Field(default_factory=list)
+
+
+class ScheduleOut(BaseModel):
+    """Project schedule output model"""
+    project_id: int
+    start_date: date
+    end_date: date
+    day_count: int
+    months: List[ScheduleMonth]
+    rows: List[ScheduleRow]
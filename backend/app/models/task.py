@@ -3,8 +3,8 @@ Task Pydantic Models
 Based on actual schema: tasks table
 """
 from datetime import date, datetime
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class TaskCreate(BaseModel):
@@ -68,6 +68,53 @@ class TaskUpdate(BaseModel):
         return v
 
 
+class TaskBatchUpdateItem(TaskUpdate):
+    """One item of PATCH /tasks:batch (TaskUpdate fields + target id)"""
+    id: int = Field(..., ge=1, description="Task ID")
+
+
+class TaskBatchUpdate(BaseModel):
+    """Batch update input; items are validated one by one as TaskBatchUpdateItem"""
+    items: List[Dict[str, Any]] = Field(..., min_length=1, max_length=500, description="Partial updates (max 500)")
+
+
+class TaskBatchItemError(BaseModel):
+    """Validation errors of one batch item"""
+    index: int = Field(..., description="0-based position in items")
+    id: Optional[int] = None
+    errors: List[Dict[str, Any]]
+
+
+class TaskBatchErrorResponse(BaseModel):
+    """422 body of PATCH /tasks:batch (nothing is updated)"""
+    detail: str
+    errors: List[TaskBatchItemError]
+
+
+class TaskBulkTransition(BaseModel):
+    """Bulk complete/reopen selector: exactly one of task_ids, classification_id (subtree) or project_id"""
+    task_ids: Optional[List[int]] = Field(None, min_length=1, max_length=5000, description="Task IDs")
+    classification_id: Optional[int] = Field(None, ge=1, description="Classification subtree (node + descendants)")
+    project_id: Optional[int] = Field(None, ge=1, description="Every task of the project")
+    status: Optional[str] = Field(None, description="Only tasks currently in this status")
+
+    @model_validator(mode="after")
+    def validate_one_selector(self):
+        """Exactly one selector is required"""
+        selectors = [self.task_ids is not None, self.classification_id is not None, self.project_id is not None]
+        if sum(selectors) != 1:
+            raise ValueError("Exactly one of task_ids, classification_id or project_id is required")
+        return self
+
+
+class TaskBulkTransitionResult(BaseModel):
+    """Bulk complete/reopen output"""
+    status: str = Field(..., description="Target status")
+    matched: int = Field(..., description="Tasks selected")
+    changed: int = Field(..., description="Tasks whose status actually changed")
+    changed_ids: List[int] = Field(default_factory=list)
+
+
 class TaskOut(BaseModel):
     """Task output model"""
     id: int
@@ -87,3 +134,19 @@ class TaskOut(BaseModel):
     class Config:
         from_attributes = True
 
+
+
+class TaskImportError(BaseModel):
+    """Per-row error of a bulk task import"""
+    row: int = Field(..., description="1-based data row number (CSV header / blank lines not counted)")
+    errors: List[Dict[str, Any]]
+
+
+class TaskImportResult(BaseModel):
+    """Bulk task import report"""
+    project_id: int
+    received: int
+    inserted: int
+    failed: int
+    task_ids: List[int] = Field(default_factory=list)
+    errors: List[TaskImportError] = Field(default_factory=list)
@@ -1,12 +1,14 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
+from app.core.database import get_read_db
+from app.core.query_budget import query_budget
 
 router = APIRouter(prefix="/categories", tags=["categories"])
 
 @router.get("/tree")
-async def get_category_tree(db: AsyncSession = Depends(get_db)):
+@query_budget(1)
+async def get_category_tree(db: AsyncSession = Depends(get_read_db)):
     q = text("""
         select
           l.cat_l_id, l.name as l_name, l.sort_order as l_sort,
@@ -2,58 +2,116 @@
 Classifications CRUD API Router
 Based on actual schema: classifications table
 """
+import time
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.models.classification import ClassificationCreate, ClassificationUpdate, ClassificationOut, ClassificationTreeNode
+from app.core.cache import tree_cache, tree_versions, tree_etag, etag_matches
+from app.core.database import get_read_db, get_write_db
+from app.core.locks import CLASSIFICATION_TREE_LOCK, lock_classification_tree, lock_project
+from app.core.query_budget import query_budget
+from app.core.pagination import NEXT_CURSOR_HEADER, sort_keys, order_by_clause, encode_cursor, decode_cursor, keyset_condition
+from app.core.responses import rows_response
+from app.models.classification import (
+    ClassificationCreate, ClassificationUpdate, ClassificationOut, ClassificationTreeNode,
+    ClassificationBulkCreate, ClassificationBulkResult, ClassificationMove, ClassificationMoveResult,
+    ClassificationDescendantCount,
+)
+from app.services.classification_import import ROOT_PATH, collect_specs, plan_new_nodes
+from app.services.progress import rollup_progress
 
 router = APIRouter(prefix="/classifications", tags=["classifications"])
 
+# A project's whole classification tree (shared with the schedule endpoint)
+# Every node hangs off the project's ROOT via id_path, so a plain project scan returns
+# exactly the nodes the old recursive CTE reached; children are linked in Python.
+CLASSIFICATION_TREE_QUERY = text("""
+    SELECT 
+        id, project_id, parent_id, name, depth, path, sort_no, is_active,
+        owner_dept_id, created_at, updated_at
+    FROM classifications
+    WHERE project_id = :project_id
+    ORDER BY depth, sort_no, name
+""")
+
+# Per-classification task counts for the progress rollup (ix_tasks_project_class)
+# (shared with the schedule endpoint; baseline_end 가 없으면 1일짜리 작업으로 보정)
+TASK_PROGRESS_QUERY = text("""
+    SELECT
+        classification_id,
+        COUNT(*)::int AS total,
+        COUNT(*) FILTER (WHERE status = 'closed')::int AS closed,
+        MIN(COALESCE(baseline_start, baseline_end)::date) AS earliest_start,
+        MAX(COALESCE(baseline_end, baseline_start)::date) AS latest_end
+    FROM tasks
+    WHERE project_id = :project_id
+    GROUP BY classification_id
+""")
+
+# Project existence + current tree version (bumped by classifications triggers)
+PROJECT_TREE_VERSION_QUERY = text("""
+    SELECT p.id, COALESCE(v.version, 0) AS version
+    FROM projects p
+    LEFT JOIN classification_tree_versions v ON v.project_id = p.id
+    WHERE p.id = :project_id
+""")
+
+_tree_adapter = TypeAdapter(List[ClassificationTreeNode])
+
 
 @router.get("/tree", response_model=List[ClassificationTreeNode])
+@query_budget(3)
 async def get_classification_tree(
     project_id: int = Query(..., ge=1, description="Project ID"),
-    db: AsyncSession = Depends(get_db),
+    progress: bool = Query(False, description="Add each node's subtree task progress (closed/total/percent, dates)"),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get classification tree for a project
-    Uses v_classifications_under_root view if available, otherwise recursive CTE
+    Reads the project's nodes in one scan (no recursion) and links them in memory
+    Serialised trees are cached per (project_id, tree version); the version is the ETag.
+    While the change bus is connected the version itself is cached too, so a cache hit
+    runs no query at all.
+    With progress=true every node gets `progress`, rolled up bottom-up from one per-node
+    task count query. Task changes do not bump the tree version, so these responses
+    bypass the tree cache and carry no ETag.
     """
-    # Check if project exists
-    project_check = text("SELECT id FROM projects WHERE id = :project_id")
-    project_result = await db.execute(project_check, {"project_id": project_id})
-    if not project_result.first():
-        raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
+    # Check if project exists (and read its tree version); cached until a change notification
+    started = time.monotonic()
+    version = tree_versions.get(project_id)
+    if version is None:
+        project_row = (await db.execute(PROJECT_TREE_VERSION_QUERY, {"project_id": project_id})).mappings().first()
+        if not project_row:
+            raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
+        version = project_row["version"]
+        tree_versions.set(project_id, version, started)
+    etag = tree_etag("tree", project_id, version)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if progress:
+        headers = {"Cache-Control": "no-cache"}
+    elif etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    cache_key = ("tree", project_id)
+    body = None if progress else tree_cache.get(cache_key, version)
+    if body is not None:
+        return Response(content=body, media_type="application/json", headers=headers)
 
-    # Use view if available, otherwise use recursive CTE
     # 모든 분류를 가져오도록 is_active 조건 제거
-    query = text("""
-        WITH RECURSIVE tree AS (
-            SELECT 
-                id, project_id, parent_id, name, depth, path, sort_no, is_active,
-                owner_dept_id, created_at, updated_at
-            FROM classifications
-            WHERE project_id = :project_id AND parent_id IS NULL
-            UNION ALL
-            SELECT 
-                c.id, c.project_id, c.parent_id, c.name, c.depth, c.path, c.sort_no, c.is_active,
-                c.owner_dept_id, c.created_at, c.updated_at
-            FROM classifications c
-            INNER JOIN tree t ON c.parent_id = t.id
-            WHERE c.project_id = :project_id
-        )
-        SELECT 
-            id, project_id, parent_id, name, depth, path, sort_no, is_active,
-            owner_dept_id, created_at, updated_at
-        FROM tree
-        ORDER BY depth, sort_no, name
-    """)
+    query = CLASSIFICATION_TREE_QUERY
     result = await db.execute(query, {"project_id": project_id})
     rows = result.mappings().all()
 
+    rollup = None
+    if progress:
+        counts = (await db.execute(TASK_PROGRESS_QUERY, {"project_id": project_id})).mappings().all()
+        rollup = rollup_progress(rows, counts)
+
     # Build tree structure
     # 모든 노드를 ClassificationTreeNode로 변환하여 저장
     node_map: dict[int, ClassificationTreeNode] = {}
@@ -62,7 +120,10 @@ async def get_classification_tree(
     # 1단계: 모든 노드를 ClassificationTreeNode로 생성
     for row in rows:
         node_id = row["id"]
-        node_map[node_id] = ClassificationTreeNode(**dict(row), children=[])
+        if rollup is None:
+            node_map[node_id] = ClassificationTreeNode(**dict(row), children=[])
+        else:
+            node_map[node_id] = ClassificationTreeNode(**dict(row), progress=rollup[node_id], children=[])
 
     # 2단계: 부모-자식 관계 연결
     for row in rows:
@@ -77,21 +138,29 @@ async def get_classification_tree(
             if parent_id in node_map:
                 node_map[parent_id].children.append(node_map[node_id])
 
-    return tree
+    # progress 를 요청하지 않은 응답에는 progress 필드 자체를 넣지 않음 (기존 응답과 동일)
+    body = _tree_adapter.dump_json(tree, exclude_unset=True)
+    if rollup is None:
+        tree_cache.set(cache_key, version, body)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("", response_model=List[ClassificationOut])
+@query_budget(1)
 async def list_classifications(
+    response: Response,
     project_id: Optional[int] = Query(None, ge=1, description="Filter by project_id"),
     parent_id: Optional[int] = Query(None, description="Filter by parent_id (NULL for root)"),
     is_active: Optional[bool] = Query(None, description="Filter by is_active"),
     limit: int = Query(50, ge=1, le=200, description="Limit (max 200)"),
     offset: int = Query(0, ge=0, description="Offset"),
     sort: str = Query("sort_no asc, name asc", description="Sort order"),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header (offset is ignored)"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     List classifications with filtering and pagination
+    A full page sets X-Next-Cursor; pass it back as `cursor` to fetch the next page with one index seek
     """
     conditions = []
     params = {}
@@ -129,13 +198,21 @@ async def list_classifications(
                     validated_parts.append(f"{col} {dir}")
         sort = ", ".join(validated_parts) if validated_parts else "sort_no asc, name asc"
 
+    # id tie-breaker → 정렬이 항상 유일하므로 페이지 간 중복/누락 없음
+    keys = sort_keys(sort)
+    if cursor:
+        keyset_sql, keyset_params = keyset_condition(keys, decode_cursor(cursor, keys))
+        where_clause = f"{where_clause} AND {keyset_sql}"
+        params.update(keyset_params)
+        offset = 0
+
     query = text(f"""
         SELECT 
             id, project_id, parent_id, name, depth, path, sort_no, is_active,
             owner_dept_id, created_at, updated_at
         FROM classifications
         WHERE {where_clause}
-        ORDER BY {sort}
+        ORDER BY {order_by_clause(keys)}
         LIMIT :limit OFFSET :offset
     """)
     params.update({"limit": limit, "offset": offset})
@@ -143,13 +220,17 @@ async def list_classifications(
     result = await db.execute(query, params)
     rows = result.mappings().all()
 
-    return [ClassificationOut(**dict(row)) for row in rows]
+    if len(rows) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(keys, rows[-1])
+
+    return rows_response(rows, ClassificationOut, response)
 
 
 @router.get("/{classification_id}", response_model=ClassificationOut)
+@query_budget(1)
 async def get_classification(
     classification_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get a single classification by ID
@@ -170,10 +251,121 @@ async def get_classification(
     return ClassificationOut(**dict(row))
 
 
+@router.get("/{classification_id}/subtree", response_model=List[ClassificationOut])
+@query_budget(2)
+async def get_classification_subtree(
+    classification_id: int,
+    include_self: bool = Query(True, description="Include the node itself"),
+    max_depth: Optional[int] = Query(None, ge=1, description="Levels below the node to include (default: all)"),
+    is_active: Optional[bool] = Query(None, description="Filter by is_active"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Get a node and all of its descendants (flat, tree order by depth → sort_no → name)
+    One GiST index lookup on id_path <@ node instead of a recursive CTE
+    """
+    node_q = text("SELECT id_path::text AS id_path, nlevel(id_path) AS levels FROM classifications WHERE id = :classification_id")
+    node = (await db.execute(node_q, {"classification_id": classification_id})).mappings().first()
+    if not node:
+        raise HTTPException(status_code=404, detail=f"Classification {classification_id} not found")
+
+    conditions = ["id_path <@ CAST(:id_path AS ltree)"]
+    params = {"id_path": node["id_path"]}
+
+    if not include_self:
+        conditions.append("id <> :classification_id")
+        params["classification_id"] = classification_id
+
+    if max_depth is not None:
+        conditions.append("nlevel(id_path) <= :max_levels")
+        params["max_levels"] = node["levels"] + max_depth
+
+    if is_active is not None:
+        conditions.append("is_active = :is_active")
+        params["is_active"] = is_active
+
+    query = text(f"""
+        SELECT 
+            id, project_id, parent_id, name, depth, path, sort_no, is_active,
+            owner_dept_id, created_at, updated_at
+        FROM classifications
+        WHERE {" AND ".join(conditions)}
+        ORDER BY depth, sort_no, name
+    """)
+    rows = (await db.execute(query, params)).mappings().all()
+    return rows_response(rows, ClassificationOut)
+
+
+@router.get("/{classification_id}/ancestors", response_model=List[ClassificationOut])
+@query_budget(2)
+async def get_classification_ancestors(
+    classification_id: int,
+    include_self: bool = Query(False, description="Include the node itself"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Get the ancestors of a node, ROOT first (breadcrumb)
+    Uses id_path @> node (GiST) instead of walking parent_id recursively
+    """
+    query = text("""
+        SELECT 
+            a.id, a.project_id, a.parent_id, a.name, a.depth, a.path, a.sort_no, a.is_active,
+            a.owner_dept_id, a.created_at, a.updated_at
+        FROM classifications n
+        JOIN classifications a ON a.id_path @> n.id_path
+        WHERE n.id = :classification_id
+          AND (:include_self OR a.id <> n.id)
+        ORDER BY a.depth
+    """)
+    rows = (await db.execute(query, {
+        "classification_id": classification_id,
+        "include_self": include_self,
+    })).mappings().all()
+
+    # 자기 자신은 항상 id_path @> 조건에 포함되므로, 결과가 없으면 노드가 없는 것
+    if not rows:
+        exists = await db.execute(
+            text("SELECT 1 FROM classifications WHERE id = :classification_id"),
+            {"classification_id": classification_id},
+        )
+        if not exists.first():
+            raise HTTPException(status_code=404, detail=f"Classification {classification_id} not found")
+
+    return rows_response(rows, ClassificationOut)
+
+
+@router.get("/{classification_id}/descendant-count", response_model=ClassificationDescendantCount)
+@query_budget(1)
+async def get_classification_descendant_count(
+    classification_id: int,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Count the descendants of a node with one id_path <@ aggregate (e.g. before deactivating a subtree)
+    """
+    query = text("""
+        SELECT
+            n.id,
+            COUNT(d.id) FILTER (WHERE d.id <> n.id) AS descendant_count,
+            COUNT(d.id) FILTER (WHERE d.id <> n.id AND d.is_active) AS active_count,
+            MAX(nlevel(d.id_path)) - nlevel(n.id_path) AS max_depth
+        FROM classifications n
+        JOIN classifications d ON d.id_path <@ n.id_path
+        WHERE n.id = :classification_id
+        GROUP BY n.id, n.id_path
+    """)
+    row = (await db.execute(query, {"classification_id": classification_id})).mappings().first()
+    if not row:
+        raise HTTPException(status_code=404, detail=f"Classification {classification_id} not found")
+
+    return ClassificationDescendantCount(**dict(row))
+
+
 @router.post("", response_model=ClassificationOut, status_code=201)
+@query_budget(5)
 async def create_classification(
     classification: ClassificationCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ):
     """
     Create a new classification
@@ -185,6 +377,9 @@ async def create_classification(
     if not project_result.first():
         raise HTTPException(status_code=404, detail=f"Project {classification.project_id} not found")
 
+    # 트리거가 부모의 path 로 새 path 를 계산하므로 이동/대량 생성과 직렬화
+    await lock_project(db, CLASSIFICATION_TREE_LOCK, classification.project_id)
+
     # ROOT 생성 전용 로직: parent_id가 NULL이고 name이 'ROOT'인 경우만 허용
     if classification.parent_id is None:
         if classification.name.upper() != "ROOT":
@@ -266,16 +461,151 @@ async def create_classification(
     return ClassificationOut(**dict(row))
 
 
+@router.post(":bulk", response_model=ClassificationBulkResult, status_code=201)
+@query_budget(7)
+async def bulk_create_classifications(
+    payload: ClassificationBulkCreate,
+    db: AsyncSession = Depends(get_write_db),
+):
+    """
+    Create a whole classification subtree in one transaction
+    Accepts nested `nodes` under `parent_id` (default ROOT) and/or slash `paths` under /ROOT.
+    Nodes that already exist (same path → same parent + name) are reused, so sibling names stay
+    unique; ROOT is the only parentless node and is created only if the project has none.
+    path/depth/id_path/parent_id are computed in bulk and inserted with a single statement
+    (per-row path triggers are bypassed for this transaction), under the project's
+    classification tree lock so a concurrent move cannot leave them on a stale prefix.
+    """
+    project_id = payload.project_id
+
+    # Verify project exists
+    project_check = text("SELECT id FROM projects WHERE id = :project_id")
+    project_result = await db.execute(project_check, {"project_id": project_id})
+    if not project_result.first():
+        raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
+
+    # path/id_path 를 Python 에서 계산하고 트리거를 우회하므로, 기준 노드를 읽기 전에
+    # 이동/수정과 직렬화 (그 사이 커밋된 이동이 새 행을 놓치지 않도록)
+    await lock_project(db, CLASSIFICATION_TREE_LOCK, project_id)
+
+    # Anchor for nested nodes (default: ROOT)
+    anchor = None
+    anchor_path = ROOT_PATH
+    if payload.nodes and payload.parent_id is not None:
+        anchor_check = text("""
+            SELECT id, path, depth, id_path::text AS id_path, is_active FROM classifications 
+            WHERE id = :parent_id AND project_id = :project_id AND is_active = TRUE
+        """)
+        anchor = (await db.execute(anchor_check, {
+            "parent_id": payload.parent_id,
+            "project_id": project_id,
+        })).mappings().first()
+        if not anchor:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Parent classification {payload.parent_id} not found or inactive"
+            )
+        anchor_path = anchor["path"]
+
+    specs = collect_specs(anchor_path, payload.nodes, payload.paths)
+
+    # Existing nodes on the requested paths (uq_class_path index)
+    existing_q = text("""
+        SELECT id, path, depth, id_path::text AS id_path, is_active FROM classifications
+        WHERE project_id = :project_id AND path = ANY(CAST(:paths AS text[]))
+    """)
+    existing = {
+        r["path"]: dict(r)
+        for r in (await db.execute(existing_q, {"project_id": project_id, "paths": list(specs)})).mappings()
+    }
+    if anchor is not None:
+        existing[anchor["path"]] = dict(anchor)
+
+    new_count = sum(1 for path in specs if path not in existing)
+    new_ids: List[int] = []
+    if new_count:
+        ids_q = text("""
+            SELECT nextval(pg_get_serial_sequence('public.classifications', 'id'))
+            FROM generate_series(1, :n)
+        """)
+        new_ids = list((await db.execute(ids_q, {"n": new_count})).scalars())
+
+    try:
+        planned = plan_new_nodes(specs, existing, new_ids)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    if planned:
+        await db.execute(text("SELECT set_config('masterplan.skip_path_triggers', 'on', true)"))
+        insert_query = text("""
+            INSERT INTO classifications (
+                id, project_id, parent_id, name, depth, path, id_path, sort_no, is_active, owner_dept_id,
+                created_at, updated_at
+            )
+            SELECT
+                n.id, :project_id, n.parent_id, n.name, n.depth, n.path, CAST(n.id_path AS ltree),
+                n.sort_no, n.is_active, n.owner_dept_id,
+                now(), now()
+            FROM unnest(
+                CAST(:ids AS bigint[]), CAST(:parent_ids AS bigint[]), CAST(:names AS text[]),
+                CAST(:depths AS int[]), CAST(:paths AS text[]), CAST(:id_paths AS text[]),
+                CAST(:sort_nos AS int[]), CAST(:is_actives AS boolean[]), CAST(:owner_dept_ids AS bigint[])
+            ) AS n(id, parent_id, name, depth, path, id_path, sort_no, is_active, owner_dept_id)
+        """)
+        try:
+            await db.execute(insert_query, {
+                "project_id": project_id,
+                "ids": [r["id"] for r in planned],
+                "parent_ids": [r["parent_id"] for r in planned],
+                "names": [r["name"] for r in planned],
+                "depths": [r["depth"] for r in planned],
+                "paths": [r["path"] for r in planned],
+                "id_paths": [r["id_path"] for r in planned],
+                "sort_nos": [r["sort_no"] for r in planned],
+                "is_actives": [r["is_active"] for r in planned],
+                "owner_dept_ids": [r["owner_dept_id"] for r in planned],
+            })
+            await db.commit()
+        except IntegrityError:
+            # 동시 요청이 같은 경로를 먼저 생성한 경우 (uq_class_sibling / uq_class_path)
+            await db.rollback()
+            raise HTTPException(
+                status_code=409,
+                detail="이미 존재하는 분류와 충돌했습니다. 다시 시도하세요."
+            )
+
+    created_ids = {r["path"]: r["id"] for r in planned}
+    nodes = [
+        {
+            "id": created_ids[path] if path in created_ids else existing[path]["id"],
+            "path": path,
+            "created": path in created_ids,
+        }
+        for path in specs
+    ]
+    return {
+        "project_id": project_id,
+        "created": len(planned),
+        "existing": len(nodes) - len(planned),
+        "nodes": nodes,
+    }
+
+
 @router.patch("/{classification_id}", response_model=ClassificationOut)
+@query_budget(4)
 async def update_classification(
     classification_id: int,
     classification_update: ClassificationUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ):
     """
     Update a classification (partial update)
     Note: path and depth are auto-managed by DB triggers
+    Holds the project's classification tree lock (a rename or re-parent rewrites the
+    subtree's paths, which must not interleave with a move or bulk create)
     """
+    await lock_classification_tree(db, classification_id)
+
     # Check if classification exists and get parent_id
     classification_check = text("SELECT id, parent_id FROM classifications WHERE id = :classification_id")
     classification_result = await db.execute(classification_check, {"classification_id": classification_id})
@@ -349,10 +679,133 @@ async def update_classification(
     return ClassificationOut(**dict(row))
 
 
+@router.post("/{classification_id}/move", response_model=ClassificationMoveResult)
+@query_budget(4)
+async def move_classification(
+    classification_id: int,
+    move: ClassificationMove,
+    db: AsyncSession = Depends(get_write_db),
+):
+    """
+    Move a classification (and its whole subtree) under a new parent
+    The cycle check is a single ltree containment test, and the node plus every descendant
+    (id_path <@ node, GiST index) get path/depth/id_path rewritten by one UPDATE with the
+    per-row path triggers bypassed
+    (instead of PATCH parent_id, which cascades row by row through the triggers)
+    Tree writes within a project are serialised by the classification tree lock: row locks
+    on the node alone cannot stop two crossing moves (A under B, B under A) from both
+    passing the cycle check, and the bypassed triggers would never repair the result.
+    """
+    # 같은 프로젝트의 트리 쓰기를 직렬화 (순환 검사가 다른 이동의 커밋 결과를 보도록)
+    await lock_classification_tree(db, classification_id)
+
+    # 이동 대상(잠금) + 새 부모 + 새 부모 아래 같은 이름 존재 여부를 한 번에 조회
+    check_query = text("""
+        SELECT
+            n.id, n.project_id, n.parent_id, n.name, n.path, n.depth,
+            n.id_path::text AS id_path, nlevel(n.id_path) AS id_path_levels,
+            p.id AS new_parent_id,
+            p.project_id AS new_parent_project_id,
+            p.path AS new_parent_path,
+            p.id_path::text AS new_parent_id_path,
+            p.depth AS new_parent_depth,
+            p.is_active AS new_parent_active,
+            p.id_path <@ n.id_path AS new_parent_in_subtree,
+            EXISTS (
+                SELECT 1 FROM classifications s
+                WHERE s.project_id = n.project_id
+                  AND s.parent_id = :parent_id
+                  AND s.name = n.name
+                  AND s.id <> n.id
+            ) AS sibling_exists
+        FROM classifications n
+        LEFT JOIN classifications p ON p.id = :parent_id
+        WHERE n.id = :classification_id
+        FOR UPDATE OF n
+    """)
+    row = (await db.execute(check_query, {
+        "classification_id": classification_id,
+        "parent_id": move.parent_id,
+    })).mappings().first()
+
+    if not row:
+        raise HTTPException(status_code=404, detail=f"Classification {classification_id} not found")
+
+    # ROOT 이동 방지
+    if row["parent_id"] is None:
+        raise HTTPException(status_code=400, detail="ROOT classification cannot be moved")
+
+    if (
+        row["new_parent_id"] is None
+        or row["new_parent_project_id"] != row["project_id"]
+        or not row["new_parent_active"]
+    ):
+        raise HTTPException(
+            status_code=404,
+            detail=f"Parent classification {move.parent_id} not found or inactive"
+        )
+
+    # 순환 방지: 자기 자신 또는 자신의 하위로 이동 불가 (id_path 포함 관계 비교 1회)
+    old_prefix = row["path"]
+    if row["new_parent_in_subtree"]:
+        raise HTTPException(
+            status_code=400,
+            detail=f"cycle detected: cannot move node {classification_id} under itself or its descendant"
+        )
+
+    if row["sibling_exists"]:
+        raise HTTPException(
+            status_code=409,
+            detail=f"이미 존재하는 분류입니다: 부모 ID {move.parent_id} 아래에 '{row['name']}' 이름이 이미 있습니다."
+        )
+
+    new_prefix = f"{row['new_parent_path']}/{row['name']}"
+    new_id_path = f"{row['new_parent_id_path']}.{classification_id}"
+    depth_delta = row["new_parent_depth"] + 1 - row["depth"]
+
+    await db.execute(text("SELECT set_config('masterplan.skip_path_triggers', 'on', true)"))
+    move_query = text("""
+        UPDATE classifications d
+        SET
+            path = :new_prefix || substr(d.path, :old_len + 1),
+            depth = d.depth + :depth_delta,
+            id_path = CASE
+                WHEN d.id = :classification_id THEN CAST(:new_id_path AS ltree)
+                ELSE CAST(:new_id_path AS ltree) || subpath(d.id_path, :old_levels)
+            END,
+            parent_id = CASE WHEN d.id = :classification_id THEN :parent_id ELSE d.parent_id END,
+            sort_no = CASE WHEN d.id = :classification_id THEN COALESCE(CAST(:sort_no AS int), d.sort_no) ELSE d.sort_no END,
+            updated_at = now()
+        WHERE d.id_path <@ CAST(:old_id_path AS ltree)
+    """)
+    result = await db.execute(move_query, {
+        "new_prefix": new_prefix,
+        "old_len": len(old_prefix),
+        "depth_delta": depth_delta,
+        "classification_id": classification_id,
+        "parent_id": move.parent_id,
+        "sort_no": move.sort_no,
+        "new_id_path": new_id_path,
+        "old_id_path": row["id_path"],
+        "old_levels": row["id_path_levels"],
+    })
+    rows_updated = result.rowcount
+    await db.commit()
+
+    return {
+        "id": classification_id,
+        "parent_id": move.parent_id,
+        "path": new_prefix,
+        "depth": row["depth"] + depth_delta,
+        "rows_updated": rows_updated,
+    }
+
+
 @router.delete("/{classification_id}", status_code=204)
+@query_budget(4)
 async def delete_classification(
     classification_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ):
     """
     Delete a classification
@@ -1,19 +1,28 @@
+import time
 from typing import Optional, List, Dict, Any
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
-from app.core.database import get_db
+from app.core.cache import dashboard_cache
+from app.core.database import get_read_db
+from app.core.query_budget import query_budget
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
 @router.get("/status-counts")
-async def get_status_counts(db: AsyncSession = Depends(get_db)):
+@query_budget(1)
+async def get_status_counts(db: AsyncSession = Depends(get_read_db)):
     """
     프로젝트 상태별 카운트 조회
-    projects 테이블의 status 컬럼을 집계하여 반환
+    projects 테이블의 status 컬럼을 집계하여 반환 (projects 변경 알림 시 캐시 무효화)
     """
+    started = time.monotonic()
+    cached = dashboard_cache.get(("status-counts",))
+    if cached is not None:
+        return cached
+
     q = text("""
         SELECT 
             ROW_NUMBER() OVER (ORDER BY status)::int as status_id,
@@ -38,66 +47,81 @@ async def get_status_counts(db: AsyncSession = Depends(get_db)):
         ORDER BY display_order
     """)
     rows = (await db.execute(q)).mappings().all()
-    return [dict(r) for r in rows]
+    result = [dict(r) for r in rows]
+    dashboard_cache.set(("status-counts",), result, started)
+    return result
+
+
+# 프로젝트 상태 → (status_id, status_name) 매핑 (status-counts 의 display_order 와 동일)
+PROJECT_STATUS_DISPLAY = {
+    "pending": (1, "대기"),
+    "in_progress": (2, "진행중"),
+    "paused": (3, "중단"),
+    "done": (4, "완료"),
+}
 
 
 @router.get("/projects")
+@query_budget(1)
 async def get_dashboard_projects(
     status_id: Optional[int] = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     대시보드 프로젝트 목록 조회
-    projects 테이블의 status와 tasks 테이블을 기반으로 진행률 계산
+    projects 테이블의 status와 project_progress 롤업(tasks 트리거로 유지)을 기반으로 진행률 계산
+    (projects / tasks 변경 알림 시 캐시 무효화)
     """
-    # 프로젝트 목록 가져오기
-    projects_q = text("SELECT id, code, name, status, due_at FROM projects ORDER BY name")
-    projects = (await db.execute(projects_q)).mappings().all()
-    
-    result = []
+    started = time.monotonic()
+    cache_key = ("projects", status_id)
+    cached = dashboard_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    conditions = []
+    params: Dict[str, Any] = {}
+
+    # status_id 필터는 SQL로 처리 (ix_projects_status 사용)
+    if status_id is not None:
+        status_code = next(
+            (code for code, (sid, _) in PROJECT_STATUS_DISPLAY.items() if sid == status_id),
+            None,
+        )
+        if status_code is None:
+            return []
+        conditions.append("p.status = :status")
+        params["status"] = status_code
+
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+
+    q = text(f"""
+        SELECT 
+            p.code,
+            p.name,
+            p.status::text AS status,
+            p.due_at,
+            COALESCE(pp.closed_count, 0)::int AS closed_count,
+            COALESCE(pp.total_count, 0)::int AS total_count
+        FROM projects p
+        LEFT JOIN project_progress pp ON pp.project_id = p.id
+        WHERE {where_clause}
+        ORDER BY p.name
+    """)
+    projects = (await db.execute(q, params)).mappings().all()
+
+    result: List[Dict[str, Any]] = []
     for proj in projects:
-        # 각 프로젝트의 task 통계 계산
-        stats_q = text("""
-            SELECT 
-                COUNT(*) FILTER (WHERE status = 'closed')::int as closed_count,
-                COUNT(*)::int as total_count
-            FROM tasks
-            WHERE project_id = :project_id
-        """)
-        stats_result = await db.execute(stats_q, {"project_id": proj["id"]})
-        stats = stats_result.first()
-        
-        closed_count = stats[0] if stats and stats[0] is not None else 0
-        total_count = stats[1] if stats and stats[1] is not None else 0
-        
-        # 상태 매핑
-        status_text = str(proj["status"])
-        if status_text == 'pending':
-            proj_status_id = 1
-            proj_status_name = '대기'
-        elif status_text == 'in_progress':
-            proj_status_id = 2
-            proj_status_name = '진행중'
-        elif status_text == 'paused':
-            proj_status_id = 3
-            proj_status_name = '중단'
-        elif status_text == 'done':
-            proj_status_id = 4
-            proj_status_name = '완료'
-        else:
-            proj_status_id = 99
-            proj_status_name = status_text
-        
+        status_text = proj["status"]
+        proj_status_id, proj_status_name = PROJECT_STATUS_DISPLAY.get(status_text, (99, status_text))
+
         # 진행률 계산
+        closed_count = proj["closed_count"]
+        total_count = proj["total_count"]
         if total_count == 0:
             progress_pct = 0
         else:
             progress_pct = min(100, max(0, int((closed_count / total_count) * 100)))
-        
-        # status_id 필터링 (파라미터와 로컬 변수명 구분)
-        if status_id is not None and proj_status_id != status_id:
-            continue
-        
+
         result.append({
             "erp_project_key": proj["code"],
             "project_name": proj["name"],
@@ -109,5 +133,6 @@ async def get_dashboard_projects(
             "current_due_date": proj["due_at"].isoformat() if proj["due_at"] else None,
             "progress_pct": progress_pct
         })
-    
+
+    dashboard_cache.set(cache_key, result, started)
     return result
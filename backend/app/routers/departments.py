@@ -0,0 +1,110 @@
+"""
+Departments API Router
+Department workload across all projects (classifications.owner_dept_id 기반)
+"""
+from datetime import date, timedelta
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_read_db
+from app.core.query_budget import query_budget
+from app.core.responses import json_response
+from app.models.department import DepartmentLoadOut, LoadBucket
+from app.services.workload import load_buckets
+from app.settings import DEPARTMENT_DAILY_CAPACITY, DEPARTMENT_LOAD_MAX_DAYS
+
+router = APIRouter(prefix="/departments", tags=["departments"])
+
+DEFAULT_LOAD_DAYS = 90
+
+# 부서의 작업 = 그 부서가 가장 가까운 담당(owner_dept_id)인 분류 하위의 작업
+# (하위 분류에 다른 담당 부서가 지정되면 그 아래는 제외)
+# 기간 밖은 SQL 에서 잘라내고 구간은 시작일 기준 일 offset 으로 반환 (양 끝 포함)
+DEPARTMENT_TASK_SPANS_QUERY = text("""
+    WITH owned AS (
+        SELECT o.project_id, o.id_path
+        FROM classifications o
+        WHERE o.owner_dept_id = :department_id
+    ),
+    nodes AS (
+        SELECT c.id
+        FROM owned o
+        JOIN classifications c
+          ON c.project_id = o.project_id
+         AND c.id_path <@ o.id_path
+        WHERE NOT EXISTS (
+            SELECT 1
+            FROM classifications a
+            WHERE a.project_id = c.project_id
+              AND a.owner_dept_id IS NOT NULL
+              AND a.id_path <@ o.id_path
+              AND a.id_path @> c.id_path
+              AND a.id_path <> o.id_path
+        )
+    ),
+    spans AS (
+        -- baseline_end 가 없으면 1일짜리 작업으로 보정 (schedule 과 동일)
+        SELECT
+            COALESCE(t.baseline_start, t.baseline_end)::date AS first_date,
+            COALESCE(t.baseline_end, t.baseline_start)::date AS last_date
+        FROM nodes n
+        JOIN tasks t ON t.classification_id = n.id
+        WHERE (t.baseline_start IS NOT NULL OR t.baseline_end IS NOT NULL)
+          AND (CAST(:include_closed AS boolean) OR t.status <> 'closed')
+    )
+    SELECT
+        GREATEST(first_date, CAST(:from_date AS date)) - CAST(:from_date AS date) AS first_day,
+        LEAST(last_date, CAST(:to_date AS date)) - CAST(:from_date AS date) AS last_day
+    FROM spans
+    WHERE first_date <= CAST(:to_date AS date)
+      AND last_date >= CAST(:from_date AS date)
+      AND first_date <= last_date
+""")
+
+
+@router.get("/{department_id}/load", response_model=DepartmentLoadOut)
+@query_budget(1)
+async def get_department_load(
+    department_id: int,
+    from_date: Optional[date] = Query(None, alias="from", description="First day (default: today)"),
+    to_date: Optional[date] = Query(None, alias="to", description=f"Last day, inclusive (default: from + {DEFAULT_LOAD_DAYS - 1} days)"),
+    bucket: LoadBucket = Query("day", description="day or week (ISO weeks, Monday start)"),
+    capacity: int = Query(DEPARTMENT_DAILY_CAPACITY, ge=0, description="Concurrent tasks per day above which a bucket is overloaded"),
+    include_closed: bool = Query(False, description="Also count closed tasks"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Concurrent-task load of a department across all projects
+    Tasks belong to the department whose owner_dept_id is set on their nearest classification
+    ancestor; each task occupies its baseline days (inclusive). Buckets are computed with a
+    sweep line over the task intervals (difference array + prefix sum), not per day per task.
+    """
+    start = from_date or date.today()
+    end = to_date or start + timedelta(days=DEFAULT_LOAD_DAYS - 1)
+    if end < start:
+        raise HTTPException(status_code=422, detail="'to' must be on or after 'from'")
+    day_count = (end - start).days + 1
+    if day_count > DEPARTMENT_LOAD_MAX_DAYS:
+        raise HTTPException(status_code=422, detail=f"Range too long: {day_count} days (max {DEPARTMENT_LOAD_MAX_DAYS})")
+
+    spans = (await db.execute(DEPARTMENT_TASK_SPANS_QUERY, {
+        "department_id": department_id,
+        "from_date": start,
+        "to_date": end,
+        "include_closed": include_closed,
+    })).all()
+
+    buckets = load_buckets(spans, start, day_count, bucket, capacity)
+    return json_response({
+        "department_id": department_id,
+        "from_date": start,
+        "to_date": end,
+        "bucket": bucket,
+        "capacity": capacity,
+        "task_count": len(spans),
+        "peak": max(b["peak"] for b in buckets),
+        "overloaded_buckets": sum(b["overloaded"] for b in buckets),
+        "buckets": buckets,
+    })
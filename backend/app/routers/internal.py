@@ -0,0 +1,107 @@
+"""
+Internal (operations) API Router
+Runtime diagnostics for operators; not used by the frontend
+"""
+from typing import Literal
+
+from fastapi import APIRouter, Query
+
+from app.core.cache import dashboard_cache, project_ids_by_code, tree_cache, tree_versions
+from app.core.database import engine, primary_stickiness, read_engine
+from app.core.events import project_event_hub
+from app.core.notify import change_bus
+from app.core.pool_metrics import pool_metrics, read_pool_metrics
+from app.core.slow_queries import slow_query_log
+from app.settings import (
+    DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE,
+    DB_STATEMENT_CACHE_SIZE, DB_STATEMENT_TIMEOUT_MS,
+    DB_READ_HOST, DB_READ_POOL_SIZE, DB_READ_MAX_OVERFLOW, READ_YOUR_WRITES_WINDOW_S,
+)
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+
+@router.get("/pool")
+async def get_pool_stats():
+    """
+    Connection pool status
+    Live checked-out / idle / overflow connections, checkout wait-time histogram (ms,
+    cumulative buckets), checkout timeouts and failed pre-pings since startup.
+    Top level: primary (write) pool; `read`: read-replica pool and the number of
+    clients currently pinned to the primary after a write.
+    """
+    return {
+        "config": {
+            "pool_size": DB_POOL_SIZE,
+            "max_overflow": DB_MAX_OVERFLOW,
+            "pool_timeout_s": DB_POOL_TIMEOUT,
+            "pool_recycle_s": DB_POOL_RECYCLE,
+            "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+            "statement_timeout_ms": DB_STATEMENT_TIMEOUT_MS,
+        },
+        **pool_metrics.snapshot(engine),
+        "read": {
+            "config": {
+                "host": DB_READ_HOST,
+                "pool_size": DB_READ_POOL_SIZE,
+                "max_overflow": DB_READ_MAX_OVERFLOW,
+                "read_your_writes_window_s": READ_YOUR_WRITES_WINDOW_S,
+            },
+            "sticky_clients": len(primary_stickiness),
+            **read_pool_metrics.snapshot(read_engine),
+        },
+    }
+
+
+@router.get("/cache")
+async def get_cache_stats():
+    """
+    In-process caches of this worker, the change-notification listener that evicts them
+    and the SSE subscribers it feeds
+    Notification-evicted caches are bypassed while the listener is disconnected.
+    """
+    return {
+        "change_bus": change_bus.snapshot(),
+        "project_events": project_event_hub.snapshot(),
+        "caches": {
+            "tree": {"size": len(tree_cache), "hits": tree_cache.hits, "misses": tree_cache.misses},
+            **{
+                name: {"active": cache.active, "size": len(cache), "hits": cache.hits, "misses": cache.misses}
+                for name, cache in (
+                    ("project_ids_by_code", project_ids_by_code),
+                    ("tree_versions", tree_versions),
+                    ("dashboard", dashboard_cache),
+                )
+            },
+        },
+    }
+
+
+@router.get("/slow-queries")
+async def get_slow_queries(
+    limit: int = Query(20, ge=1, le=200, description="Number of fingerprints / recent entries"),
+    order: Literal["total_ms", "max_ms", "count"] = Query("total_ms", description="Ranking of offenders"),
+    include_plans: bool = Query(True, description="Include captured EXPLAIN plans"),
+):
+    """
+    Slow-query log since startup
+    `offenders`: statements over the threshold aggregated per fingerprint, worst first, with
+    the latest redacted binds and the latest sampled EXPLAIN (ANALYZE, BUFFERS) plan;
+    `recent`: the newest individual slow executions
+    """
+    def strip(item: dict) -> dict:
+        return item if include_plans else {k: v for k, v in item.items() if k != "plan"}
+
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "explain_sample": slow_query_log.explain_sample,
+        "offenders": [strip(s) for s in slow_query_log.top(limit, order)],
+        "recent": [strip(e) for e in list(slow_query_log.recent)[-limit:][::-1]],
+    }
+
+
+@router.delete("/slow-queries", status_code=204)
+async def clear_slow_queries():
+    """Reset the slow-query log (e.g. after deploying a fix)"""
+    slow_query_log.clear()
+    return None
@@ -0,0 +1,37 @@
+"""
+Prometheus scrape endpoint
+"""
+from fastapi import APIRouter, Response
+
+from app.core import metrics
+from app.core.database import engine, read_engine
+from app.core.pool_metrics import pool_metrics, read_pool_metrics
+
+router = APIRouter(tags=["internal"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """HTTP / DB metrics and connection pool gauges in Prometheus text format"""
+    pools = (("primary", pool_metrics.snapshot(engine)), ("read", read_pool_metrics.snapshot(read_engine)))
+    pool_lines = [
+        "# HELP masterplan_db_pool_connections Connection pool connections by state",
+        "# TYPE masterplan_db_pool_connections gauge",
+    ]
+    for name, pool in pools:
+        pool_lines += [
+            f'masterplan_db_pool_connections{{pool="{name}",state="checked_out"}} {pool["checked_out"]}',
+            f'masterplan_db_pool_connections{{pool="{name}",state="idle"}} {pool["idle"]}',
+            f'masterplan_db_pool_connections{{pool="{name}",state="overflow"}} {pool["overflow"]}',
+        ]
+    pool_lines += [
+        "# HELP masterplan_db_pool_checkout_timeouts_total Connection checkouts that timed out",
+        "# TYPE masterplan_db_pool_checkout_timeouts_total counter",
+    ]
+    pool_lines += [f'masterplan_db_pool_checkout_timeouts_total{{pool="{name}"}} {pool["checkout_timeouts"]}' for name, pool in pools]
+    pool_lines += [
+        "# HELP masterplan_db_pool_pre_ping_failures_total Pooled connections that failed pre-ping",
+        "# TYPE masterplan_db_pool_pre_ping_failures_total counter",
+    ]
+    pool_lines += [f'masterplan_db_pool_pre_ping_failures_total{{pool="{name}"}} {pool["pre_ping_failures"]}' for name, pool in pools]
+    return Response(content=metrics.render(pool_lines), media_type=metrics.PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,170 @@
+"""
+Project events API Router
+Server-Sent Events stream of a project's task / classification changes (id 기반)
+"""
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.database import AsyncSessionLocal
+from app.core.events import SSE_KEEPALIVE, project_event_hub, sse_event, sse_reset
+from app.core.query_budget import query_budget
+from app.settings import CHANGE_BUS_ENABLED, SSE_BACKLOG_LIMIT, SSE_HEARTBEAT_S, SSE_REPLAY_CONCURRENCY
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/projects", tags=["events"])
+
+SSE_RETRY_MS = 3000
+
+# Project existence + its latest change id (stream position for clients without Last-Event-ID)
+PROJECT_LAST_CHANGE_QUERY = text("""
+    SELECT p.id,
+           (SELECT MAX(c.id) FROM project_change_log c WHERE c.project_id = p.id) AS last_change_id
+    FROM projects p
+    WHERE p.id = :project_id
+""")
+
+CHANGES_AFTER_QUERY = text("""
+    SELECT id, project_id, entity, op, entity_ids, row_count, created_at
+    FROM project_change_log
+    WHERE project_id = :project_id AND id > :after_id
+    ORDER BY id
+    LIMIT :limit
+""")
+
+# 보존 기간이 지나 삭제된 구간이 있는지 판단 (가장 오래 남아 있는 id, 지금까지 발급된 마지막 id)
+# 로그가 모두 삭제되어 MIN(id) 가 NULL 이어도 시퀀스 값으로 누락 여부를 알 수 있음
+CHANGE_LOG_BOUNDS_QUERY = text("""
+    SELECT
+        (SELECT MIN(id) FROM project_change_log) AS oldest_id,
+        (SELECT CASE WHEN is_called THEN last_value ELSE 0 END FROM project_change_log_id_seq) AS last_issued_id
+""")
+
+
+async def _replay(project_id: int, after_id: int):
+    """
+    Changes after `after_id` from project_change_log, or None when they cannot all be replayed
+    (pruned by retention or more than SSE_BACKLOG_LIMIT); read on the primary, where the
+    notifications come from, so a lagging replica cannot hide committed events.
+    """
+    async with AsyncSessionLocal() as session:
+        rows = (await session.execute(CHANGES_AFTER_QUERY, {
+            "project_id": project_id, "after_id": after_id, "limit": SSE_BACKLOG_LIMIT + 1,
+        })).mappings().all()
+        bounds = (await session.execute(CHANGE_LOG_BOUNDS_QUERY)).mappings().first()
+        oldest, last_issued = bounds["oldest_id"], bounds["last_issued_id"]
+        if oldest is None:
+            # 로그가 비어 있음: after_id 이후 발급된 id 가 있었다면 모두 삭제된 것
+            pruned = after_id < last_issued
+        else:
+            pruned = after_id < oldest - 1
+        if len(rows) > SSE_BACKLOG_LIMIT or pruned:
+            last = (await session.execute(PROJECT_LAST_CHANGE_QUERY, {"project_id": project_id})).mappings().first()
+            return None, (last["last_change_id"] if last else None) or max(after_id, last_issued)
+    return rows, None
+
+
+# 진행 중인 재조회 (project_id, after_id) → Task: 같은 위치의 구독자는 한 번의 조회 결과를 공유
+_replays: Dict[Tuple[int, int], "asyncio.Task[Tuple[Any, Any]]"] = {}
+# 동시에 DB 를 읽는 재조회 수 상한 (리스너 재연결 시 모든 구독자가 한꺼번에 catch-up)
+_replay_slots = asyncio.Semaphore(SSE_REPLAY_CONCURRENCY)
+
+
+async def _limited_replay(project_id: int, after_id: int):
+    async with _replay_slots:
+        return await _replay(project_id, after_id)
+
+
+async def _shared_replay(project_id: int, after_id: int):
+    """_replay, run once per (project, position) however many subscribers wait for it"""
+    key = (project_id, after_id)
+    task = _replays.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_limited_replay(project_id, after_id))
+        _replays[key] = task
+        task.add_done_callback(lambda _: _replays.pop(key, None))
+    # 한 구독자의 연결 종료가 공유 조회를 취소하지 않도록 shield
+    return await asyncio.shield(task)
+
+
+async def _event_stream(project_id: int, last_id: int) -> AsyncIterator[bytes]:
+    sub = project_event_hub.subscribe(project_id)
+    # 구독 후 항상 last_id 부터 DB 를 다시 읽음: 핸들러에서 last_change_id 를 읽은 뒤 구독 전까지
+    # 커밋된 이벤트는 큐에 없으므로 재조회로만 받을 수 있음 (중복은 id 로 제거)
+    sub.catch_up = True
+    try:
+        yield f"retry: {SSE_RETRY_MS}\n\n".encode()
+        while True:
+            if sub.catch_up:
+                sub.catch_up = False
+                while not sub.queue.empty():
+                    sub.queue.get_nowait()
+                try:
+                    rows, reset_to = await _shared_replay(project_id, last_id)
+                except (SQLAlchemyError, OSError, asyncio.TimeoutError):
+                    # 풀 고갈/DB 장애: 연결을 끊지 않고 reset 으로 다시 받아오게 함
+                    logger.warning("SSE replay failed for project %s", project_id, exc_info=True)
+                    rows, reset_to = None, last_id
+                if rows is None:
+                    last_id = reset_to
+                    yield sse_reset(last_id)
+                    continue
+                for row in rows:
+                    last_id = row["id"]
+                    yield sse_event(row)
+                continue
+
+            try:
+                change = await asyncio.wait_for(sub.queue.get(), SSE_HEARTBEAT_S)
+            except asyncio.TimeoutError:
+                yield SSE_KEEPALIVE
+                continue
+            if change is None or change["id"] <= last_id:
+                continue
+            last_id = change["id"]
+            yield sse_event(change)
+    finally:
+        project_event_hub.unsubscribe(sub)
+
+
+@router.get("/{project_id}/events")
+@query_budget(1)
+async def stream_project_events(
+    project_id: int,
+    last_event_id: Optional[int] = Header(None, ge=0, description="Resume after this change id (sent by EventSource on reconnect)"),
+    after: Optional[int] = Query(None, ge=0, description="Resume after this change id (for clients that cannot set headers)"),
+):
+    """
+    Server-Sent Events stream of a project's task and classification changes
+    Each event is one changed entity set: `event: task|classification`, `id: <change id>`,
+    data {id, project_id, entity, op (insert|update|delete), entity_ids (null when more than
+    200 rows changed), row_count, created_at}. Change ids increase monotonically per project,
+    so reconnecting with Last-Event-ID replays exactly the missed events. `event: reset`
+    means the missed events are gone (retention / too many): refetch, then keep listening.
+    Idle streams hold no DB connection; a `: keepalive` comment is sent every SSE_HEARTBEAT_S.
+    Catch-up reads are shared by subscribers at the same position and at most
+    SSE_REPLAY_CONCURRENCY run at once; if one fails (e.g. pool exhausted) the stream
+    gets `reset` instead of being dropped.
+    """
+    if not CHANGE_BUS_ENABLED:
+        raise HTTPException(status_code=503, detail="Change notifications are disabled (CHANGE_BUS_ENABLED)")
+
+    # 스트림 동안 풀 연결을 점유하지 않도록 의존성 세션 대신 짧은 세션 사용
+    async with AsyncSessionLocal() as session:
+        project = (await session.execute(PROJECT_LAST_CHANGE_QUERY, {"project_id": project_id})).mappings().first()
+    if not project:
+        raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
+
+    resume_from = last_event_id if last_event_id is not None else after
+    last_id = resume_from if resume_from is not None else project["last_change_id"] or 0
+
+    return StreamingResponse(
+        _event_stream(project_id, last_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,192 @@
+"""
+Project-scoped Tasks API Router
+Bulk import / streaming export of a project's tasks (id 기반)
+"""
+from typing import AsyncIterator, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.database import get_read_db, get_write_db
+from app.core.query_budget import query_budget
+from app.models.task import TaskImportResult
+from app.services.task_export import (
+    EXPORT_BATCH_SIZE, EXPORT_MEDIA_TYPES, csv_chunk, csv_header, ndjson_chunk,
+)
+from app.services.task_import import (
+    IMPORT_COLUMNS, TaskImportCollector, detect_format, iter_csv_rows, iter_lines, iter_ndjson_rows,
+)
+
+router = APIRouter(prefix="/projects", tags=["tasks"])
+
+EXPORT_QUERY = text("""
+    SELECT
+        id, project_id, classification_id, title, description, status,
+        baseline_start, baseline_end, actual_start_date, actual_end_date,
+        created_at, updated_at
+    FROM tasks
+    WHERE project_id = :project_id
+    ORDER BY id
+""")
+
+
+async def _export_chunks(bind: AsyncEngine, project_id: int, body_format: str) -> AsyncIterator[bytes]:
+    """
+    Stream a project's tasks through a server-side cursor, one chunk per batch
+    Runs on its own session (same engine as the request's read session): the response
+    body is produced after the endpoint has returned.
+    """
+    encode = csv_chunk if body_format == "csv" else ndjson_chunk
+    async with AsyncSession(bind, expire_on_commit=False) as session:
+        result = await session.stream(
+            EXPORT_QUERY, {"project_id": project_id},
+            execution_options={"yield_per": EXPORT_BATCH_SIZE},
+        )
+        if body_format == "csv":
+            yield csv_header()
+        async for batch in result.mappings().partitions():
+            yield encode(batch)
+
+
+@router.post("/{project_id}/tasks:bulk", response_model=TaskImportResult)
+@query_budget(4)
+async def bulk_import_tasks(
+    project_id: int,
+    request: Request,
+    format: Optional[Literal["csv", "ndjson"]] = Query(None, description="Body format (default: from Content-Type)"),
+    all_or_nothing: bool = Query(False, description="Insert nothing if any row fails"),
+    db: AsyncSession = Depends(get_write_db),
+):
+    """
+    Bulk import tasks from CSV (header row) or NDJSON
+    Rows are validated with TaskCreate while the body streams into a temp table via COPY,
+    classification membership is checked with one set-based join, and all valid rows
+    are inserted with a single INSERT ... SELECT
+    """
+    body_format = format or detect_format(request.headers.get("content-type"))
+    if body_format is None:
+        raise HTTPException(
+            status_code=415,
+            detail="Unsupported body format. Use Content-Type text/csv or application/x-ndjson, or ?format=csv|ndjson",
+        )
+
+    # Verify project exists
+    project_check = text("SELECT id FROM projects WHERE id = :project_id")
+    project_result = await db.execute(project_check, {"project_id": project_id})
+    if not project_result.first():
+        raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
+
+    await db.execute(text("""
+        CREATE TEMP TABLE tmp_task_import (
+            row_no            INT PRIMARY KEY,
+            classification_id BIGINT NOT NULL,
+            title             TEXT NOT NULL,
+            description       TEXT,
+            status            TEXT NOT NULL,
+            baseline_start    TIMESTAMPTZ,
+            baseline_end      TIMESTAMPTZ,
+            actual_start_date DATE,
+            actual_end_date   DATE
+        ) ON COMMIT DROP
+    """))
+
+    # COPY (binary) on the session's own connection/transaction
+    collector = TaskImportCollector(project_id)
+    lines = iter_lines(request.stream())
+    rows = iter_csv_rows(lines) if body_format == "csv" else iter_ndjson_rows(lines)
+    try:
+        connection = await db.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            "tmp_task_import", records=collector.records(rows), columns=IMPORT_COLUMNS,
+        )
+    except UnicodeDecodeError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Body must be UTF-8 encoded")
+
+    # Set-based classification check (same rule as POST /tasks)
+    invalid_q = text("""
+        SELECT i.row_no, i.classification_id
+        FROM tmp_task_import i
+        LEFT JOIN classifications c
+          ON c.id = i.classification_id
+         AND c.project_id = :project_id
+         AND c.is_active = TRUE
+        WHERE c.id IS NULL
+        ORDER BY i.row_no
+    """)
+    for r in (await db.execute(invalid_q, {"project_id": project_id})).mappings():
+        collector.add_error(r["row_no"], [{
+            "type": "not_found",
+            "loc": ["classification_id"],
+            "msg": f"Classification {r['classification_id']} not found or inactive for project {project_id}",
+        }])
+    collector.errors.sort(key=lambda e: e["row"])
+
+    if all_or_nothing and collector.failed:
+        await db.rollback()
+        return JSONResponse(status_code=422, content={
+            "project_id": project_id,
+            "received": collector.received,
+            "inserted": 0,
+            "failed": collector.failed,
+            "task_ids": [],
+            "errors": collector.errors,
+        })
+
+    insert_q = text("""
+        INSERT INTO tasks (
+            project_id, classification_id, title, description, status,
+            baseline_start, baseline_end, actual_start_date, actual_end_date,
+            created_at, updated_at
+        )
+        SELECT
+            :project_id, i.classification_id, i.title, i.description, i.status,
+            i.baseline_start, i.baseline_end, i.actual_start_date, i.actual_end_date,
+            now(), now()
+        FROM tmp_task_import i
+        INNER JOIN classifications c
+          ON c.id = i.classification_id
+         AND c.project_id = :project_id
+         AND c.is_active = TRUE
+        ORDER BY i.row_no
+        RETURNING id
+    """)
+    task_ids = list((await db.execute(insert_q, {"project_id": project_id})).scalars())
+    await db.commit()
+
+    return {
+        "project_id": project_id,
+        "received": collector.received,
+        "inserted": len(task_ids),
+        "failed": collector.failed,
+        "task_ids": task_ids,
+        "errors": collector.errors,
+    }
+
+
+@router.get("/{project_id}/tasks/export")
+@query_budget(2)
+async def export_tasks(
+    project_id: int,
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Export format"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Export every task of a project as NDJSON or CSV (ordered by id)
+    Rows are fetched with a server-side cursor and streamed batch by batch, so memory stays
+    flat regardless of project size and the first bytes go out after the first batch.
+    The CSV header matches the bulk import columns, so an export can be re-imported.
+    """
+    # Verify project exists (404 before the stream starts)
+    project_check = text("SELECT id FROM projects WHERE id = :project_id")
+    project_result = await db.execute(project_check, {"project_id": project_id})
+    if not project_result.first():
+        raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
+
+    return StreamingResponse(
+        _export_chunks(db.bind, project_id, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="project-{project_id}-tasks.{format}"'},
+    )
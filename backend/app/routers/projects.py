@@ -2,38 +2,59 @@
 Projects CRUD API Router
 Based on actual schema: projects table
 """
-from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional, List, Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_read_db, get_write_db
+from app.core.query_budget import query_budget
+from app.core.pagination import NEXT_CURSOR_HEADER, sort_keys, order_by_clause, encode_cursor, decode_cursor, keyset_condition
+from app.core.responses import rows_response
 from app.models.project import ProjectCreate, ProjectUpdate, ProjectOut
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
 @router.get("", response_model=List[ProjectOut])
+@query_budget(1)
 async def list_projects(
+    response: Response,
     q: Optional[str] = Query(None, description="Search query (searches in name, code, customer_name, customer_code)"),
+    search_mode: Literal["trgm", "fts"] = Query("trgm", description="Search mode: trgm (substring, pg_trgm index, default) or fts (word match, tsvector index)"),
     status: Optional[str] = Query(None, description="Filter by status (pending, in_progress, paused, done)"),
     limit: int = Query(50, ge=1, le=200, description="Limit (max 200)"),
     offset: int = Query(0, ge=0, description="Offset"),
-    sort: str = Query("updated_at desc", description="Sort order (default: updated_at desc)"),
-    db: AsyncSession = Depends(get_db),
+    sort: str = Query("updated_at desc", description="Sort order (default: updated_at desc, 'relevance' when searching)"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header (offset is ignored)"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     List projects with filtering, searching, and pagination
+    A full page sets X-Next-Cursor; pass it back as `cursor` to fetch the next page with one index seek
     """
     # Build WHERE clause
     conditions = []
     params = {}
 
+    rank_expr = None
     if q:
-        conditions.append("""
-            (name ILIKE :q OR code ILIKE :q OR customer_name ILIKE :q OR customer_code ILIKE :q)
-        """)
-        params["q"] = f"%{q}%"
+        if search_mode == "fts":
+            conditions.append("search_tsv @@ plainto_tsquery('simple', :q_text)")
+            rank_expr = "ts_rank(search_tsv, plainto_tsquery('simple', :q_text))"
+            params["q_text"] = q
+        else:
+            # pg_trgm GIN 인덱스(ix_projects_*_trgm) 4개의 BitmapOr 로 처리
+            conditions.append("""
+                (name ILIKE :q OR code ILIKE :q OR customer_name ILIKE :q OR customer_code ILIKE :q)
+            """)
+            rank_expr = """GREATEST(
+                word_similarity(:q_text, name),
+                word_similarity(:q_text, COALESCE(code, '')),
+                word_similarity(:q_text, COALESCE(customer_name, '')),
+                word_similarity(:q_text, COALESCE(customer_code, ''))
+            )"""
+            params["q"] = f"%{q}%"
 
     if status:
         # Validate status enum
@@ -48,12 +69,30 @@ async def list_projects(
     # Validate sort (prevent SQL injection)
     allowed_sort_columns = ["id", "code", "name", "status", "ordered_at", "paused_at", "completed_at", "due_at", "created_at", "updated_at"]
     sort_parts = sort.lower().split()
+    relevance = rank_expr is not None and sort_parts == ["relevance"]
     if len(sort_parts) != 2 or sort_parts[0] not in allowed_sort_columns:
         sort = "updated_at desc"
     else:
         sort_dir = sort_parts[1] if sort_parts[1] in ["asc", "desc"] else "desc"
         sort = f"{sort_parts[0]} {sort_dir}"
 
+    # id tie-breaker → 정렬이 항상 유일하므로 페이지 간 중복/누락 없음
+    keys = sort_keys(sort)
+    order_sql = order_by_clause(keys)
+    if relevance:
+        if cursor:
+            raise HTTPException(status_code=400, detail="cursor is not supported with sort=relevance")
+        order_sql = f"{rank_expr} DESC, id DESC"
+        params["q_text"] = q
+    if cursor:
+        keyset_sql, keyset_params = keyset_condition(
+            keys, decode_cursor(cursor, keys),
+            nullable={"code", "ordered_at", "paused_at", "completed_at", "due_at"},
+        )
+        where_clause = f"{where_clause} AND {keyset_sql}"
+        params.update(keyset_params)
+        offset = 0
+
     # Build query
     query = text(f"""
         SELECT 
@@ -62,7 +101,7 @@ async def list_projects(
             created_at, updated_at
         FROM projects
         WHERE {where_clause}
-        ORDER BY {sort}
+        ORDER BY {order_sql}
         LIMIT :limit OFFSET :offset
     """)
     params.update({"limit": limit, "offset": offset})
@@ -70,13 +109,17 @@ async def list_projects(
     result = await db.execute(query, params)
     rows = result.mappings().all()
 
-    return [ProjectOut(**dict(row)) for row in rows]
+    if len(rows) == limit and not relevance:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(keys, rows[-1])
+
+    return rows_response(rows, ProjectOut, response)
 
 
 @router.get("/{project_id}", response_model=ProjectOut)
+@query_budget(1)
 async def get_project(
     project_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get a single project by ID
@@ -99,9 +142,10 @@ async def get_project(
 
 
 @router.post("", response_model=ProjectOut, status_code=201)
+@query_budget(2)
 async def create_project(
     project: ProjectCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ):
     """
     Create a new project
@@ -146,10 +190,11 @@ async def create_project(
 
 
 @router.patch("/{project_id}", response_model=ProjectOut)
+@query_budget(3)
 async def update_project(
     project_id: int,
     project_update: ProjectUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ):
     """
     Update a project (partial update)
@@ -230,9 +275,10 @@ async def update_project(
 
 
 @router.delete("/{project_id}", status_code=204)
+@query_budget(2)
 async def delete_project(
     project_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ):
     """
     Delete a project (hard delete)
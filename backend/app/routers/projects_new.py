@@ -1,17 +1,53 @@
-from fastapi import APIRouter, Depends, HTTPException
+import time
+from typing import Optional, Tuple
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from pathlib import Path
+from app.core.cache import project_ids_by_code, tree_cache, tree_versions, tree_etag, etag_matches
+from app.core.database import get_read_db
+from app.core.query_budget import query_budget
+from app.core.queries import queries
 import json
 
 router = APIRouter(prefix="/projects", tags=["projects-new"])
 
-# SQL 파일 경로 (프로젝트 루트 기준)
-SQL_DIR = Path(__file__).parent.parent.parent.parent / "db" / "sql" / "queries"
+# db/sql/queries/*.sql — 시작 시 로드 (파일이 없으면 서버 기동 실패)
+TREE_JSON_QUERY = "classification_tree_json"
+FLAT_3LEVELS_QUERY = "classification_flat_3levels"
+queries.require(TREE_JSON_QUERY, FLAT_3LEVELS_QUERY)
+
+# 프로젝트 존재 확인 + 분류 트리 버전 (캐시/ETag 용, classifications 트리거가 증가시킴)
+PROJECT_BY_CODE_VERSION_QUERY = text("""
+    SELECT p.id, COALESCE(v.version, 0) AS version
+    FROM projects p
+    LEFT JOIN classification_tree_versions v ON v.project_id = p.id
+    WHERE p.code = :code
+""")
+
+
+async def _project_tree_version(db: AsyncSession, code: str) -> Optional[Tuple[int, int]]:
+    """(project id, tree version) by code; served from the notification-evicted caches when possible"""
+    started = time.monotonic()
+    project_id = project_ids_by_code.get(code)
+    version = tree_versions.get(project_id) if project_id is not None else None
+    if version is not None:
+        return project_id, version
+
+    project = (await db.execute(PROJECT_BY_CODE_VERSION_QUERY, {"code": code})).mappings().first()
+    if not project:
+        return None
+    project_ids_by_code.set(code, project["id"], started)
+    tree_versions.set(project["id"], project["version"], started)
+    return project["id"], project["version"]
+
+
+def _json_bytes(content) -> bytes:
+    # Starlette JSONResponse 와 동일한 직렬화
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
 
 @router.get("")
-async def list_projects(db: AsyncSession = Depends(get_db)):
+@query_budget(1)
+async def list_projects(db: AsyncSession = Depends(get_read_db)):
     """프로젝트 목록 조회 (프론트엔드 호환: erp_project_key, project_name)"""
     q = text("""
         SELECT 
@@ -25,32 +61,35 @@ async def list_projects(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/{project_code}/classifications/tree")
+@query_budget(2)
 async def get_classification_tree(
     project_code: str,
-    db: AsyncSession = Depends(get_db)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """분류 트리 조회 (JSON 형태)"""
+    """분류 트리 조회 (JSON 형태, /classifications/tree 와 같은 버전 캐시/ETag 사용)"""
     # 프로젝트 코드 변환 (erp_project_key 형식 지원: "HB-130X(#1035)" -> "HB-130X-1035")
     # 프론트엔드에서 erp_project_key를 사용하므로 code로 변환 필요
     code = project_code.replace("(#", "-").replace(")", "")
     
-    # 프로젝트 존재 확인
-    project_check = text("SELECT id FROM projects WHERE code = :code")
-    project_result = await db.execute(project_check, {"code": code})
-    project = project_result.first()
-    
+    # 프로젝트 존재 확인 + 트리 버전
+    project = await _project_tree_version(db, code)
     if not project:
         raise HTTPException(status_code=404, detail=f"Project '{project_code}' not found")
+
+    project_id, version = project
+    etag = tree_etag("legacy-tree", project_id, version)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    cache_key = ("legacy-tree", project_id)
+    body = tree_cache.get(cache_key, version)
+    if body is not None:
+        return Response(content=body, media_type="application/json", headers=headers)
     
-    # SQL 파일 읽기
-    sql_file = SQL_DIR / "classification_tree_json.sql"
-    if not sql_file.exists():
-        raise HTTPException(status_code=500, detail="SQL file not found")
-    
-    sql_query = sql_file.read_text(encoding="utf-8")
-    
-    # 쿼리 실행 (변환된 code 사용)
-    result = await db.execute(text(sql_query), {"project_code": code})
+    # 쿼리 실행 (시작 시 로드된 SQL, 변환된 code 사용)
+    result = await db.execute(queries.get(TREE_JSON_QUERY), {"project_code": code})
     rows = result.mappings().all()
     
     # 트리 구조로 변환
@@ -97,39 +136,44 @@ async def get_classification_tree(
             if parent_id in l2_map:
                 l2_map[parent_id]["children"].append(node)
     
-    return tree
+    body = _json_bytes(tree)
+    tree_cache.set(cache_key, version, body)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/{project_code}/classifications/flat")
+@query_budget(2)
 async def get_classification_flat(
     project_code: str,
-    db: AsyncSession = Depends(get_db)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """분류 평면 리스트 조회"""
+    """분류 평면 리스트 조회 (/classifications/tree 와 같은 버전 캐시/ETag 사용)"""
     # 프로젝트 코드 변환
     code = project_code.replace("(#", "-").replace(")", "")
     
-    # 프로젝트 존재 확인
-    project_check = text("SELECT id FROM projects WHERE code = :code")
-    project_result = await db.execute(project_check, {"code": code})
-    project = project_result.first()
-    
+    # 프로젝트 존재 확인 + 트리 버전
+    project = await _project_tree_version(db, code)
     if not project:
         raise HTTPException(status_code=404, detail=f"Project '{project_code}' not found")
+
+    project_id, version = project
+    etag = tree_etag("legacy-flat", project_id, version)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    cache_key = ("legacy-flat", project_id)
+    body = tree_cache.get(cache_key, version)
+    if body is not None:
+        return Response(content=body, media_type="application/json", headers=headers)
     
-    # SQL 파일 읽기
-    sql_file = SQL_DIR / "classification_flat_3levels.sql"
-    if not sql_file.exists():
-        raise HTTPException(status_code=500, detail="SQL file not found")
-    
-    sql_query = sql_file.read_text(encoding="utf-8")
-    
-    # 쿼리 실행 (변환된 code 사용)
-    result = await db.execute(text(sql_query), {"project_code": code})
+    # 쿼리 실행 (시작 시 로드된 SQL, 변환된 code 사용)
+    result = await db.execute(queries.get(FLAT_3LEVELS_QUERY), {"project_code": code})
     rows = result.mappings().all()
     
     # API 계약서에 맞게 필드명 변경 (l1_name -> l1 등)
-    return [
+    flat = [
         {
             "l1": r["l1_name"],
             "l2": r["l2_name"],
@@ -140,3 +184,7 @@ async def get_classification_flat(
         for r in rows
     ]
 
+    body = _json_bytes(flat)
+    tree_cache.set(cache_key, version, body)
+    return Response(content=body, media_type="application/json", headers=headers)
+
@@ -1,12 +1,17 @@
 from datetime import date
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_read_db, get_write_db
+from app.core.query_budget import query_budget
 from app.core.deps import get_current_user_id
+from app.models.schedule import ScheduleOut
+from app.routers.classifications import CLASSIFICATION_TREE_QUERY, TASK_PROGRESS_QUERY
+from app.services.progress import rollup_progress
+from app.services.schedule import build_date_axis, build_schedule_rows, month_spans
 
 router = APIRouter(prefix="/projects", tags=["schedules"])
 
@@ -23,8 +28,63 @@ class UpdateActualBody(BaseModel):
     memo: Optional[str] = None    
 
 
+@router.get("/{project_id}/schedule", response_model=ScheduleOut, response_model_exclude_unset=True)
+@query_budget(4)
+async def get_project_schedule(
+    project_id: int,
+    progress: bool = Query(False, description="Add each row's subtree task progress (closed/total/percent, dates)"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Gantt schedule for a project (docs/schedule_design.md)
+    Returns the date axis, month header colspans and tree-ordered rows with
+    lane-assigned PLAN/ACTUAL bars and row heights
+    With progress=true each row also carries its subtree progress (same rollup as the tree)
+    """
+    project_q = text("SELECT id, ordered_at FROM projects WHERE id = :project_id")
+    project = (await db.execute(project_q, {"project_id": project_id})).mappings().first()
+    if not project:
+        raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
+
+    nodes = (await db.execute(CLASSIFICATION_TREE_QUERY, {"project_id": project_id})).mappings().all()
+
+    # 모든 날짜 비교는 date 단위 (timestamptz → date)
+    tasks_q = text("""
+        SELECT
+            t.id, t.classification_id, t.title, t.status,
+            t.baseline_start::date AS plan_start,
+            t.baseline_end::date AS plan_end,
+            t.actual_start_date, t.actual_end_date
+        FROM tasks t
+        WHERE t.project_id = :project_id
+          AND (t.baseline_start IS NOT NULL OR t.baseline_end IS NOT NULL)
+    """)
+    tasks = (await db.execute(tasks_q, {"project_id": project_id})).mappings().all()
+
+    max_end = max((t["plan_end"] or t["plan_start"] for t in tasks), default=None)
+    start, end = build_date_axis(project["ordered_at"], max_end)
+
+    rows = build_schedule_rows(nodes, tasks, start, end)
+    if progress:
+        counts = (await db.execute(TASK_PROGRESS_QUERY, {"project_id": project_id})).mappings().all()
+        rollup = rollup_progress(nodes, counts)
+        # progress 를 요청하지 않으면 행에 키가 없어 응답에서 빠짐 (response_model_exclude_unset)
+        for row in rows:
+            row["progress"] = rollup[row["classification_id"]]
+
+    return {
+        "project_id": project_id,
+        "start_date": start,
+        "end_date": end,
+        "day_count": (end - start).days + 1,
+        "months": month_spans(start, end),
+        "rows": rows,
+    }
+
+
 @router.get("/{project_code}/items")
-async def list_project_items(project_code: str, db: AsyncSession = Depends(get_db)):
+@query_budget(2)
+async def list_project_items(project_code: str, db: AsyncSession = Depends(get_read_db)):
     """프로젝트의 작업 목록 조회 (새 스키마: projects, classifications, tasks)"""
     # 프로젝트 코드 변환 (erp_project_key 형식 지원: "HB-130X(#1035)" -> "HB-130X-1035")
     code = project_code.replace("(#", "-").replace(")", "")
@@ -67,11 +127,12 @@ async def list_project_items(project_code: str, db: AsyncSession = Depends(get_d
 
 
 @router.post("/{project_code}/items")
+@query_budget(4)
 async def create_item_with_baseline(
     project_code: str,  # erp_project_key -> project_code
     body: CreateItemBody,
     user_id: str = Depends(get_current_user_id),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ):
     """작업 생성 (새 스키마: projects, classifications, tasks)"""
     # 프로젝트 코드 변환
@@ -157,11 +218,12 @@ async def create_item_with_baseline(
     }
 
 @router.put("/items/{item_id}/actual")
+@query_budget(2)
 async def upsert_actual(
     item_id: int,
     body: UpdateActualBody,
     user_id: str = Depends(get_current_user_id),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ):
     """작업 실제 일정 업데이트 (새 스키마: tasks)"""
     # 간단 검증: 종료일이 있으면 시작일보다 빠를 수 없음
@@ -0,0 +1,227 @@
+"""
+Task Dependencies API Router
+Predecessor links between a project's tasks and the CPM critical path (id 기반)
+"""
+from datetime import date, timedelta
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_read_db, get_write_db
+from app.core.locks import TASK_DEPENDENCIES_LOCK, lock_project
+from app.core.query_budget import query_budget
+from app.core.responses import json_response, rows_response
+from app.models.dependency import (
+    CriticalPathOut, TaskDependencyBulkCreate, TaskDependencyOut,
+)
+from app.services.cpm import CycleError, compute_cpm, find_cycle
+
+router = APIRouter(prefix="/projects", tags=["dependencies"])
+
+DEPENDENCY_COLUMNS = "id, project_id, predecessor_id, successor_id, type, lag_days, created_at"
+
+PROJECT_CHECK_QUERY = text("SELECT id, ordered_at FROM projects WHERE id = :project_id")
+
+PROJECT_LINKS_QUERY = text("""
+    SELECT predecessor_id, successor_id, type, lag_days
+    FROM task_dependencies
+    WHERE project_id = :project_id
+""")
+
+
+@router.get("/{project_id}/dependencies", response_model=List[TaskDependencyOut])
+@query_budget(2)
+async def list_dependencies(
+    project_id: int,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """List a project's task dependency links (ordered by id)"""
+    if not (await db.execute(PROJECT_CHECK_QUERY, {"project_id": project_id})).first():
+        raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
+
+    query = text(f"""
+        SELECT {DEPENDENCY_COLUMNS}
+        FROM task_dependencies
+        WHERE project_id = :project_id
+        ORDER BY id
+    """)
+    rows = (await db.execute(query, {"project_id": project_id})).mappings().all()
+    return rows_response(rows, TaskDependencyOut)
+
+
+@router.post("/{project_id}/dependencies", response_model=List[TaskDependencyOut], status_code=201)
+@query_budget(6)
+async def create_dependencies(
+    project_id: int,
+    payload: TaskDependencyBulkCreate,
+    db: AsyncSession = Depends(get_write_db),
+):
+    """
+    Add predecessor links between tasks of a project (all or nothing)
+    Both tasks must belong to the project; a pair may be linked only once. The new links are
+    checked together with the existing ones and a cycle is rejected with 422 naming it.
+    The check runs once over the whole graph (per-row trigger checks are bypassed) while the
+    project's dependency lock is held, so concurrent requests cannot close a cycle.
+    """
+    if not (await db.execute(PROJECT_CHECK_QUERY, {"project_id": project_id})).first():
+        raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
+
+    # 같은 프로젝트의 관계 추가를 직렬화 (023 트리거와 같은 lock)
+    await lock_project(db, TASK_DEPENDENCIES_LOCK, project_id)
+
+    links = payload.links
+    task_ids = sorted({l.predecessor_id for l in links} | {l.successor_id for l in links})
+    task_check = text("""
+        SELECT id FROM tasks
+        WHERE project_id = :project_id AND id = ANY(CAST(:ids AS bigint[]))
+    """)
+    found = set((await db.execute(task_check, {"project_id": project_id, "ids": task_ids})).scalars())
+    missing = [tid for tid in task_ids if tid not in found]
+    if missing:
+        raise HTTPException(status_code=422, detail=f"Tasks not found in project {project_id}: {missing}")
+
+    existing = [
+        (r["predecessor_id"], r["successor_id"], r["type"], r["lag_days"])
+        for r in (await db.execute(PROJECT_LINKS_QUERY, {"project_id": project_id})).mappings()
+    ]
+    pairs = {(p, s) for p, s, _, _ in existing}
+    duplicates = []
+    for link in links:
+        pair = (link.predecessor_id, link.successor_id)
+        if pair in pairs:
+            duplicates.append(list(pair))
+        pairs.add(pair)
+    if duplicates:
+        raise HTTPException(status_code=409, detail=f"Links already exist (predecessor_id, successor_id): {duplicates}")
+
+    new_links = [(l.predecessor_id, l.successor_id, l.type, l.lag_days) for l in links]
+    graph = existing + new_links
+    cycle = find_cycle(sorted({t for p, s, _, _ in graph for t in (p, s)}), graph)
+    if cycle:
+        raise HTTPException(status_code=422, detail=f"Links would create a cycle: {' -> '.join(map(str, cycle))}")
+
+    await db.execute(text("SELECT set_config('masterplan.skip_dependency_cycle_check', 'on', true)"))
+    insert_query = text(f"""
+        INSERT INTO task_dependencies (project_id, predecessor_id, successor_id, type, lag_days)
+        SELECT :project_id, l.predecessor_id, l.successor_id, l.type, l.lag_days
+        FROM unnest(
+            CAST(:predecessor_ids AS bigint[]), CAST(:successor_ids AS bigint[]),
+            CAST(:types AS text[]), CAST(:lags AS int[])
+        ) WITH ORDINALITY AS l(predecessor_id, successor_id, type, lag_days, ord)
+        ORDER BY l.ord
+        RETURNING {DEPENDENCY_COLUMNS}
+    """)
+    try:
+        rows = (await db.execute(insert_query, {
+            "project_id": project_id,
+            "predecessor_ids": [l[0] for l in new_links],
+            "successor_ids": [l[1] for l in new_links],
+            "types": [l[2] for l in new_links],
+            "lags": [l[3] for l in new_links],
+        })).mappings().all()
+        await db.commit()
+    except IntegrityError:
+        # 확인 이후 task 가 삭제된 경우 등
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Tasks changed concurrently; no links were added")
+
+    rows = sorted(rows, key=lambda r: r["id"])
+    return rows_response(rows, TaskDependencyOut)
+
+
+@router.delete("/{project_id}/dependencies/{dependency_id}", status_code=204)
+@query_budget(1)
+async def delete_dependency(
+    project_id: int,
+    dependency_id: int,
+    db: AsyncSession = Depends(get_write_db),
+):
+    """Remove a dependency link"""
+    delete_query = text("""
+        DELETE FROM task_dependencies
+        WHERE id = :dependency_id AND project_id = :project_id
+    """)
+    result = await db.execute(delete_query, {"dependency_id": dependency_id, "project_id": project_id})
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail=f"Dependency {dependency_id} not found in project {project_id}")
+    await db.commit()
+    return None
+
+
+@router.get("/{project_id}/critical-path", response_model=CriticalPathOut)
+@query_budget(3)
+async def get_critical_path(
+    project_id: int,
+    critical_only: bool = Query(False, description="Return only the tasks with zero total float"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Critical path of a project (CPM forward/backward pass over all tasks and links)
+    Durations come from the baseline dates (inclusive days); tasks without both baseline
+    dates are scheduled as 0-day milestones and listed in `undated_task_ids`.
+    Day 0 is the earliest baseline start (else ordered_at, else today); every task starts
+    as early as its links allow, so early dates are the CPM schedule, not the baseline.
+    """
+    project = (await db.execute(PROJECT_CHECK_QUERY, {"project_id": project_id})).mappings().first()
+    if not project:
+        raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
+
+    # 모든 날짜 계산은 date 단위 (schedule 과 동일하게 timestamptz → date)
+    tasks_q = text("""
+        SELECT
+            id, title,
+            baseline_start::date AS plan_start,
+            (baseline_end::date - baseline_start::date + 1) AS duration_days
+        FROM tasks
+        WHERE project_id = :project_id
+        ORDER BY id
+    """)
+    tasks = (await db.execute(tasks_q, {"project_id": project_id})).all()
+    links = [tuple(r) for r in (await db.execute(PROJECT_LINKS_QUERY, {"project_id": project_id})).all()]
+
+    task_ids = [t.id for t in tasks]
+    durations = [max(t.duration_days or 0, 0) for t in tasks]
+    try:
+        cpm = compute_cpm(task_ids, durations, links)
+    except CycleError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    start = min(
+        (t.plan_start for t in tasks if t.duration_days is not None),
+        default=None,
+    ) or project["ordered_at"] or date.today()
+    day = [start + timedelta(days=d) for d in range(cpm["finish"] + 1)]
+    es, ef, ls, lf = cpm["es"], cpm["ef"], cpm["ls"], cpm["lf"]
+    total_float, free_float = cpm["total_float"], cpm["free_float"]
+
+    rows = []
+    for i, t in enumerate(tasks):
+        if critical_only and total_float[i] != 0:
+            continue
+        dur = durations[i]
+        rows.append({
+            "task_id": t.id,
+            "title": t.title,
+            "duration_days": dur,
+            "early_start": day[es[i]],
+            "early_finish": day[ef[i] - 1] if dur else day[es[i]],
+            "late_start": day[ls[i]],
+            "late_finish": day[lf[i] - 1] if dur else day[ls[i]],
+            "total_float": total_float[i],
+            "free_float": free_float[i],
+            "is_critical": total_float[i] == 0,
+        })
+
+    return json_response({
+        "project_id": project_id,
+        "start_date": start,
+        "finish_date": day[max(cpm["finish"] - 1, 0)],
+        "duration_days": cpm["finish"],
+        "task_count": len(tasks),
+        "dependency_count": len(links),
+        "critical_path": [task_ids[i] for i in cpm["critical_path"]],
+        "undated_task_ids": [t.id for t in tasks if t.duration_days is None],
+        "tasks": rows,
+    })
@@ -3,38 +3,59 @@ Tasks CRUD API Router
 Based on actual schema: tasks table
 """
 from datetime import date, datetime
-from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional, List, Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
 from sqlalchemy import text, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.models.task import TaskCreate, TaskUpdate, TaskOut
+from app.core.database import get_read_db, get_write_db
+from app.core.query_budget import query_budget
+from app.core.pagination import NEXT_CURSOR_HEADER, sort_keys, order_by_clause, encode_cursor, decode_cursor, keyset_condition
+from app.core.responses import rows_response
+from app.models.task import (
+    TaskCreate, TaskUpdate, TaskOut, TaskBatchUpdate, TaskBatchErrorResponse,
+    TaskBulkTransition, TaskBulkTransitionResult,
+)
+from app.services.task_batch import column_arrays, validate_items
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
 @router.get("", response_model=List[TaskOut])
+@query_budget(1)
 async def list_tasks(
+    response: Response,
     q: Optional[str] = Query(None, description="Search query (searches in title and description)"),
+    search_mode: Literal["trgm", "fts"] = Query("trgm", description="Search mode: trgm (substring, pg_trgm index, default) or fts (word match, tsvector index)"),
     status: Optional[str] = Query(None, description="Filter by status"),
     project_id: Optional[int] = Query(None, ge=1, description="Filter by project_id"),
     classification_id: Optional[int] = Query(None, ge=1, description="Filter by classification_id"),
     limit: int = Query(50, ge=1, le=200, description="Limit (max 200)"),
     offset: int = Query(0, ge=0, description="Offset"),
-    sort: str = Query("updated_at desc", description="Sort order (default: updated_at desc)"),
-    db: AsyncSession = Depends(get_db),
+    sort: str = Query("updated_at desc", description="Sort order (default: updated_at desc, 'relevance' when searching)"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header (offset is ignored)"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     List tasks with filtering, searching, and pagination
+    A full page sets X-Next-Cursor; pass it back as `cursor` to fetch the next page with one index seek
     """
     # Build WHERE clause
     conditions = []
     params = {}
 
+    rank_expr = None
     if q:
-        conditions.append("(t.title ILIKE :q OR t.description ILIKE :q)")
-        params["q"] = f"%{q}%"
+        if search_mode == "fts":
+            conditions.append("t.search_tsv @@ plainto_tsquery('simple', :q_text)")
+            rank_expr = "ts_rank(t.search_tsv, plainto_tsquery('simple', :q_text))"
+            params["q_text"] = q
+        else:
+            # pg_trgm GIN 인덱스(ix_tasks_title_trgm, ix_tasks_description_trgm)로 처리
+            conditions.append("(t.title ILIKE :q OR t.description ILIKE :q)")
+            rank_expr = "GREATEST(word_similarity(:q_text, t.title), word_similarity(:q_text, COALESCE(t.description, '')))"
+            params["q"] = f"%{q}%"
 
     if status:
         conditions.append("t.status = :status")
@@ -53,12 +74,29 @@ async def list_tasks(
     # Validate sort (prevent SQL injection)
     allowed_sort_columns = ["id", "title", "status", "created_at", "updated_at", "baseline_start", "baseline_end"]
     sort_parts = sort.lower().split()
+    relevance = rank_expr is not None and sort_parts == ["relevance"]
     if len(sort_parts) != 2 or sort_parts[0] not in allowed_sort_columns:
         sort = "updated_at desc"
     else:
         sort_dir = sort_parts[1] if sort_parts[1] in ["asc", "desc"] else "desc"
         sort = f"{sort_parts[0]} {sort_dir}"
 
+    # id tie-breaker → 정렬이 항상 유일하므로 페이지 간 중복/누락 없음
+    keys = sort_keys(sort)
+    order_sql = order_by_clause(keys, prefix="t.")
+    if relevance:
+        if cursor:
+            raise HTTPException(status_code=400, detail="cursor is not supported with sort=relevance")
+        order_sql = f"{rank_expr} DESC, t.id DESC"
+        params["q_text"] = q
+    if cursor:
+        keyset_sql, keyset_params = keyset_condition(
+            keys, decode_cursor(cursor, keys), nullable={"baseline_start", "baseline_end"}, prefix="t."
+        )
+        where_clause = f"{where_clause} AND {keyset_sql}"
+        params.update(keyset_params)
+        offset = 0
+
     # Build query (with project_name JOIN)
     query = text(f"""
         SELECT 
@@ -78,7 +116,7 @@ async def list_tasks(
         FROM tasks t
         INNER JOIN projects p ON p.id = t.project_id
         WHERE {where_clause}
-        ORDER BY t.{sort}
+        ORDER BY {order_sql}
         LIMIT :limit OFFSET :offset
     """)
     params.update({"limit": limit, "offset": offset})
@@ -86,13 +124,17 @@ async def list_tasks(
     result = await db.execute(query, params)
     rows = result.mappings().all()
 
-    return [TaskOut(**dict(row)) for row in rows]
+    if len(rows) == limit and not relevance:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(keys, rows[-1])
+
+    return rows_response(rows, TaskOut, response)
 
 
 @router.get("/{task_id}", response_model=TaskOut)
+@query_budget(1)
 async def get_task(
     task_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get a single task by ID
@@ -117,9 +159,10 @@ async def get_task(
 
 
 @router.post("", response_model=TaskOut, status_code=201)
+@query_budget(3)
 async def create_task(
     task: TaskCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ):
     """
     Create a new task
@@ -178,10 +221,11 @@ async def create_task(
 
 
 @router.patch("/{task_id}", response_model=TaskOut)
+@query_budget(3)
 async def update_task(
     task_id: int,
     task_update: TaskUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ):
     """
     Update a task (partial update)
@@ -271,10 +315,198 @@ async def update_task(
     return TaskOut(**dict(row))
 
 
+@router.patch(":batch", response_model=List[TaskOut], responses={422: {"model": TaskBatchErrorResponse}})
+@query_budget(2)
+async def batch_update_tasks(
+    payload: TaskBatchUpdate,
+    db: AsyncSession = Depends(get_write_db),
+):
+    """
+    Update many tasks at once (e.g. dragging a group of bars in the schedule)
+    Each item is a TaskUpdate plus `id`; omitted / null fields stay unchanged.
+    All items are checked first (fields, task existence, active classification of the
+    task's project) and the batch is applied all-or-nothing: any invalid item → 422 with
+    per-item errors. Valid batches run as one UPDATE ... FROM unnest(...) in one transaction.
+    Returns the updated tasks in request order.
+    """
+    index_of, items, errors = validate_items(payload.items)
+    arrays = column_arrays(items)
+
+    # 대상 task / 분류 존재 여부를 한 번에 확인 (분류는 task 의 프로젝트 소속 + 활성)
+    if items:
+        check_query = text("""
+            SELECT
+                i.id,
+                i.classification_id,
+                t.id IS NOT NULL AS task_exists,
+                (i.classification_id IS NULL OR c.id IS NOT NULL) AS classification_ok
+            FROM unnest(CAST(:ids AS bigint[]), CAST(:classification_ids AS bigint[])) AS i(id, classification_id)
+            LEFT JOIN tasks t ON t.id = i.id
+            LEFT JOIN classifications c
+              ON c.id = i.classification_id
+             AND c.project_id = t.project_id
+             AND c.is_active = TRUE
+        """)
+        check_rows = (await db.execute(check_query, {
+            "ids": arrays["ids"],
+            "classification_ids": arrays["classification_id"],
+        })).mappings().all()
+        for r in check_rows:
+            if not r["task_exists"]:
+                errors.append({"index": index_of[r["id"]], "id": r["id"], "errors": [
+                    {"type": "not_found", "loc": ["id"], "msg": f"Task {r['id']} not found"},
+                ]})
+            elif not r["classification_ok"]:
+                errors.append({"index": index_of[r["id"]], "id": r["id"], "errors": [{
+                    "type": "not_found",
+                    "loc": ["classification_id"],
+                    "msg": f"Classification {r['classification_id']} not found or inactive for the task's project",
+                }]})
+
+    if errors:
+        errors.sort(key=lambda e: e["index"])
+        return JSONResponse(status_code=422, content={
+            "detail": f"{len(errors)} of {len(payload.items)} items are invalid; nothing was updated",
+            "errors": errors,
+        })
+
+    # None 은 변경 없음 (TaskUpdate 와 동일) → COALESCE(새 값, 기존 값)
+    update_query = text("""
+        WITH v AS (
+            SELECT * FROM unnest(
+                CAST(:ids AS bigint[]), CAST(:title AS text[]), CAST(:description AS text[]),
+                CAST(:status AS text[]), CAST(:classification_id AS bigint[]),
+                CAST(:baseline_start AS timestamptz[]), CAST(:baseline_end AS timestamptz[]),
+                CAST(:actual_start_date AS date[]), CAST(:actual_end_date AS date[])
+            ) AS v(id, title, description, status, classification_id,
+                   baseline_start, baseline_end, actual_start_date, actual_end_date)
+        ),
+        updated AS (
+            UPDATE tasks t
+            SET
+                title = COALESCE(v.title, t.title),
+                description = COALESCE(v.description, t.description),
+                status = COALESCE(v.status, t.status),
+                classification_id = COALESCE(v.classification_id, t.classification_id),
+                baseline_start = COALESCE(v.baseline_start, t.baseline_start),
+                baseline_end = COALESCE(v.baseline_end, t.baseline_end),
+                actual_start_date = COALESCE(v.actual_start_date, t.actual_start_date),
+                actual_end_date = COALESCE(v.actual_end_date, t.actual_end_date),
+                updated_at = now()
+            FROM v
+            WHERE t.id = v.id
+            RETURNING t.id, t.project_id, t.classification_id, t.title, t.description, t.status,
+                t.baseline_start, t.baseline_end, t.actual_start_date, t.actual_end_date,
+                t.created_at, t.updated_at
+        )
+        SELECT 
+            u.id, u.project_id, p.name AS project_name, u.classification_id,
+            u.title, u.description, u.status,
+            u.baseline_start, u.baseline_end, u.actual_start_date, u.actual_end_date,
+            u.created_at, u.updated_at
+        FROM updated u
+        INNER JOIN projects p ON p.id = u.project_id
+    """)
+    rows = (await db.execute(update_query, arrays)).mappings().all()
+
+    # 확인 이후 동시 삭제된 task 가 있으면 전체 취소
+    if len(rows) != len(items):
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Some tasks were deleted concurrently; nothing was updated")
+    await db.commit()
+
+    rows = sorted(rows, key=lambda r: index_of[r["id"]])
+    return [TaskOut(**dict(row)) for row in rows]
+
+
+async def _bulk_transition(selector: TaskBulkTransition, to_status: str, db: AsyncSession) -> dict:
+    """
+    Set `to_status` on every selected task with one UPDATE
+    Tasks already in `to_status` are matched but not touched; the project_progress rollup
+    trigger is statement-level, so it runs once for the whole set.
+    """
+    params = {"to_status": to_status}
+
+    if selector.task_ids is not None:
+        condition = "t.id = ANY(CAST(:task_ids AS bigint[]))"
+        params["task_ids"] = selector.task_ids
+    elif selector.classification_id is not None:
+        # 분류 하위 트리 (id_path <@, GiST 인덱스)
+        class_check = text("SELECT id_path::text FROM classifications WHERE id = :classification_id")
+        id_path = (await db.execute(class_check, {"classification_id": selector.classification_id})).scalar()
+        if id_path is None:
+            raise HTTPException(status_code=404, detail=f"Classification {selector.classification_id} not found")
+        condition = """t.classification_id IN (
+            SELECT d.id FROM classifications d WHERE d.id_path <@ CAST(:id_path AS ltree)
+        )"""
+        params["id_path"] = id_path
+    else:
+        condition = "t.project_id = :project_id"
+        params["project_id"] = selector.project_id
+
+    if selector.status is not None:
+        condition = f"{condition} AND t.status = :status"
+        params["status"] = selector.status
+
+    transition_query = text(f"""
+        WITH target AS (
+            SELECT t.id FROM tasks t
+            WHERE {condition}
+        ),
+        changed AS (
+            UPDATE tasks t
+            SET status = :to_status, updated_at = now()
+            FROM target x
+            WHERE t.id = x.id AND t.status <> :to_status
+            RETURNING t.id
+        )
+        SELECT
+            (SELECT COUNT(*) FROM target) AS matched,
+            COALESCE((SELECT array_agg(id ORDER BY id) FROM changed), CAST('{{}}' AS bigint[])) AS changed_ids
+    """)
+    row = (await db.execute(transition_query, params)).mappings().first()
+    await db.commit()
+
+    changed_ids = list(row["changed_ids"])
+    return {
+        "status": to_status,
+        "matched": row["matched"],
+        "changed": len(changed_ids),
+        "changed_ids": changed_ids,
+    }
+
+
+@router.post(":complete", response_model=TaskBulkTransitionResult)
+@query_budget(2)
+async def bulk_complete_tasks(
+    selector: TaskBulkTransition,
+    db: AsyncSession = Depends(get_write_db),
+):
+    """
+    Mark many tasks as complete (status 'closed') in one statement
+    Select by task_ids, a classification subtree, or a whole project (optionally narrowed by status)
+    """
+    return await _bulk_transition(selector, "closed", db)
+
+
+@router.post(":reopen", response_model=TaskBulkTransitionResult)
+@query_budget(2)
+async def bulk_reopen_tasks(
+    selector: TaskBulkTransition,
+    db: AsyncSession = Depends(get_write_db),
+):
+    """
+    Reopen many tasks (status 'open') in one statement
+    Select by task_ids, a classification subtree, or a whole project (optionally narrowed by status)
+    """
+    return await _bulk_transition(selector, "open", db)
+
+
 @router.delete("/{task_id}", status_code=204)
+@query_budget(2)
 async def delete_task(
     task_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ):
     """
     Delete a task (hard delete)
@@ -295,9 +527,10 @@ async def delete_task(
 
 
 @router.post("/{task_id}/complete", response_model=TaskOut)
+@query_budget(1)
 async def complete_task(
     task_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ):
     """
     Mark task as complete (sets status to 'closed')
@@ -330,9 +563,10 @@ async def complete_task(
 
 
 @router.post("/{task_id}/reopen", response_model=TaskOut)
+@query_budget(1)
 async def reopen_task(
     task_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ):
     """
     Reopen a task (sets status to 'open')
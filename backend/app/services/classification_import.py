@@ -0,0 +1,105 @@
+"""
+Bulk classification subtree import planning
+Turns nested nodes / slash paths into path-keyed node specs and, given the
+nodes that already exist, computes parent ids, depth, path and id_path (ltree)
+for every new node so the whole subtree can be inserted with one statement.
+"""
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.models.classification import ClassificationTreeInput
+
+ROOT_PATH = "/ROOT"
+
+
+def _spec(path: str, parent_path: Optional[str], name: str, sort_no: int = 0,
+          is_active: bool = True, owner_dept_id: Optional[int] = None) -> Dict[str, Any]:
+    return {
+        "path": path,
+        "parent_path": parent_path,
+        "name": name,
+        "sort_no": sort_no,
+        "is_active": is_active,
+        "owner_dept_id": owner_dept_id,
+    }
+
+
+def collect_specs(
+    anchor_path: Optional[str],
+    nodes: Sequence[ClassificationTreeInput],
+    paths: Sequence[str],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Node specs keyed by path in creation order (parents before children)
+    - nodes: nested input under anchor_path (preorder)
+    - paths: every prefix of /ROOT/a/b/c becomes a spec; sort_no follows first appearance
+    A path given twice is the same node (first occurrence wins), which keeps siblings unique.
+    """
+    specs: Dict[str, Dict[str, Any]] = {}
+
+    if nodes:
+        if anchor_path == ROOT_PATH:
+            specs[ROOT_PATH] = _spec(ROOT_PATH, None, "ROOT")
+        stack = [(anchor_path, n) for n in reversed(nodes)]
+        while stack:
+            parent_path, node = stack.pop()
+            path = f"{parent_path}/{node.name}"
+            if path not in specs:
+                specs[path] = _spec(path, parent_path, node.name, node.sort_no, node.is_active, node.owner_dept_id)
+            stack.extend((path, child) for child in reversed(node.children))
+
+    appearance = 0
+    for full_path in paths:
+        segments = full_path.split("/")[1:]
+        parent_path = None
+        path = ""
+        for name in segments:
+            path = f"{path}/{name}"
+            if path not in specs:
+                appearance += 1
+                specs[path] = _spec(path, parent_path, name, 0 if parent_path is None else appearance)
+            parent_path = path
+
+    return specs
+
+
+def plan_new_nodes(
+    specs: Dict[str, Dict[str, Any]],
+    existing: Dict[str, Dict[str, Any]],
+    new_ids: Sequence[int],
+) -> List[Dict[str, Any]]:
+    """
+    Assign pre-allocated ids, parent ids, depths and id_paths to specs that do not exist yet
+    existing: path → {"id", "depth", "id_path", "is_active"}; specs must be ordered parents-first.
+    Raises ValueError when a new node would be created under an inactive parent.
+    """
+    resolved: Dict[str, Dict[str, Any]] = {path: dict(row) for path, row in existing.items()}
+    planned: List[Dict[str, Any]] = []
+    ids = iter(new_ids)
+
+    for path, spec in specs.items():
+        if path in resolved:
+            continue
+        parent = resolved.get(spec["parent_path"]) if spec["parent_path"] is not None else None
+        if spec["parent_path"] is not None and parent is None:
+            raise ValueError(f"Parent classification path {spec['parent_path']!r} not found")
+        if parent is not None and not parent["is_active"]:
+            raise ValueError(f"Parent classification {parent['id']} ({spec['parent_path']}) is inactive")
+
+        node_id = next(ids)
+        row = {
+            "id": node_id,
+            "parent_id": parent["id"] if parent is not None else None,
+            "name": spec["name"],
+            "depth": parent["depth"] + 1 if parent is not None else 0,
+            "path": path,
+            "id_path": f"{parent['id_path']}.{node_id}" if parent is not None else str(node_id),
+            "sort_no": spec["sort_no"],
+            "is_active": spec["is_active"],
+            "owner_dept_id": spec["owner_dept_id"],
+        }
+        resolved[path] = {
+            "id": node_id, "depth": row["depth"], "id_path": row["id_path"], "is_active": row["is_active"],
+        }
+        planned.append(row)
+
+    return planned
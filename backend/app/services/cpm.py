@@ -0,0 +1,231 @@
+"""
+Critical path method (CPM)
+Forward and backward passes over a project's task network in O(V + E).
+
+Times are whole days from the project start; a task occupies [ES, EF) with
+EF = ES + duration (0 = milestone). A link pred → succ with lag L requires
+    FS: ES(succ) >= EF(pred) + L      SS: ES(succ) >= ES(pred) + L
+    FF: EF(succ) >= EF(pred) + L      SF: EF(succ) >= ES(pred) + L
+Tasks are indexed 0..n-1 and the links are kept in flat CSR arrays, so both
+passes are tight loops over lists (no per-edge objects or dict lookups); the
+forward pass runs inside Kahn's topological sort, which also detects cycles.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEPENDENCY_TYPES = ("FS", "SS", "FF", "SF")
+_FS, _SS, _FF, _SF = range(4)
+_TYPE_CODE = {name: code for code, name in enumerate(DEPENDENCY_TYPES)}
+
+# (predecessor task id, successor task id, type, lag days)
+Link = Tuple[int, int, str, int]
+
+
+class CycleError(ValueError):
+    """The links contain a cycle (`cycle`: task ids, first == last)"""
+
+    def __init__(self, cycle: List[int]):
+        self.cycle = cycle
+        super().__init__("Dependency cycle: " + " -> ".join(str(t) for t in cycle))
+
+
+class _Graph:
+    """Task index + outgoing links in CSR form (links of task i: out_start[i]..out_start[i+1])"""
+
+    def __init__(self, task_ids: Sequence[int], links: Iterable[Link]):
+        self.task_ids = list(task_ids)
+        index = {tid: i for i, tid in enumerate(self.task_ids)}
+        n = len(self.task_ids)
+
+        preds: List[int] = []
+        succs: List[int] = []
+        codes: List[int] = []
+        lags: List[int] = []
+        for pred_id, succ_id, dep_type, lag in links:
+            preds.append(index[pred_id])
+            succs.append(index[succ_id])
+            codes.append(_TYPE_CODE[dep_type])
+            lags.append(lag)
+
+        out_start = [0] * (n + 1)
+        for p in preds:
+            out_start[p + 1] += 1
+        for i in range(n):
+            out_start[i + 1] += out_start[i]
+        fill = out_start[:-1].copy()
+        m = len(preds)
+        self.out_succ = [0] * m
+        self.out_code = [0] * m
+        self.out_lag = [0] * m
+        indegree = [0] * n
+        for e in range(m):
+            p = preds[e]
+            slot = fill[p]
+            fill[p] += 1
+            self.out_succ[slot] = succs[e]
+            self.out_code[slot] = codes[e]
+            self.out_lag[slot] = lags[e]
+            indegree[succs[e]] += 1
+        self.out_start = out_start
+        self.indegree = indegree
+        self.link_count = m
+
+    def find_cycle(self, remaining: Sequence[int]) -> List[int]:
+        """A concrete cycle among the tasks Kahn's algorithm could not order (iterative DFS)"""
+        in_remaining = [False] * len(self.task_ids)
+        for i in remaining:
+            in_remaining[i] = True
+        state = [0] * len(self.task_ids)  # 0 = 미방문, 1 = 스택 위, 2 = 완료
+        out_start, out_succ = self.out_start, self.out_succ
+        for root in remaining:
+            if state[root]:
+                continue
+            stack = [(root, out_start[root])]
+            path = [root]
+            state[root] = 1
+            while stack:
+                node, e = stack[-1]
+                if e == out_start[node + 1]:
+                    stack.pop()
+                    path.pop()
+                    state[node] = 2
+                    continue
+                stack[-1] = (node, e + 1)
+                nxt = out_succ[e]
+                if not in_remaining[nxt] or state[nxt] == 2:
+                    continue
+                if state[nxt] == 1:
+                    cycle = path[path.index(nxt):] + [nxt]
+                    return [self.task_ids[i] for i in cycle]
+                state[nxt] = 1
+                stack.append((nxt, out_start[nxt]))
+                path.append(nxt)
+        return []
+
+
+def find_cycle(task_ids: Sequence[int], links: Iterable[Link]) -> Optional[List[int]]:
+    """None if the links form a DAG over `task_ids`, otherwise one cycle (task ids, first == last)"""
+    graph = _Graph(task_ids, links)
+    indegree = graph.indegree.copy()
+    queue = [i for i, d in enumerate(indegree) if d == 0]
+    out_start, out_succ = graph.out_start, graph.out_succ
+    head = 0
+    while head < len(queue):
+        p = queue[head]
+        head += 1
+        for e in range(out_start[p], out_start[p + 1]):
+            s = out_succ[e]
+            indegree[s] -= 1
+            if indegree[s] == 0:
+                queue.append(s)
+    if len(queue) == len(indegree):
+        return None
+    return graph.find_cycle([i for i, d in enumerate(indegree) if d > 0])
+
+
+def compute_cpm(task_ids: Sequence[int], durations: Sequence[int], links: Iterable[Link]) -> Dict[str, list]:
+    """
+    Early/late times, floats and the critical path of a task network
+    `durations[i]` (days, >= 0) belongs to `task_ids[i]`; every link must reference those ids.
+    Raises CycleError when the network is not a DAG.
+
+    Returns lists aligned with `task_ids` (es, ef, ls, lf, total_float, free_float) plus
+    `order` (topological task indexes), `finish` (project duration, days) and
+    `critical_path` (task indexes of one longest driving chain, start → finish).
+    """
+    graph = _Graph(task_ids, links)
+    n = len(graph.task_ids)
+    dur = list(durations)
+    out_start, out_succ, out_code, out_lag = graph.out_start, graph.out_succ, graph.out_code, graph.out_lag
+
+    # Forward pass fused with Kahn: a task is final once its last predecessor is processed
+    indegree = graph.indegree.copy()
+    es = [0] * n
+    driver = [-1] * n  # 가장 늦은 시작을 결정한 선행 작업 (critical path 역추적용)
+    order = [i for i in range(n) if indegree[i] == 0]
+    head = 0
+    while head < len(order):
+        p = order[head]
+        head += 1
+        es_p = es[p]
+        ef_p = es_p + dur[p]
+        for e in range(out_start[p], out_start[p + 1]):
+            s = out_succ[e]
+            code = out_code[e]
+            if code == _FS:
+                bound = ef_p + out_lag[e]
+            elif code == _SS:
+                bound = es_p + out_lag[e]
+            elif code == _FF:
+                bound = ef_p + out_lag[e] - dur[s]
+            else:
+                bound = es_p + out_lag[e] - dur[s]
+            if bound > es[s] or (bound == es[s] and driver[s] < 0):
+                es[s] = bound
+                driver[s] = p
+            indegree[s] -= 1
+            if indegree[s] == 0:
+                order.append(s)
+
+    if len(order) < n:
+        raise CycleError(graph.find_cycle([i for i in range(n) if indegree[i] > 0]))
+
+    ef = [es[i] + dur[i] for i in range(n)]
+    finish = max(ef, default=0)
+
+    # Backward pass (reverse topological order: every successor is already final)
+    lf = [finish] * n
+    ls = [0] * n
+    free_float = [0] * n
+    for p in reversed(order):
+        lf_p = finish
+        ff_p = finish - ef[p]
+        es_p, ef_p, dur_p = es[p], ef[p], dur[p]
+        for e in range(out_start[p], out_start[p + 1]):
+            s = out_succ[e]
+            code = out_code[e]
+            lag = out_lag[e]
+            if code == _FS:
+                late = ls[s] - lag
+                slack = es[s] - (ef_p + lag)
+            elif code == _SS:
+                late = ls[s] - lag + dur_p
+                slack = es[s] - (es_p + lag)
+            elif code == _FF:
+                late = lf[s] - lag
+                slack = ef[s] - (ef_p + lag)
+            else:
+                late = lf[s] - lag + dur_p
+                slack = ef[s] - (es_p + lag)
+            if late < lf_p:
+                lf_p = late
+            if slack < ff_p:
+                ff_p = slack
+        lf[p] = lf_p
+        ls[p] = lf_p - dur_p
+        free_float[p] = ff_p
+
+    total_float = [ls[i] - es[i] for i in range(n)]
+
+    # 종료가 가장 늦은 critical 작업에서 driver 를 따라 시작까지 역추적
+    critical_path: List[int] = []
+    end = max(
+        (i for i in range(n) if ef[i] == finish and total_float[i] == 0),
+        key=lambda i: (dur[i] > 0, -i),
+        default=None,
+    )
+    while end is not None and end >= 0:
+        critical_path.append(end)
+        end = driver[end]
+    critical_path.reverse()
+
+    return {
+        "order": order,
+        "finish": finish,
+        "es": es,
+        "ef": ef,
+        "ls": ls,
+        "lf": lf,
+        "total_float": total_float,
+        "free_float": free_float,
+        "critical_path": critical_path,
+    }
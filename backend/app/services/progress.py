@@ -0,0 +1,54 @@
+"""
+Classification progress rollup
+Per-node task totals (closed / total, earliest start, latest end) including the
+whole subtree. Task counts come pre-aggregated per classification from one
+GROUP BY; the tree rows arrive ordered by depth, so walking them backwards
+visits every child before its parent and a single pass folds each node into
+its parent — no recursion and no per-node query.
+"""
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence
+
+
+def _percent(closed: int, total: int) -> Optional[float]:
+    return round(closed * 100.0 / total, 1) if total else None
+
+
+def rollup_progress(
+    nodes: Sequence[Mapping[str, Any]],
+    task_counts: Iterable[Mapping[str, Any]],
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Subtree progress per classification id
+    nodes: tree rows (id, parent_id) ordered by depth (CLASSIFICATION_TREE_QUERY)
+    task_counts: rows (classification_id, total, closed, earliest_start, latest_end)
+    Returns {id: {closed, total, percent (0-100, null without tasks), earliest_start, latest_end}}
+    """
+    acc: Dict[int, list] = {node["id"]: [0, 0, None, None] for node in nodes}
+    for row in task_counts:
+        a = acc.get(row["classification_id"])
+        if a is not None:
+            a[0], a[1], a[2], a[3] = row["closed"], row["total"], row["earliest_start"], row["latest_end"]
+
+    # 깊이 역순 = 자식이 항상 부모보다 먼저 → 한 번의 순회로 부모에 합산
+    for node in reversed(nodes):
+        parent = acc.get(node["parent_id"])
+        if parent is None:
+            continue
+        closed, total, start, end = acc[node["id"]]
+        parent[0] += closed
+        parent[1] += total
+        if start is not None and (parent[2] is None or start < parent[2]):
+            parent[2] = start
+        if end is not None and (parent[3] is None or end > parent[3]):
+            parent[3] = end
+
+    return {
+        node_id: {
+            "closed": closed,
+            "total": total,
+            "percent": _percent(closed, total),
+            "earliest_start": start,
+            "latest_end": end,
+        }
+        for node_id, (closed, total, start, end) in acc.items()
+    }
@@ -0,0 +1,164 @@
+"""
+Schedule (Gantt) computation
+Implements docs/schedule_design.md on the server side:
+date axis, month header colspans, task-row detection and lane assignment
+"""
+import heapq
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# docs/schedule_design.md 8.1
+BASE_ROW_HEIGHT = 40
+LANE_HEIGHT = 50
+
+# docs/schedule_design.md 3.1 / 4.2
+TASK_ROW_MIN_DEPTH = 3
+DEFAULT_SCHEDULE_DAYS = 30
+
+
+def build_date_axis(ordered_at: Optional[date], max_baseline_end: Optional[date], today: Optional[date] = None) -> Tuple[date, date]:
+    """
+    Schedule range: ordered_at ~ max(baseline_end)
+    - ordered_at NULL → today
+    - no plans (or all plans end before the start) → start + 30 days
+    """
+    start = ordered_at or today or date.today()
+    if max_baseline_end is None or max_baseline_end < start:
+        return start, start + timedelta(days=DEFAULT_SCHEDULE_DAYS)
+    return start, max_baseline_end
+
+
+def month_spans(start: date, end: date) -> List[Dict[str, int]]:
+    """Month header cells (one per month, colspan = days of that month inside the range)"""
+    spans: List[Dict[str, int]] = []
+    cursor = start
+    while cursor <= end:
+        if cursor.month == 12:
+            next_month = date(cursor.year + 1, 1, 1)
+        else:
+            next_month = date(cursor.year, cursor.month + 1, 1)
+        span_end = min(end, next_month - timedelta(days=1))
+        spans.append({
+            "year": cursor.year,
+            "month": cursor.month,
+            "colspan": (span_end - cursor).days + 1,
+        })
+        cursor = next_month
+    return spans
+
+
+def assign_lanes(bars: Sequence[Mapping[str, Any]]) -> Tuple[List[int], int]:
+    """
+    Lane algorithm (docs/schedule_design.md 7.2) in O(n log n)
+
+    Bars are processed in (plan_start, plan_end) order. Busy lanes sit in a
+    min-heap keyed on their last end date; every lane whose end is before the
+    current start moves to a second min-heap of free lane indexes, and the
+    lowest free index is reused. Because starts are non-decreasing, a freed
+    lane stays free until reassigned, so this yields exactly the first-fit
+    lanes of the reference algorithm without its O(n·lanes) scan.
+
+    Returns (lane index per input bar, lane count).
+    """
+    order = sorted(range(len(bars)), key=lambda i: (bars[i]["plan_start"], bars[i]["plan_end"]))
+    lane_of = [0] * len(bars)
+    busy: List[Tuple[date, int]] = []  # (lane last end, lane index)
+    free: List[int] = []
+    lane_count = 0
+
+    for i in order:
+        start = bars[i]["plan_start"]
+        end = bars[i]["plan_end"]
+
+        # task.start > lane.last_end 이면 해당 lane 사용 가능
+        while busy and busy[0][0] < start:
+            heapq.heappush(free, heapq.heappop(busy)[1])
+
+        if free:
+            lane = heapq.heappop(free)
+        else:
+            lane = lane_count
+            lane_count += 1
+
+        lane_of[i] = lane
+        heapq.heappush(busy, (end, lane))
+
+    return lane_of, lane_count
+
+
+def build_schedule_rows(
+    classifications: Sequence[Mapping[str, Any]],
+    tasks: Iterable[Mapping[str, Any]],
+    start: date,
+    end: date,
+) -> List[Dict[str, Any]]:
+    """
+    Build schedule rows in tree order (sort_no, name within each parent)
+
+    classifications: rows of the classification tree query (active nodes only are shown)
+    tasks: rows with plan_start/plan_end (date) and actual dates
+    """
+    children: Dict[Optional[int], List[Mapping[str, Any]]] = {}
+    for node in classifications:
+        children.setdefault(node["parent_id"], []).append(node)
+    for siblings in children.values():
+        siblings.sort(key=lambda n: (n["sort_no"], n["name"]))
+
+    # classification_id별 그룹핑 (PLAN 이 없거나 범위 밖인 task 는 막대 없음)
+    bars_by_class: Dict[int, List[Dict[str, Any]]] = {}
+    for task in tasks:
+        plan_start = task["plan_start"]
+        plan_end = task["plan_end"]
+        if plan_start is None and plan_end is None:
+            continue
+        # baseline_end 가 없으면 1일짜리 작업으로 보정 (docs 10.3)
+        plan_start = plan_start or plan_end
+        plan_end = plan_end or plan_start
+        if plan_end < start or plan_start > end:
+            continue
+
+        has_actual = task["actual_start_date"] is not None and task["actual_end_date"] is not None
+        bars_by_class.setdefault(task["classification_id"], []).append({
+            "task_id": task["id"],
+            "title": task["title"],
+            "status": task["status"],
+            "plan_start": plan_start,
+            "plan_end": plan_end,
+            "actual_start": task["actual_start_date"] if has_actual else None,
+            "actual_end": task["actual_end_date"] if has_actual else None,
+            "lane_index": 0,
+        })
+
+    rows: List[Dict[str, Any]] = []
+    # 반복 DFS (깊은 트리에서도 재귀 한도 문제 없음)
+    stack = [n for n in reversed(children.get(None, [])) if n["is_active"]]
+    while stack:
+        node = stack.pop()
+        active_children = [c for c in children.get(node["id"], []) if c["is_active"]]
+
+        # leaf 조건 우선 + depth >= 3
+        is_task_row = not active_children and node["depth"] >= TASK_ROW_MIN_DEPTH
+        bars: List[Dict[str, Any]] = []
+        lane_count = 0
+        if is_task_row:
+            bars = bars_by_class.get(node["id"], [])
+            lanes, lane_count = assign_lanes(bars)
+            for bar, lane in zip(bars, lanes):
+                bar["lane_index"] = lane
+            bars.sort(key=lambda b: (b["lane_index"], b["plan_start"]))
+
+        rows.append({
+            "classification_id": node["id"],
+            "parent_id": node["parent_id"],
+            "name": node["name"],
+            "depth": node["depth"],
+            "path": node["path"],
+            "sort_no": node["sort_no"],
+            "is_task_row": is_task_row,
+            "lane_count": lane_count,
+            "row_height": BASE_ROW_HEIGHT + lane_count * LANE_HEIGHT,
+            "bars": bars,
+        })
+        stack.extend(reversed(active_children))
+
+    return rows
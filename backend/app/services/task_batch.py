@@ -0,0 +1,68 @@
+"""
+Batch task update validation
+Validates PATCH /tasks:batch items one by one with TaskUpdate semantics
+(None = leave unchanged) and builds the column arrays for the single
+UPDATE ... FROM unnest(...) statement.
+"""
+from typing import Any, Dict, List, Sequence, Tuple
+
+from pydantic import ValidationError
+
+from app.models.task import TaskBatchUpdateItem
+
+# UPDATE 대상 컬럼 (TaskUpdate 필드)
+BATCH_UPDATE_COLUMNS = [
+    "title", "description", "status", "classification_id",
+    "baseline_start", "baseline_end", "actual_start_date", "actual_end_date",
+]
+
+
+def _error(index: int, task_id: Any, type_: str, loc: List[str], msg: str) -> Dict[str, Any]:
+    return {
+        "index": index,
+        "id": task_id if isinstance(task_id, int) else None,
+        "errors": [{"type": type_, "loc": loc, "msg": msg}],
+    }
+
+
+def validate_items(raw_items: Sequence[Dict[str, Any]]) -> Tuple[Dict[int, int], List[TaskBatchUpdateItem], List[Dict[str, Any]]]:
+    """
+    Returns (task id → item index, valid items in request order, per-item errors)
+    - field errors come from TaskUpdate validators
+    - an item without any field to update, or an id repeated in the batch, is an error
+    """
+    items: List[TaskBatchUpdateItem] = []
+    errors: List[Dict[str, Any]] = []
+    seen: Dict[int, int] = {}
+
+    for index, raw in enumerate(raw_items):
+        try:
+            item = TaskBatchUpdateItem.model_validate(raw)
+        except ValidationError as e:
+            errors.append({
+                "index": index,
+                "id": raw.get("id") if isinstance(raw.get("id"), int) else None,
+                "errors": e.errors(include_url=False, include_context=False, include_input=False),
+            })
+            continue
+
+        if all(getattr(item, col) is None for col in BATCH_UPDATE_COLUMNS):
+            errors.append(_error(index, item.id, "value_error", [], "No fields to update"))
+            continue
+
+        if item.id in seen:
+            errors.append(_error(index, item.id, "value_error", ["id"], f"Task {item.id} already updated by item {seen[item.id]}"))
+            continue
+
+        seen[item.id] = index
+        items.append(item)
+
+    return seen, items, errors
+
+
+def column_arrays(items: Sequence[TaskBatchUpdateItem]) -> Dict[str, List[Any]]:
+    """Bind parameters for unnest(): one array per column, aligned with `ids`"""
+    arrays: Dict[str, List[Any]] = {"ids": [item.id for item in items]}
+    for col in BATCH_UPDATE_COLUMNS:
+        arrays[col] = [getattr(item, col) for item in items]
+    return arrays
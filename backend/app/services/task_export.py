@@ -0,0 +1,56 @@
+"""
+Task export formatting
+Turns batches of task rows (server-side cursor partitions) into NDJSON or CSV
+text chunks; each chunk is encoded once and written straight to the response.
+"""
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Any, Iterable, Mapping
+
+# TaskOut 필드 순서 (project_name 제외) — CSV 는 그대로 POST /projects/{id}/tasks:bulk 로 재적재 가능
+EXPORT_COLUMNS = [
+    "id", "project_id", "classification_id", "title", "description", "status",
+    "baseline_start", "baseline_end", "actual_start_date", "actual_end_date",
+    "created_at", "updated_at",
+]
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# 서버 측 커서에서 한 번에 가져오는 행 수 (= 응답 chunk 단위)
+EXPORT_BATCH_SIZE = 1000
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def ndjson_chunk(rows: Iterable[Mapping[str, Any]]) -> bytes:
+    lines = [
+        json.dumps({col: _plain(row[col]) for col in EXPORT_COLUMNS}, ensure_ascii=False, separators=(",", ":"))
+        for row in rows
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+
+
+def csv_header() -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(EXPORT_COLUMNS)
+    return buffer.getvalue().encode("utf-8")
+
+
+def csv_chunk(rows: Iterable[Mapping[str, Any]]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    # NULL 은 빈 문자열 (import 와 동일 규칙)
+    writer.writerows(
+        ["" if row[col] is None else _plain(row[col]) for col in EXPORT_COLUMNS]
+        for row in rows
+    )
+    return buffer.getvalue().encode("utf-8")
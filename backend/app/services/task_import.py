@@ -0,0 +1,134 @@
+"""
+Bulk task import parsing
+Streams CSV / NDJSON request bodies line by line, validates each row with
+TaskCreate and yields COPY-ready records; invalid rows are collected as errors.
+"""
+import csv
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from app.models.task import TaskCreate
+
+# temp table / COPY column order
+IMPORT_COLUMNS = [
+    "row_no", "classification_id", "title", "description", "status",
+    "baseline_start", "baseline_end", "actual_start_date", "actual_end_date",
+]
+
+# 리포트에 담는 오류 행 최대 개수 (failed 카운트는 전체 기준)
+MAX_REPORTED_ERRORS = 1000
+
+CSV_CONTENT_TYPES = ("text/csv", "application/csv")
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl", "application/json-lines")
+
+
+def detect_format(content_type: Optional[str]) -> Optional[str]:
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type in CSV_CONTENT_TYPES:
+        return "csv"
+    if media_type in NDJSON_CONTENT_TYPES:
+        return "ndjson"
+    return None
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into text lines (UTF-8, optional BOM, \\n or \\r\\n)"""
+    buffer = b""
+    first = True
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for raw in lines:
+            line = raw.decode("utf-8")
+            if first:
+                line = line.lstrip("\ufeff")
+                first = False
+            yield line.rstrip("\r")
+    if buffer:
+        line = buffer.decode("utf-8")
+        if first:
+            line = line.lstrip("\ufeff")
+        yield line.rstrip("\r")
+
+
+async def iter_csv_rows(lines: AsyncIterable[str]) -> AsyncIterator[Any]:
+    """
+    CSV (header row required) → dict per record
+    A record may span lines inside quotes; it is complete once its quote count is even.
+    """
+    header: Optional[List[str]] = None
+    pending = ""
+    async for line in lines:
+        pending = f"{pending}\n{line}" if pending else line
+        if pending.count('"') % 2:
+            continue
+        record, pending = pending, ""
+        if not record.strip():
+            continue
+        try:
+            values = next(csv.reader([record]))
+        except csv.Error as e:
+            yield ValueError(f"Invalid CSV record: {e}")
+            continue
+        if header is None:
+            header = [h.strip() for h in values]
+            continue
+        # 빈 문자열은 NULL 로 처리
+        yield {k: (v if v != "" else None) for k, v in zip(header, values)}
+    if pending.strip():
+        yield ValueError("CSV ends inside a quoted field")
+
+
+async def iter_ndjson_rows(lines: AsyncIterable[str]) -> AsyncIterator[Any]:
+    async for line in lines:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            yield ValueError(f"Invalid JSON: {e.msg}")
+
+
+class TaskImportCollector:
+    """Validates rows into COPY records and keeps the per-row error report"""
+
+    def __init__(self, project_id: int):
+        self.project_id = project_id
+        self.received = 0
+        self.failed = 0
+        self.errors: List[Dict[str, Any]] = []
+
+    def add_error(self, row_no: int, errors: List[Dict[str, Any]]) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row_no, "errors": errors})
+
+    def to_record(self, row_no: int, row: Any) -> Optional[Tuple]:
+        if isinstance(row, Exception):
+            self.add_error(row_no, [{"type": "value_error", "loc": [], "msg": str(row)}])
+            return None
+        if not isinstance(row, dict):
+            self.add_error(row_no, [{"type": "dict_type", "loc": [], "msg": "Row must be an object"}])
+            return None
+
+        # project_id 는 경로 값을 사용, status 생략 시 TaskCreate 기본값 적용
+        data = {k: v for k, v in row.items() if k != "project_id" and not (k == "status" and v is None)}
+        try:
+            task = TaskCreate(project_id=self.project_id, **data)
+        except ValidationError as e:
+            self.add_error(row_no, e.errors(include_url=False, include_context=False, include_input=False))
+            return None
+
+        return (
+            row_no, task.classification_id, task.title, task.description, task.status,
+            task.baseline_start, task.baseline_end, task.actual_start_date, task.actual_end_date,
+        )
+
+    async def records(self, rows: AsyncIterable[Any]) -> AsyncIterator[Tuple]:
+        async for row in rows:
+            self.received += 1
+            record = self.to_record(self.received, row)
+            if record is not None:
+                yield record
@@ -0,0 +1,83 @@
+"""
+Department workload (concurrent tasks per day)
+Sweep line over task intervals: every interval adds +1 at its first day and -1
+after its last day of a difference array, and one prefix sum turns that into the
+number of tasks running on each day. Cost is O(tasks + days) with the per-day
+work done by itertools.accumulate, so a year across the whole shop stays cheap.
+
+Intervals are inclusive day offsets from the window start, already clipped to
+the window (0 <= start <= end < day_count), as returned by the load query.
+"""
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+BUCKETS = ("day", "week")
+
+# (first day offset, last day offset), inclusive
+Interval = Tuple[int, int]
+
+
+def _sweep(intervals: Iterable[Interval], size: int) -> List[int]:
+    """Active interval count per slot 0..size-1 (difference array + prefix sum)"""
+    diff = [0] * (size + 1)
+    for first, last in intervals:
+        diff[first] += 1
+        diff[last + 1] -= 1
+    diff.pop()
+    return list(accumulate(diff))
+
+
+def daily_load(intervals: Iterable[Interval], day_count: int) -> List[int]:
+    """Concurrent tasks on each day of the window"""
+    return _sweep(intervals, day_count)
+
+
+def load_buckets(
+    intervals: Sequence[Interval],
+    start: date,
+    day_count: int,
+    bucket: str,
+    capacity: int,
+) -> List[Dict[str, Any]]:
+    """
+    Load per day or per ISO week (Monday start; the first/last week is cut at the window)
+    - active_tasks: tasks running at any time in the bucket
+    - peak: most tasks running on a single day of the bucket
+    - task_days: sum of the daily counts (person-day style volume)
+    - overloaded: peak > capacity
+    """
+    daily = daily_load(intervals, day_count)
+    if bucket == "day":
+        return [
+            {
+                "start_date": start + timedelta(days=d),
+                "end_date": start + timedelta(days=d),
+                "active_tasks": n,
+                "peak": n,
+                "task_days": n,
+                "overloaded": n > capacity,
+            }
+            for d, n in enumerate(daily)
+        ]
+
+    # 주 번호 = (요일 보정 + 일 offset) // 7 → 같은 sweep 을 주 단위로 한 번 더
+    shift = start.weekday()
+    week_count = (shift + day_count - 1) // 7 + 1
+    active = _sweep((((shift + a) // 7, (shift + b) // 7) for a, b in intervals), week_count)
+
+    buckets = []
+    for w in range(week_count):
+        first = max(w * 7 - shift, 0)
+        last = min(w * 7 - shift + 6, day_count - 1)
+        days = daily[first:last + 1]
+        peak = max(days)
+        buckets.append({
+            "start_date": start + timedelta(days=first),
+            "end_date": start + timedelta(days=last),
+            "active_tasks": active[w],
+            "peak": peak,
+            "task_days": sum(days),
+            "overloaded": peak > capacity,
+        })
+    return buckets
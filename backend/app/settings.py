@@ -1,4 +1,5 @@
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,3 +14,57 @@ DB_NAME = os.getenv("DB_NAME", "masterplan")
 # PostgreSQL asyncpg 연결 문자열
 DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
+# 커넥션 풀 설정 (최대 동시 연결 = DB_POOL_SIZE + DB_MAX_OVERFLOW)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))      # 연결 대기 최대 시간(초), 초과 시 오류
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))      # 연결 재생성 주기(초), -1 이면 사용 안 함
+# asyncpg prepared statement 캐시 크기 (연결당), pgbouncer transaction 모드에서는 0
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+# 서버 측 statement_timeout(ms), 0 이면 제한 없음
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+
+# 읽기 전용 복제본 (GET 라우터의 get_read_db) — 미설정 시 기본 DB 설정을 사용 (같은 DB 를 가리키는 별도 풀)
+DB_READ_USER = os.getenv("DB_READ_USER", DB_USER)
+DB_READ_PASSWORD = os.getenv("DB_READ_PASSWORD", DB_PASSWORD)
+DB_READ_HOST = os.getenv("DB_READ_HOST", DB_HOST)
+DB_READ_PORT = os.getenv("DB_READ_PORT", DB_PORT)
+DB_READ_NAME = os.getenv("DB_READ_NAME", DB_NAME)
+DATABASE_READ_URL = f"postgresql+asyncpg://{DB_READ_USER}:{DB_READ_PASSWORD}@{DB_READ_HOST}:{DB_READ_PORT}/{DB_READ_NAME}"
+DB_READ_POOL_SIZE = int(os.getenv("DB_READ_POOL_SIZE", str(DB_POOL_SIZE)))
+DB_READ_MAX_OVERFLOW = int(os.getenv("DB_READ_MAX_OVERFLOW", str(DB_MAX_OVERFLOW)))
+# 쓰기 후 같은 사용자(X-User-Id)의 읽기를 기본 DB 로 보내는 시간(초), 0 이면 사용 안 함
+READ_YOUR_WRITES_WINDOW_S = float(os.getenv("READ_YOUR_WRITES_WINDOW_S", "5"))
+
+# 분류 트리 캐시 (프로젝트별 직렬화된 트리 응답 최대 보관 개수)
+TREE_CACHE_SIZE = int(os.getenv("TREE_CACHE_SIZE", "256"))
+
+# 변경 알림 (LISTEN/NOTIFY) 기반 캐시 무효화 — 워커마다 기본 DB 에 전용 연결 1개
+CHANGE_BUS_ENABLED = os.getenv("CHANGE_BUS_ENABLED", "true").lower() in ("1", "true", "yes")
+CHANGE_BUS_RECONNECT_MAX_S = float(os.getenv("CHANGE_BUS_RECONNECT_MAX_S", "30"))   # 재연결 backoff 상한(초)
+CHANGE_BUS_PING_S = float(os.getenv("CHANGE_BUS_PING_S", "30"))                     # 연결 확인 주기(초)
+
+# 프로젝트 변경 이벤트 (SSE GET /projects/{id}/events)
+SSE_QUEUE_SIZE = int(os.getenv("SSE_QUEUE_SIZE", "256"))                    # 구독자별 대기 이벤트 최대 개수 (초과 시 DB 에서 재조회)
+SSE_HEARTBEAT_S = float(os.getenv("SSE_HEARTBEAT_S", "15"))                 # keep-alive 주석 전송 주기(초)
+SSE_BACKLOG_LIMIT = int(os.getenv("SSE_BACKLOG_LIMIT", "1000"))             # 재개 시 재전송 최대 이벤트 수 (초과 시 reset 이벤트)
+SSE_REPLAY_CONCURRENCY = int(os.getenv("SSE_REPLAY_CONCURRENCY", "4"))      # 동시에 DB 에서 재조회하는 최대 수 (기본 풀 크기보다 작게)
+CHANGE_LOG_RETENTION_HOURS = float(os.getenv("CHANGE_LOG_RETENTION_HOURS", "72"))
+
+# SQL 쿼리 파일 (db/sql/queries/*.sql) — 시작 시 1회 로드, SQL_HOT_RELOAD=true 이면 변경 시 다시 읽음 (개발용)
+SQL_QUERIES_DIR = Path(os.getenv("SQL_QUERIES_DIR", Path(__file__).resolve().parents[2] / "db" / "sql" / "queries"))
+SQL_HOT_RELOAD = os.getenv("SQL_HOT_RELOAD", "false").lower() in ("1", "true", "yes")
+
+# 느린 쿼리 로그 (/internal/slow-queries)
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "500"))                            # 기록 기준(ms)
+SLOW_QUERY_EXPLAIN_SAMPLE = float(os.getenv("SLOW_QUERY_EXPLAIN_SAMPLE", "0.1"))    # EXPLAIN ANALYZE 수집 비율 (0~1)
+SLOW_QUERY_EXPLAIN_TIMEOUT_MS = int(os.getenv("SLOW_QUERY_EXPLAIN_TIMEOUT_MS", "10000"))
+SLOW_QUERY_BUFFER_SIZE = int(os.getenv("SLOW_QUERY_BUFFER_SIZE", "200"))            # 최근 항목 보관 개수
+SLOW_QUERY_LOG_FILE = os.getenv("SLOW_QUERY_LOG_FILE", "")                          # JSONL 파일 경로 (빈 값이면 기록 안 함)
+
+# 개발 모드: 응답에 X-DB-Queries / X-DB-Time-ms / X-DB-Query-Budget 헤더 추가, 쿼리 예산 초과 시 경고 로그
+DEV_MODE = os.getenv("DEV_MODE", "false").lower() in ("1", "true", "yes")
+
+# 부서 부하 (GET /departments/{id}/load) — 하루 동시 진행 작업이 이 값을 넘으면 과부하, 조회 기간 최대 일수
+DEPARTMENT_DAILY_CAPACITY = int(os.getenv("DEPARTMENT_DAILY_CAPACITY", "10"))
+DEPARTMENT_LOAD_MAX_DAYS = int(os.getenv("DEPARTMENT_LOAD_MAX_DAYS", "1096"))
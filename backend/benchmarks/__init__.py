@@ -0,0 +1,3 @@
+"""
+Performance benchmarks (run from backend/: python -m benchmarks.<module>)
+"""
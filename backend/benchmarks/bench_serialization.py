@@ -0,0 +1,90 @@
+"""
+List response serialisation benchmark: Pydantic path vs orjson row path
+
+    cd backend && python -m benchmarks.bench_serialization [--rows 200] [--repeat 200]
+
+"pydantic" mirrors what a list endpoint used to do per page: TaskOut(**dict(row))
+per row, FastAPI's response_model validation + JSON-mode dump, then json.dumps in
+JSONResponse. "orjson" is app.core.responses.dump_rows straight from the row
+mappings. Prints per-row cost (µs) and checks both produce the same JSON.
+"""
+import argparse
+import json
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+from pydantic import TypeAdapter
+
+from app.core.responses import dump_rows
+from app.models.task import TaskOut
+
+_list_adapter = TypeAdapter(List[TaskOut])
+
+
+def make_rows(n: int) -> List[Dict[str, Any]]:
+    """Rows shaped like the list_tasks query result (asyncpg returns UTC-aware datetimes)"""
+    base = datetime(2025, 1, 1, 9, 0, tzinfo=timezone.utc)
+    return [
+        {
+            "id": i,
+            "project_id": 1,
+            "project_name": "HB-130X 라인 증설",
+            "classification_id": 100 + i % 40,
+            "title": f"가공 작업 {i}",
+            "description": None if i % 3 else f"설명 {i} " * 5,
+            "status": ("open", "in_progress", "closed")[i % 3],
+            "baseline_start": base + timedelta(days=i % 90),
+            "baseline_end": base + timedelta(days=i % 90 + 5),
+            "actual_start_date": date(2025, 1, 1) + timedelta(days=i % 90) if i % 2 else None,
+            "actual_end_date": None,
+            "created_at": base,
+            "updated_at": base + timedelta(seconds=i, microseconds=i),
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+def pydantic_path(rows: List[Dict[str, Any]]) -> bytes:
+    items = [TaskOut(**dict(row)) for row in rows]
+    content = _list_adapter.dump_python(_list_adapter.validate_python(items, from_attributes=True), mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def orjson_path(rows: List[Dict[str, Any]]) -> bytes:
+    return dump_rows(rows, TaskOut)
+
+
+def per_row_us(fn: Callable[[List[Dict[str, Any]]], bytes], rows: List[Dict[str, Any]], repeat: int) -> float:
+    fn(rows)  # warm-up
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            fn(rows)
+        best = min(best, time.perf_counter() - started)
+    return best / (repeat * len(rows)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200, help="rows per page (default: 200, the list limit)")
+    parser.add_argument("--repeat", type=int, default=200, help="pages per timing run (best of 5 runs)")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    if json.loads(pydantic_path(rows)) != json.loads(orjson_path(rows)):
+        raise SystemExit("output mismatch between pydantic and orjson paths")
+
+    before = per_row_us(pydantic_path, rows, args.repeat)
+    after = per_row_us(orjson_path, rows, args.repeat)
+    print(json.dumps({
+        "rows_per_page": args.rows,
+        "pydantic_us_per_row": round(before, 3),
+        "orjson_us_per_row": round(after, 3),
+        "speedup": round(before / after, 1),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
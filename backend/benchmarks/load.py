@@ -0,0 +1,238 @@
+"""
+Async HTTP load driver
+
+    cd backend && python -m benchmarks.load --base-url http://localhost:8081 \
+        --duration 30 --concurrency 16 [--prefix BENCH-] [--no-writes] [--out result.json]
+
+Discovers the projects created by benchmarks.seed (code prefix), then runs
+`concurrency` workers that pick weighted scenarios until `duration` elapses:
+task/project lists, task search, classification tree, dashboard, and the write
+endpoints (create / patch / batch patch / bulk complete+reopen).
+Prints p50/p95/p99 latency and throughput per route as JSON (plus the git
+commit), so runs can be diffed between commits.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), math.ceil(p / 100 * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+def summarise(latencies_ms: List[float], errors: int, seconds: float) -> Dict[str, Any]:
+    values = sorted(latencies_ms)
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "rps": round(len(values) / seconds, 2) if seconds else 0.0,
+        "p50_ms": round(percentile(values, 50), 2),
+        "p95_ms": round(percentile(values, 95), 2),
+        "p99_ms": round(percentile(values, 99), 2),
+        "mean_ms": round(sum(values) / len(values), 2) if values else 0.0,
+        "max_ms": round(values[-1], 2) if values else 0.0,
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Fixture:
+    """IDs the scenarios need (bench projects, their leaf classifications and some tasks)"""
+
+    def __init__(self):
+        self.project_ids: List[int] = []
+        self.leaves: Dict[int, List[int]] = {}
+        self.tasks: Dict[int, List[int]] = {}
+
+    async def load(self, client: httpx.AsyncClient, prefix: str, max_projects: int) -> None:
+        projects = (await client.get("/projects", params={"q": prefix, "limit": 200, "sort": "id asc"})).json()
+        self.project_ids = [p["id"] for p in projects if (p.get("code") or "").startswith(prefix)][:max_projects]
+        if not self.project_ids:
+            raise SystemExit(f"No projects with code prefix {prefix!r}; run python -m benchmarks.seed first")
+
+        for pid in self.project_ids:
+            nodes = (await client.get("/classifications", params={"project_id": pid, "limit": 200, "sort": "depth desc"})).json()
+            max_depth = max(n["depth"] for n in nodes)
+            self.leaves[pid] = [n["id"] for n in nodes if n["depth"] == max_depth]
+            tasks = (await client.get("/tasks", params={"project_id": pid, "limit": 200})).json()
+            self.tasks[pid] = [t["id"] for t in tasks]
+
+
+Scenario = Callable[[httpx.AsyncClient, Fixture, random.Random], Awaitable[httpx.Response]]
+
+
+async def list_tasks(client, fx, rng):
+    return await client.get("/tasks", params={"project_id": rng.choice(fx.project_ids), "limit": 50})
+
+
+async def search_tasks(client, fx, rng):
+    return await client.get("/tasks", params={"q": rng.choice(["가공", "조립", "검사", "메모"]), "limit": 50})
+
+
+async def list_projects(client, fx, rng):
+    return await client.get("/projects", params={"limit": 50})
+
+
+async def classification_tree(client, fx, rng):
+    return await client.get("/classifications/tree", params={"project_id": rng.choice(fx.project_ids)})
+
+
+async def dashboard_projects(client, fx, rng):
+    return await client.get("/dashboard/projects")
+
+
+async def create_task(client, fx, rng):
+    pid = rng.choice(fx.project_ids)
+    resp = await client.post("/tasks", json={
+        "project_id": pid,
+        "classification_id": rng.choice(fx.leaves[pid]),
+        "title": f"bench {rng.randrange(1_000_000)}",
+        "baseline_start": "2025-03-01T09:00:00Z",
+        "baseline_end": "2025-03-10T18:00:00Z",
+    })
+    if resp.status_code == 201:
+        fx.tasks[pid].append(resp.json()["id"])
+    return resp
+
+
+async def patch_task(client, fx, rng):
+    pid = rng.choice(fx.project_ids)
+    return await client.patch(f"/tasks/{rng.choice(fx.tasks[pid])}", json={"status": rng.choice(["open", "in_progress"])})
+
+
+async def batch_patch_tasks(client, fx, rng):
+    pid = rng.choice(fx.project_ids)
+    ids = rng.sample(fx.tasks[pid], min(20, len(fx.tasks[pid])))
+    day = rng.randint(1, 20)
+    return await client.patch("/tasks:batch", json={"items": [
+        {"id": tid, "baseline_start": f"2025-04-{day:02d}T09:00:00Z", "baseline_end": f"2025-04-{day + 5:02d}T18:00:00Z"}
+        for tid in ids
+    ]})
+
+
+async def bulk_complete_reopen(client, fx, rng):
+    pid = rng.choice(fx.project_ids)
+    ids = rng.sample(fx.tasks[pid], min(50, len(fx.tasks[pid])))
+    return await client.post(rng.choice(["/tasks:complete", "/tasks:reopen"]), json={"task_ids": ids})
+
+
+# (route label, scenario, weight, write?)
+SCENARIOS: List[Tuple[str, Scenario, int, bool]] = [
+    ("GET /tasks", list_tasks, 30, False),
+    ("GET /tasks?q", search_tasks, 10, False),
+    ("GET /projects", list_projects, 15, False),
+    ("GET /classifications/tree", classification_tree, 15, False),
+    ("GET /dashboard/projects", dashboard_projects, 10, False),
+    ("POST /tasks", create_task, 6, True),
+    ("PATCH /tasks/{id}", patch_task, 8, True),
+    ("PATCH /tasks:batch", batch_patch_tasks, 3, True),
+    ("POST /tasks:complete|reopen", bulk_complete_reopen, 3, True),
+]
+
+
+async def worker(
+    client: httpx.AsyncClient, fx: Fixture, rng: random.Random, scenarios: List[Tuple[str, Scenario, int, bool]],
+    deadline: float, results: Dict[str, Dict[str, Any]],
+) -> None:
+    names = [s[0] for s in scenarios]
+    funcs = [s[1] for s in scenarios]
+    weights = [s[2] for s in scenarios]
+    while time.perf_counter() < deadline:
+        i = rng.choices(range(len(scenarios)), weights=weights)[0]
+        bucket = results[names[i]]
+        started = time.perf_counter()
+        try:
+            resp = await funcs[i](client, fx, rng)
+            ok = resp.status_code < 400
+        except httpx.HTTPError:
+            ok = False
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if ok:
+            bucket["latencies"].append(elapsed_ms)
+        else:
+            bucket["errors"] += 1
+
+
+async def main_async(args: argparse.Namespace) -> Dict[str, Any]:
+    scenarios = [s for s in SCENARIOS if not (args.no_writes and s[3])]
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        fx = Fixture()
+        await fx.load(client, args.prefix, args.max_projects)
+
+        # 예열 (연결 풀 / 캐시) 후 측정
+        warmup_deadline = time.perf_counter() + args.warmup
+        await asyncio.gather(*(
+            worker(client, fx, random.Random(args.seed - i - 1), scenarios, warmup_deadline,
+                   {s[0]: {"latencies": [], "errors": 0} for s in scenarios})
+            for i in range(args.concurrency)
+        ))
+
+        results = {s[0]: {"latencies": [], "errors": 0} for s in scenarios}
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            worker(client, fx, random.Random(args.seed + i), scenarios, deadline, results)
+            for i in range(args.concurrency)
+        ))
+        seconds = time.perf_counter() - started
+
+    all_latencies = [v for r in results.values() for v in r["latencies"]]
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "base_url": args.base_url,
+            "duration_s": round(seconds, 2),
+            "concurrency": args.concurrency,
+            "projects": len(fx.project_ids),
+            "seed": args.seed,
+        },
+        "routes": {name: summarise(r["latencies"], r["errors"], seconds) for name, r in results.items()},
+        "total": summarise(all_latencies, sum(r["errors"] for r in results.values()), seconds),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Async load driver reporting p50/p95/p99 and throughput per route")
+    parser.add_argument("--base-url", default="http://localhost:8081")
+    parser.add_argument("--duration", type=float, default=30, help="measured seconds (default: 30)")
+    parser.add_argument("--warmup", type=float, default=5, help="unmeasured warm-up seconds (default: 5)")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent workers (default: 16)")
+    parser.add_argument("--timeout", type=float, default=30, help="per-request timeout seconds")
+    parser.add_argument("--prefix", default="BENCH-", help="project code prefix created by benchmarks.seed")
+    parser.add_argument("--max-projects", type=int, default=50, help="projects to spread load over")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for scenario selection")
+    parser.add_argument("--no-writes", action="store_true", help="read-only scenarios")
+    parser.add_argument("--out", help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(main_async(args))
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Synthetic data generator for benchmarks
+
+    cd backend && python -m benchmarks.seed --projects 20 --depth 3 --fanout 5 --tasks 2000 [--reset]
+
+Creates N projects (code prefix BENCH- by default), each with a ROOT node and a
+full classification tree of the given depth/fan-out below it (ROOT convention:
+ROOT → 대분류 → 중분류 → 소분류 ...), and M tasks per project attached to the
+leaf nodes with baseline/actual dates and a realistic status mix.
+The same --seed always produces the same data. Uses the DB settings of the app
+(DB_HOST, DB_NAME, ...); nodes are inserted set-based with the path triggers
+bypassed, tasks via COPY.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from typing import Any, Dict, List, Tuple
+
+import asyncpg
+
+from app.settings import DB_HOST, DB_NAME, DB_PASSWORD, DB_PORT, DB_USER
+
+TASK_COLUMNS = [
+    "project_id", "classification_id", "title", "description", "status",
+    "baseline_start", "baseline_end", "actual_start_date", "actual_end_date",
+]
+
+LEVEL_NAMES = ["축", "유닛", "공정", "작업", "세부"]
+WORK_NAMES = ["설계", "소재", "가공", "도장", "조립", "검사", "배관", "배선", "입고", "스크래핑"]
+
+
+def dsn() -> str:
+    return f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+
+
+def build_tree(ids: List[int], depth: int, fanout: int) -> List[Dict[str, Any]]:
+    """ROOT + full tree (parents first); ids[0] is ROOT, the rest are consumed in BFS order"""
+    id_iter = iter(ids)
+    root_id = next(id_iter)
+    nodes = [{
+        "id": root_id, "parent_id": None, "name": "ROOT", "depth": 0,
+        "path": "/ROOT", "id_path": str(root_id), "sort_no": 0,
+    }]
+    level = [nodes[0]]
+    for d in range(1, depth + 1):
+        next_level = []
+        for parent in level:
+            for i in range(1, fanout + 1):
+                node_id = next(id_iter)
+                if d == depth:
+                    name = f"{WORK_NAMES[(i - 1) % len(WORK_NAMES)]}-{i:02d}"
+                else:
+                    name = f"{LEVEL_NAMES[(d - 1) % len(LEVEL_NAMES)]}-{i:02d}"
+                node = {
+                    "id": node_id,
+                    "parent_id": parent["id"],
+                    "name": name,
+                    "depth": d,
+                    "path": f"{parent['path']}/{name}",
+                    "id_path": f"{parent['id_path']}.{node_id}",
+                    "sort_no": i,
+                }
+                nodes.append(node)
+                next_level.append(node)
+        level = next_level
+    return nodes
+
+
+def tree_size(depth: int, fanout: int) -> int:
+    return sum(fanout ** d for d in range(depth + 1))
+
+
+def make_project(rng: random.Random, code: str, today: date) -> Dict[str, Any]:
+    ordered_at = today - timedelta(days=rng.randint(0, 240))
+    status = rng.choices(["pending", "in_progress", "paused", "done"], weights=[20, 60, 5, 15])[0]
+    return {
+        "code": code,
+        "name": f"{code} 벤치마크 프로젝트",
+        "customer_name": f"고객사-{rng.randint(1, 30):02d}",
+        "status": status,
+        "ordered_at": ordered_at,
+        "due_at": ordered_at + timedelta(days=rng.randint(120, 360)),
+        "paused_at": today if status == "paused" else None,
+        "completed_at": today if status == "done" else None,
+    }
+
+
+def make_tasks(
+    rng: random.Random, project_id: int, ordered_at: date, leaves: List[Dict[str, Any]], count: int, today: date,
+) -> List[Tuple]:
+    """COPY records in TASK_COLUMNS order; closed tasks have both actual dates, in_progress only a start"""
+    records = []
+    for i in range(count):
+        leaf = leaves[rng.randrange(len(leaves))]
+        start = ordered_at + timedelta(days=rng.randint(0, 180))
+        end = start + timedelta(days=rng.randint(1, 30))
+        if end < today - timedelta(days=7):
+            status = rng.choices(["closed", "in_progress", "open"], weights=[80, 15, 5])[0]
+        elif start <= today:
+            status = rng.choices(["closed", "in_progress", "open"], weights=[20, 60, 20])[0]
+        else:
+            status = "open"
+
+        actual_start = actual_end = None
+        if status in ("closed", "in_progress"):
+            actual_start = start + timedelta(days=rng.randint(-3, 5))
+        if status == "closed":
+            actual_end = max(actual_start, end + timedelta(days=rng.randint(-5, 10)))
+
+        records.append((
+            project_id,
+            leaf["id"],
+            f"{leaf['name']} #{i + 1}",
+            None if rng.random() < 0.6 else f"{leaf['path']} 작업 메모 {i + 1}",
+            status,
+            datetime.combine(start, dt_time(9), tzinfo=timezone.utc),
+            datetime.combine(end, dt_time(18), tzinfo=timezone.utc),
+            actual_start,
+            actual_end,
+        ))
+    return records
+
+
+async def reset(conn: asyncpg.Connection, prefix: str) -> int:
+    """Delete previously generated projects (children first: classifications.parent_id is ON DELETE RESTRICT)"""
+    project_ids = [r["id"] for r in await conn.fetch("SELECT id FROM projects WHERE code LIKE $1", prefix + "%")]
+    if not project_ids:
+        return 0
+    async with conn.transaction():
+        await conn.execute("DELETE FROM tasks WHERE project_id = ANY($1::bigint[])", project_ids)
+        max_depth = await conn.fetchval(
+            "SELECT COALESCE(MAX(depth), 0) FROM classifications WHERE project_id = ANY($1::bigint[])", project_ids,
+        )
+        for d in range(max_depth, -1, -1):
+            await conn.execute(
+                "DELETE FROM classifications WHERE project_id = ANY($1::bigint[]) AND depth = $2", project_ids, d,
+            )
+        await conn.execute("DELETE FROM projects WHERE id = ANY($1::bigint[])", project_ids)
+    return len(project_ids)
+
+
+async def seed_project(conn: asyncpg.Connection, rng: random.Random, code: str, args: argparse.Namespace, today: date) -> Tuple[int, int]:
+    project = make_project(rng, code, today)
+    async with conn.transaction():
+        project_id = await conn.fetchval("""
+            INSERT INTO projects (code, name, customer_name, status, ordered_at, due_at, paused_at, completed_at)
+            VALUES ($1, $2, $3, $4::project_status, $5, $6, $7, $8)
+            RETURNING id
+        """, project["code"], project["name"], project["customer_name"], project["status"],
+            project["ordered_at"], project["due_at"], project["paused_at"], project["completed_at"])
+
+        ids = [r[0] for r in await conn.fetch(
+            "SELECT nextval(pg_get_serial_sequence('public.classifications', 'id')) FROM generate_series(1, $1)",
+            tree_size(args.depth, args.fanout),
+        )]
+        nodes = build_tree(ids, args.depth, args.fanout)
+        await conn.execute("SELECT set_config('masterplan.skip_path_triggers', 'on', true)")
+        await conn.execute("""
+            INSERT INTO classifications (id, project_id, parent_id, name, depth, path, id_path, sort_no, is_active)
+            SELECT n.id, $1, n.parent_id, n.name, n.depth, n.path, n.id_path::ltree, n.sort_no, TRUE
+            FROM unnest($2::bigint[], $3::bigint[], $4::text[], $5::int[], $6::text[], $7::text[], $8::int[])
+              AS n(id, parent_id, name, depth, path, id_path, sort_no)
+        """, project_id,
+            [n["id"] for n in nodes], [n["parent_id"] for n in nodes], [n["name"] for n in nodes],
+            [n["depth"] for n in nodes], [n["path"] for n in nodes], [n["id_path"] for n in nodes],
+            [n["sort_no"] for n in nodes])
+
+        leaves = [n for n in nodes if n["depth"] == args.depth]
+        records = make_tasks(rng, project_id, project["ordered_at"], leaves, args.tasks, today)
+        if records:
+            await conn.copy_records_to_table("tasks", records=records, columns=TASK_COLUMNS)
+    return len(nodes), len(records)
+
+
+async def main_async(args: argparse.Namespace) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    today = date.today()
+    started = time.perf_counter()
+    conn = await asyncpg.connect(dsn())
+    try:
+        deleted = await reset(conn, args.prefix) if args.reset else 0
+        totals = {"classifications": 0, "tasks": 0}
+        for i in range(1, args.projects + 1):
+            nodes, tasks = await seed_project(conn, rng, f"{args.prefix}{args.seed}-{i:04d}", args, today)
+            totals["classifications"] += nodes
+            totals["tasks"] += tasks
+        await conn.execute("ANALYZE projects; ANALYZE classifications; ANALYZE tasks;")
+    finally:
+        await conn.close()
+    return {
+        "deleted_projects": deleted,
+        "projects": args.projects,
+        **totals,
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed a local Postgres with synthetic benchmark data")
+    parser.add_argument("--projects", type=int, default=10, help="number of projects (default: 10)")
+    parser.add_argument("--depth", type=int, default=3, help="tree levels below ROOT (default: 3 = 대/중/소)")
+    parser.add_argument("--fanout", type=int, default=5, help="children per node (default: 5)")
+    parser.add_argument("--tasks", type=int, default=1000, help="tasks per project (default: 1000)")
+    parser.add_argument("--seed", type=int, default=42, help="random seed (default: 42)")
+    parser.add_argument("--prefix", default="BENCH-", help="project code prefix (default: BENCH-)")
+    parser.add_argument("--reset", action="store_true", help="delete projects with the prefix first")
+    args = parser.parse_args()
+    if args.depth < 1 or args.fanout < 1:
+        parser.error("--depth and --fanout must be >= 1")
+    print(json.dumps(asyncio.run(main_async(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""
+Test setup
+DEV_MODE must be on before app.main is imported: MetricsMiddleware reads it at
+construction and only then adds the X-DB-Queries / X-DB-Query-Budget headers.
+
+Endpoint tests that need Postgres run only with MASTERPLAN_TEST_DB=1, with the
+DB_* settings pointing at a disposable database migrated with db/migrations.
+"""
+import os
+
+os.environ.setdefault("DEV_MODE", "true")
@@ -0,0 +1,138 @@
+"""
+Round-trip regression tests: real requests against Postgres, each response
+checked with assert_query_budget (the route's @query_budget from the
+X-DB-Query-Budget header). An extra db.execute in any of these routes fails here.
+"""
+import asyncio
+import os
+import uuid
+from types import SimpleNamespace
+from typing import Any, Optional
+
+import orjson
+import pytest
+from sqlalchemy import text
+from starlette.datastructures import Headers
+
+from app.core.database import AsyncSessionLocal, engine, read_engine
+from app.core.query_budget import assert_query_budget
+from app.main import app
+
+requires_db = pytest.mark.skipif(
+    os.getenv("MASTERPLAN_TEST_DB", "").lower() not in ("1", "true", "yes"),
+    reason="needs a migrated Postgres (set MASTERPLAN_TEST_DB=1 and DB_*)",
+)
+
+
+async def _request(method: str, path: str, body: Any = None, query: str = "") -> SimpleNamespace:
+    """Minimal ASGI client (one request, buffered response)"""
+    payload = orjson.dumps(body) if body is not None else b""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [
+            (b"host", b"test"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(payload)).encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("test", 80),
+    }
+    received = False
+    start: dict = {}
+    chunks: list = []
+
+    async def receive():
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            start.update(message)
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    body_bytes = b"".join(chunks)
+    return SimpleNamespace(
+        status_code=start["status"],
+        headers=Headers(raw=start.get("headers", [])),
+        json=lambda: orjson.loads(body_bytes) if body_bytes else None,
+    )
+
+
+async def _checked(method: str, path: str, body: Any = None, query: str = "", status: Optional[int] = 200):
+    response = await _request(method, path, body, query)
+    assert response.status_code == status, (method, path, response.status_code, response.json())
+    assert_query_budget(response)
+    return response
+
+
+async def _seed() -> dict:
+    """Project → ROOT → two nodes → one task, created through the API (each write budget-checked)"""
+    code = f"BUDGET-{uuid.uuid4().hex[:10]}"
+    project = (await _checked("POST", "/projects", {"code": code, "name": "query budget test"}, status=201)).json()
+    pid = project["id"]
+    root = (await _checked("POST", "/classifications", {"project_id": pid, "parent_id": None, "name": "ROOT"}, status=201)).json()
+    a = (await _checked("POST", "/classifications", {"project_id": pid, "parent_id": root["id"], "name": "A"}, status=201)).json()
+    b = (await _checked("POST", "/classifications", {"project_id": pid, "parent_id": root["id"], "name": "B"}, status=201)).json()
+    task = (await _checked("POST", "/tasks", {"project_id": pid, "classification_id": a["id"], "title": "t1"}, status=201)).json()
+    return {"project_id": pid, "code": code, "root": root["id"], "a": a["id"], "b": b["id"], "task": task["id"]}
+
+
+async def _cleanup(project_id: int) -> None:
+    async with AsyncSessionLocal() as session:
+        await session.execute(text("DELETE FROM tasks WHERE project_id = :pid"), {"pid": project_id})
+        # parent_id FK 는 문장 끝에 검사되므로 한 번에 삭제 가능
+        await session.execute(text("DELETE FROM classifications WHERE project_id = :pid"), {"pid": project_id})
+        await session.execute(text("DELETE FROM projects WHERE id = :pid"), {"pid": project_id})
+        await session.commit()
+
+
+def _run(scenario) -> None:
+    async def main():
+        seeded = None
+        try:
+            seeded = await _seed()
+            await scenario(seeded)
+        finally:
+            if seeded is not None:
+                await _cleanup(seeded["project_id"])
+            await engine.dispose()
+            await read_engine.dispose()
+    asyncio.run(main())
+
+
+@requires_db
+def test_read_routes_stay_within_budget():
+    async def scenario(s):
+        pid = s["project_id"]
+        await _checked("GET", "/dashboard/projects")
+        await _checked("GET", "/tasks", query=f"project_id={pid}")
+        await _checked("GET", f"/tasks/{s['task']}")
+        await _checked("GET", "/classifications/tree", query=f"project_id={pid}")
+        await _checked("GET", "/classifications/tree", query=f"project_id={pid}&progress=true")
+        await _checked("GET", f"/projects/{pid}/schedule", query="progress=true")
+    _run(scenario)
+
+
+@requires_db
+def test_write_routes_stay_within_budget():
+    async def scenario(s):
+        await _checked("PATCH", f"/tasks/{s['task']}", {"title": "t1 renamed", "classification_id": s["b"]})
+        await _checked("POST", f"/tasks/{s['task']}/complete")
+        await _checked("POST", f"/tasks/{s['task']}/reopen")
+        await _checked("PATCH", f"/classifications/{s['a']}", {"name": "A2"})
+        await _checked("POST", f"/classifications/{s['a']}/move", {"parent_id": s["b"]})
+        await _checked("DELETE", f"/tasks/{s['task']}", status=204)
+    _run(scenario)
@@ -0,0 +1,54 @@
+"""
+Query budget guard: every DB-backed route declares @query_budget, and the
+helpers count statements / fail on overruns (no database needed).
+"""
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core.database import get_read_db, get_write_db
+from app.core.metrics import instrument_engine
+from app.core.query_budget import (
+    BUDGET_HEADER, QUERIES_HEADER, QueryBudgetExceeded, assert_query_budget, count_queries,
+    unbudgeted_routes,
+)
+from app.main import app
+
+
+def test_every_db_route_declares_a_budget():
+    assert unbudgeted_routes(app.router.routes, {get_read_db, get_write_db}) == []
+
+
+def test_count_queries_counts_statements():
+    # 요청 밖에서도 엔진 계측(after_cursor_execute)이 count_queries 블록의 문장을 셈
+    engine = create_engine("sqlite://")
+    instrument_engine(SimpleNamespace(sync_engine=engine))
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with count_queries() as stats:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        conn.execute(text("SELECT 3"))
+    assert stats.queries == 2
+
+
+def _response(queries, budget=None):
+    headers = {QUERIES_HEADER: str(queries)}
+    if budget is not None:
+        headers[BUDGET_HEADER] = str(budget)
+    return SimpleNamespace(headers=headers)
+
+
+def test_assert_query_budget_uses_route_budget():
+    assert assert_query_budget(_response(3, budget=3)) == 3
+    with pytest.raises(QueryBudgetExceeded):
+        assert_query_budget(_response(4, budget=3))
+
+
+def test_assert_query_budget_explicit_limit_and_missing_headers():
+    assert assert_query_budget(_response(2), max_queries=2) == 2
+    with pytest.raises(QueryBudgetExceeded):
+        assert_query_budget(_response(2))
+    with pytest.raises(QueryBudgetExceeded):
+        assert_query_budget(SimpleNamespace(headers={}))
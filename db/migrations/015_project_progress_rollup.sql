@@ -0,0 +1,147 @@
+-- 015_project_progress_rollup.sql
+-- 목적: 프로젝트별 task 진행 현황(전체/완료/진행중 건수) 롤업 테이블
+--  - /dashboard/projects 가 프로젝트마다 tasks 를 COUNT 하던 N+1 쿼리를 대체
+--  - tasks 의 statement-level 트리거(transition table)가 증감분만 반영
+--    → 대량 INSERT/UPDATE 도 문장당 프로젝트별 1회 갱신
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS public.project_progress (
+  project_id        BIGINT PRIMARY KEY REFERENCES public.projects(id) ON DELETE CASCADE,
+  total_count       INT NOT NULL DEFAULT 0,
+  closed_count      INT NOT NULL DEFAULT 0,
+  in_progress_count INT NOT NULL DEFAULT 0,
+  updated_at        TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Apply per-project deltas from the statement's transition tables.
+-- (plpgsql plans each statement lazily, so old_rows/new_rows are only
+--  referenced in the branch that matches TG_OP.)
+CREATE OR REPLACE FUNCTION public.tasks_progress_rollup()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    INSERT INTO public.project_progress AS pp
+      (project_id, total_count, closed_count, in_progress_count, updated_at)
+    SELECT
+      n.project_id,
+      COUNT(*)::int,
+      COUNT(*) FILTER (WHERE n.status = 'closed')::int,
+      COUNT(*) FILTER (WHERE n.status = 'in_progress')::int,
+      now()
+    FROM new_rows n
+    GROUP BY n.project_id
+    ON CONFLICT (project_id) DO UPDATE
+    SET total_count       = pp.total_count + EXCLUDED.total_count,
+        closed_count      = pp.closed_count + EXCLUDED.closed_count,
+        in_progress_count = pp.in_progress_count + EXCLUDED.in_progress_count,
+        updated_at        = now();
+
+  ELSIF TG_OP = 'UPDATE' THEN
+    WITH delta AS (
+      SELECT o.project_id,
+             -1 AS total_d,
+             -(o.status = 'closed')::int AS closed_d,
+             -(o.status = 'in_progress')::int AS in_progress_d
+      FROM old_rows o
+      UNION ALL
+      SELECT n.project_id,
+             1,
+             (n.status = 'closed')::int,
+             (n.status = 'in_progress')::int
+      FROM new_rows n
+    ),
+    agg AS (
+      SELECT project_id,
+             SUM(total_d)::int AS total_d,
+             SUM(closed_d)::int AS closed_d,
+             SUM(in_progress_d)::int AS in_progress_d
+      FROM delta
+      GROUP BY project_id
+    )
+    INSERT INTO public.project_progress AS pp
+      (project_id, total_count, closed_count, in_progress_count, updated_at)
+    SELECT project_id, total_d, closed_d, in_progress_d, now()
+    FROM agg
+    WHERE total_d <> 0 OR closed_d <> 0 OR in_progress_d <> 0
+    ON CONFLICT (project_id) DO UPDATE
+    SET total_count       = pp.total_count + EXCLUDED.total_count,
+        closed_count      = pp.closed_count + EXCLUDED.closed_count,
+        in_progress_count = pp.in_progress_count + EXCLUDED.in_progress_count,
+        updated_at        = now();
+
+  ELSIF TG_OP = 'DELETE' THEN
+    -- 프로젝트 삭제(CASCADE) 시에는 project_progress 행도 함께 삭제되므로 UPDATE 대상이 없음
+    UPDATE public.project_progress pp
+    SET total_count       = pp.total_count - d.total_d,
+        closed_count      = pp.closed_count - d.closed_d,
+        in_progress_count = pp.in_progress_count - d.in_progress_d,
+        updated_at        = now()
+    FROM (
+      SELECT o.project_id,
+             COUNT(*)::int AS total_d,
+             COUNT(*) FILTER (WHERE o.status = 'closed')::int AS closed_d,
+             COUNT(*) FILTER (WHERE o.status = 'in_progress')::int AS in_progress_d
+      FROM old_rows o
+      GROUP BY o.project_id
+    ) d
+    WHERE pp.project_id = d.project_id;
+  END IF;
+
+  RETURN NULL;
+END $$;
+
+-- Attach triggers (idempotent)
+-- transition table 을 쓰는 트리거는 이벤트를 하나만 가질 수 있으므로 INSERT/UPDATE/DELETE 별도 생성
+DO $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_tasks_progress_ai') THEN
+    CREATE TRIGGER trg_tasks_progress_ai
+    AFTER INSERT ON public.tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION public.tasks_progress_rollup();
+  END IF;
+
+  IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_tasks_progress_au') THEN
+    CREATE TRIGGER trg_tasks_progress_au
+    AFTER UPDATE ON public.tasks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION public.tasks_progress_rollup();
+  END IF;
+
+  IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_tasks_progress_ad') THEN
+    CREATE TRIGGER trg_tasks_progress_ad
+    AFTER DELETE ON public.tasks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION public.tasks_progress_rollup();
+  END IF;
+END $$;
+
+-- Backfill (재실행 시 현재 tasks 기준으로 재계산)
+INSERT INTO public.project_progress
+  (project_id, total_count, closed_count, in_progress_count, updated_at)
+SELECT
+  t.project_id,
+  COUNT(*)::int,
+  COUNT(*) FILTER (WHERE t.status = 'closed')::int,
+  COUNT(*) FILTER (WHERE t.status = 'in_progress')::int,
+  now()
+FROM public.tasks t
+GROUP BY t.project_id
+ON CONFLICT (project_id) DO UPDATE
+SET total_count       = EXCLUDED.total_count,
+    closed_count      = EXCLUDED.closed_count,
+    in_progress_count = EXCLUDED.in_progress_count,
+    updated_at        = now();
+
+UPDATE public.project_progress pp
+SET total_count = 0, closed_count = 0, in_progress_count = 0, updated_at = now()
+WHERE NOT EXISTS (SELECT 1 FROM public.tasks t WHERE t.project_id = pp.project_id)
+  AND pp.total_count <> 0;
+
+COMMIT;
@@ -0,0 +1,24 @@
+-- 016_keyset_pagination_indexes.sql
+-- 목적: 목록 API keyset(cursor) 페이지네이션용 복합 인덱스
+--  - 정렬 키 + id(tie-breaker) 순서로 인덱스를 두어 페이지마다 인덱스 seek 1회로 처리
+--  - btree 는 역방향 스캔이 가능하므로 asc/desc 공용
+
+BEGIN;
+
+-- tasks: 기본 정렬 updated_at desc, id desc
+CREATE INDEX IF NOT EXISTS ix_tasks_updated_id
+  ON public.tasks (updated_at, id);
+
+-- tasks: 프로젝트 필터 + 기본 정렬
+CREATE INDEX IF NOT EXISTS ix_tasks_project_updated_id
+  ON public.tasks (project_id, updated_at, id);
+
+-- projects: 기본 정렬 updated_at desc, id desc
+CREATE INDEX IF NOT EXISTS ix_projects_updated_id
+  ON public.projects (updated_at, id);
+
+-- classifications: 프로젝트 필터 + 기본 정렬 sort_no asc, name asc, id asc
+CREATE INDEX IF NOT EXISTS ix_class_project_sort_name_id
+  ON public.classifications (project_id, sort_no, name, id);
+
+COMMIT;
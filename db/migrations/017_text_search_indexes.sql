@@ -0,0 +1,93 @@
+-- 017_text_search_indexes.sql
+-- 목적: tasks / projects 텍스트 검색 인덱스
+--  - pg_trgm GIN 인덱스: '%검색어%' ILIKE 를 인덱스로 처리 (한글 포함, 기본 검색 모드)
+--  - search_tsv(tsvector) 컬럼 + GIN 인덱스: 단어 단위 전문 검색(search_mode=fts)
+--    트리거로 유지, 'simple' 설정 사용(형태소 분석 없음)
+-- 실행: pg_trgm 확장 생성 권한이 필요하므로 postgres(또는 DB owner)로
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- ============================================================
+-- 1) trigram 인덱스
+-- ============================================================
+
+CREATE INDEX IF NOT EXISTS ix_tasks_title_trgm
+  ON public.tasks USING gin (title gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_tasks_description_trgm
+  ON public.tasks USING gin (description gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_projects_name_trgm
+  ON public.projects USING gin (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_projects_code_trgm
+  ON public.projects USING gin (code gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_projects_customer_name_trgm
+  ON public.projects USING gin (customer_name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_projects_customer_code_trgm
+  ON public.projects USING gin (customer_code gin_trgm_ops);
+
+-- ============================================================
+-- 2) tsvector 컬럼 + 트리거
+-- ============================================================
+
+ALTER TABLE public.tasks    ADD COLUMN IF NOT EXISTS search_tsv tsvector;
+ALTER TABLE public.projects ADD COLUMN IF NOT EXISTS search_tsv tsvector;
+
+CREATE OR REPLACE FUNCTION public.tasks_set_search_tsv()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  NEW.search_tsv :=
+    setweight(to_tsvector('simple', COALESCE(NEW.title, '')), 'A') ||
+    setweight(to_tsvector('simple', COALESCE(NEW.description, '')), 'B');
+  RETURN NEW;
+END $$;
+
+CREATE OR REPLACE FUNCTION public.projects_set_search_tsv()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  NEW.search_tsv :=
+    setweight(to_tsvector('simple', COALESCE(NEW.name, '')), 'A') ||
+    setweight(to_tsvector('simple', COALESCE(NEW.code, '')), 'A') ||
+    setweight(to_tsvector('simple', COALESCE(NEW.customer_name, '')), 'B') ||
+    setweight(to_tsvector('simple', COALESCE(NEW.customer_code, '')), 'B');
+  RETURN NEW;
+END $$;
+
+-- 검색 대상 컬럼이 바뀔 때만 재계산 (status/날짜 변경 시에는 실행되지 않음)
+DO $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_tasks_search_tsv') THEN
+    CREATE TRIGGER trg_tasks_search_tsv
+    BEFORE INSERT OR UPDATE OF title, description ON public.tasks
+    FOR EACH ROW
+    EXECUTE FUNCTION public.tasks_set_search_tsv();
+  END IF;
+
+  IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_projects_search_tsv') THEN
+    CREATE TRIGGER trg_projects_search_tsv
+    BEFORE INSERT OR UPDATE OF name, code, customer_name, customer_code ON public.projects
+    FOR EACH ROW
+    EXECUTE FUNCTION public.projects_set_search_tsv();
+  END IF;
+END $$;
+
+-- Backfill (트리거를 통해 계산)
+UPDATE public.tasks SET title = title WHERE search_tsv IS NULL;
+UPDATE public.projects SET name = name WHERE search_tsv IS NULL;
+
+CREATE INDEX IF NOT EXISTS ix_tasks_search_tsv
+  ON public.tasks USING gin (search_tsv);
+
+CREATE INDEX IF NOT EXISTS ix_projects_search_tsv
+  ON public.projects USING gin (search_tsv);
+
+COMMIT;
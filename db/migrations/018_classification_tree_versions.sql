@@ -0,0 +1,76 @@
+-- 018_classification_tree_versions.sql
+-- 목적: 프로젝트별 분류 트리 버전 (API 트리 캐시 / ETag 용)
+--  - classifications 변경 문장마다 관련 프로젝트 버전을 1 증가 (statement-level, 프로젝트당 1회)
+--  - 트리 API 는 (project_id, version) 으로 캐시를 조회하고 ETag 로 사용
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS public.classification_tree_versions (
+  project_id  BIGINT PRIMARY KEY REFERENCES public.projects(id) ON DELETE CASCADE,
+  version     BIGINT NOT NULL DEFAULT 0,
+  updated_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE OR REPLACE FUNCTION public.classifications_bump_tree_version()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    INSERT INTO public.classification_tree_versions AS v (project_id, version, updated_at)
+    SELECT DISTINCT n.project_id, 1, now()
+    FROM new_rows n
+    ON CONFLICT (project_id) DO UPDATE
+    SET version = v.version + 1, updated_at = now();
+
+  ELSIF TG_OP = 'UPDATE' THEN
+    INSERT INTO public.classification_tree_versions AS v (project_id, version, updated_at)
+    SELECT project_id, 1, now()
+    FROM (SELECT project_id FROM new_rows UNION SELECT project_id FROM old_rows) p
+    ON CONFLICT (project_id) DO UPDATE
+    SET version = v.version + 1, updated_at = now();
+
+  ELSIF TG_OP = 'DELETE' THEN
+    -- 프로젝트 CASCADE 삭제 중에는 projects 행이 이미 없으므로 INSERT 하지 않고 UPDATE 만 수행
+    UPDATE public.classification_tree_versions v
+    SET version = v.version + 1, updated_at = now()
+    WHERE v.project_id IN (SELECT DISTINCT o.project_id FROM old_rows o);
+  END IF;
+
+  RETURN NULL;
+END $$;
+
+DO $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_classifications_tree_version_ai') THEN
+    CREATE TRIGGER trg_classifications_tree_version_ai
+    AFTER INSERT ON public.classifications
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION public.classifications_bump_tree_version();
+  END IF;
+
+  IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_classifications_tree_version_au') THEN
+    CREATE TRIGGER trg_classifications_tree_version_au
+    AFTER UPDATE ON public.classifications
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION public.classifications_bump_tree_version();
+  END IF;
+
+  IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_classifications_tree_version_ad') THEN
+    CREATE TRIGGER trg_classifications_tree_version_ad
+    AFTER DELETE ON public.classifications
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION public.classifications_bump_tree_version();
+  END IF;
+END $$;
+
+-- Backfill: 모든 프로젝트에 버전 행 생성 (이후 DELETE 도 버전이 올라가도록)
+INSERT INTO public.classification_tree_versions (project_id, version)
+SELECT p.id, 1
+FROM public.projects p
+ON CONFLICT (project_id) DO NOTHING;
+
+COMMIT;
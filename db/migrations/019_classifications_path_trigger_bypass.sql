@@ -0,0 +1,106 @@
+-- 019_classifications_path_trigger_bypass.sql
+-- 목적: 분류 path/depth 트리거를 트랜잭션 단위로 건너뛸 수 있도록 함
+--  - 대량 생성(POST /classifications:bulk), 하위 트리 이동(POST /classifications/{id}/move) 등 집합 기반 API는 path/depth/parent_id 를 직접 계산하여
+--    한 문장으로 INSERT/UPDATE 하므로, 행마다 실행되는 부모 조회·순환 검사·하위 cascade 가 불필요
+--  - 사용: SELECT set_config('masterplan.skip_path_triggers', 'on', true);  -- 현재 트랜잭션에만 적용
+--  - 설정이 없으면 기존(012)과 동일하게 동작
+
+BEGIN;
+
+-- BEFORE trigger: compute depth/path and block cycles
+CREATE OR REPLACE FUNCTION public.classifications_before_ins_upd()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  p_path  TEXT;
+  p_depth INT;
+  is_cycle BOOLEAN;
+BEGIN
+  -- 집합 기반 API(대량 생성/이동)가 path/depth 를 직접 계산한 경우 건너뜀
+  IF current_setting('masterplan.skip_path_triggers', true) = 'on' THEN
+    RETURN NEW;
+  END IF;
+
+  -- Basic sanity: no self-parent
+  IF TG_OP = 'UPDATE' THEN
+    IF NEW.parent_id IS NOT NULL AND NEW.parent_id = NEW.id THEN
+      RAISE EXCEPTION 'parent_id cannot be self (id=%)', NEW.id;
+    END IF;
+
+    -- Block cycles: NEW.parent_id cannot be a descendant of NEW.id
+    IF NEW.parent_id IS NOT NULL AND NEW.parent_id <> OLD.parent_id THEN
+      WITH RECURSIVE up AS (
+        SELECT c.id, c.parent_id
+        FROM public.classifications c
+        WHERE c.project_id = NEW.project_id AND c.id = NEW.parent_id
+        UNION ALL
+        SELECT c2.id, c2.parent_id
+        FROM public.classifications c2
+        JOIN up ON up.parent_id = c2.id
+        WHERE c2.project_id = NEW.project_id
+      )
+      SELECT EXISTS (SELECT 1 FROM up WHERE id = NEW.id) INTO is_cycle;
+
+      IF is_cycle THEN
+        RAISE EXCEPTION 'cycle detected: cannot move node % under its descendant', NEW.id;
+      END IF;
+    END IF;
+  END IF;
+
+  -- Compute depth/path
+  IF NEW.parent_id IS NULL THEN
+    NEW.depth := 0;
+    NEW.path  := '/' || NEW.name;
+  ELSE
+    SELECT c.path, c.depth
+      INTO p_path, p_depth
+    FROM public.classifications c
+    WHERE c.project_id = NEW.project_id
+      AND c.id = NEW.parent_id;
+
+    IF p_path IS NULL THEN
+      RAISE EXCEPTION 'parent not found (project_id=%, parent_id=%)', NEW.project_id, NEW.parent_id;
+    END IF;
+
+    NEW.depth := p_depth + 1;
+    NEW.path  := p_path || '/' || NEW.name;
+  END IF;
+
+  -- keep updated_at
+  NEW.updated_at := now();
+  RETURN NEW;
+END $$;
+
+-- AFTER trigger: cascade update descendants when path/depth changed
+CREATE OR REPLACE FUNCTION public.classifications_after_update_cascade()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  old_prefix TEXT := OLD.path;
+  new_prefix TEXT := NEW.path;
+  depth_delta INT := NEW.depth - OLD.depth;
+BEGIN
+  IF current_setting('masterplan.skip_path_triggers', true) = 'on' THEN
+    RETURN NULL;
+  END IF;
+
+  -- only when path/depth actually changed
+  IF old_prefix = new_prefix AND depth_delta = 0 THEN
+    RETURN NULL;
+  END IF;
+
+  -- Update descendants by prefix replacement
+  UPDATE public.classifications d
+  SET
+    path = new_prefix || substr(d.path, length(old_prefix) + 1),
+    depth = d.depth + depth_delta,
+    updated_at = now()
+  WHERE d.project_id = NEW.project_id
+    AND d.path LIKE old_prefix || '/%';
+
+  RETURN NULL;
+END $$;
+
+COMMIT;
@@ -0,0 +1,156 @@
+-- 020_classifications_ltree.sql
+-- 목적: 분류 계층을 ltree(id 라벨) 컬럼으로도 저장하여 하위/상위 조회를 재귀 없이 GiST 인덱스로 처리
+--  - id_path: ROOT 부터 자신까지의 id 경로 (예: 1.5.42), 텍스트 path 와 함께 트리거로 유지
+--  - 하위 트리: id_path <@ :node_id_path / 상위 경로: id_path @> :node_id_path
+--  - 이름 변경에도 id_path 는 바뀌지 않으며, 부모 변경 시에만 하위 노드와 함께 다시 계산됨
+--  - 019 의 masterplan.skip_path_triggers 설정 시에는 호출 측(대량 생성/이동 API)이 id_path 도 직접 계산
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS ltree;
+
+ALTER TABLE public.classifications
+  ADD COLUMN IF NOT EXISTS id_path ltree;
+
+-- Backfill (트리거 우회: path/depth 는 그대로 두고 id_path 만 채움)
+SELECT set_config('masterplan.skip_path_triggers', 'on', true);
+
+WITH RECURSIVE t AS (
+  SELECT c.id, text2ltree(c.id::text) AS id_path
+  FROM public.classifications c
+  WHERE c.parent_id IS NULL
+  UNION ALL
+  SELECT c.id, t.id_path || c.id::text
+  FROM public.classifications c
+  JOIN t ON c.parent_id = t.id
+)
+UPDATE public.classifications c
+SET id_path = t.id_path
+FROM t
+WHERE c.id = t.id
+  AND c.id_path IS DISTINCT FROM t.id_path;
+
+SELECT set_config('masterplan.skip_path_triggers', 'off', true);
+
+ALTER TABLE public.classifications
+  ALTER COLUMN id_path SET NOT NULL;
+
+CREATE INDEX IF NOT EXISTS ix_class_id_path_gist
+  ON public.classifications USING gist (id_path);
+
+-- BEFORE trigger: compute depth/path/id_path and block cycles (ltree 비교 1회)
+CREATE OR REPLACE FUNCTION public.classifications_before_ins_upd()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  p_path    TEXT;
+  p_depth   INT;
+  p_id_path ltree;
+BEGIN
+  -- 집합 기반 API(대량 생성/이동)가 path/depth/id_path 를 직접 계산한 경우 건너뜀
+  IF current_setting('masterplan.skip_path_triggers', true) = 'on' THEN
+    RETURN NEW;
+  END IF;
+
+  -- Basic sanity: no self-parent
+  IF TG_OP = 'UPDATE' THEN
+    IF NEW.parent_id IS NOT NULL AND NEW.parent_id = NEW.id THEN
+      RAISE EXCEPTION 'parent_id cannot be self (id=%)', NEW.id;
+    END IF;
+  END IF;
+
+  -- Compute depth/path/id_path
+  IF NEW.parent_id IS NULL THEN
+    NEW.depth   := 0;
+    NEW.path    := '/' || NEW.name;
+    NEW.id_path := text2ltree(NEW.id::text);
+  ELSE
+    SELECT c.path, c.depth, c.id_path
+      INTO p_path, p_depth, p_id_path
+    FROM public.classifications c
+    WHERE c.project_id = NEW.project_id
+      AND c.id = NEW.parent_id;
+
+    IF p_path IS NULL THEN
+      RAISE EXCEPTION 'parent not found (project_id=%, parent_id=%)', NEW.project_id, NEW.parent_id;
+    END IF;
+
+    -- Block cycles: NEW.parent_id cannot be a descendant of NEW.id
+    IF TG_OP = 'UPDATE' AND NEW.parent_id IS DISTINCT FROM OLD.parent_id AND p_id_path <@ OLD.id_path THEN
+      RAISE EXCEPTION 'cycle detected: cannot move node % under its descendant', NEW.id;
+    END IF;
+
+    NEW.depth   := p_depth + 1;
+    NEW.path    := p_path || '/' || NEW.name;
+    NEW.id_path := p_id_path || NEW.id::text;
+  END IF;
+
+  -- keep updated_at
+  NEW.updated_at := now();
+  RETURN NEW;
+END $$;
+
+-- AFTER trigger: cascade update descendants when path/depth/id_path changed
+-- 하위 노드는 id_path <@ OLD.id_path 로 한 번에 선택하고, 행별 트리거를 우회하여 한 문장으로 갱신
+CREATE OR REPLACE FUNCTION public.classifications_after_update_cascade()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  old_prefix TEXT := OLD.path;
+  new_prefix TEXT := NEW.path;
+  depth_delta INT := NEW.depth - OLD.depth;
+BEGIN
+  IF current_setting('masterplan.skip_path_triggers', true) = 'on' THEN
+    RETURN NULL;
+  END IF;
+
+  -- only when path/depth/id_path actually changed
+  IF old_prefix = new_prefix AND depth_delta = 0 AND OLD.id_path = NEW.id_path THEN
+    RETURN NULL;
+  END IF;
+
+  PERFORM set_config('masterplan.skip_path_triggers', 'on', true);
+
+  -- Update descendants by prefix replacement
+  UPDATE public.classifications d
+  SET
+    path = new_prefix || substr(d.path, length(old_prefix) + 1),
+    depth = d.depth + depth_delta,
+    id_path = NEW.id_path || subpath(d.id_path, nlevel(OLD.id_path)),
+    updated_at = now()
+  WHERE d.id_path <@ OLD.id_path
+    AND d.id <> NEW.id;
+
+  PERFORM set_config('masterplan.skip_path_triggers', 'off', true);
+
+  RETURN NULL;
+END $$;
+
+-- Views (011/013): 재귀 CTE 대신 id_path 로 계산 (컬럼 구성 동일)
+CREATE OR REPLACE VIEW public.v_classifications_tree AS
+SELECT
+  c.project_id,
+  c.id,
+  c.parent_id,
+  c.name,
+  c.depth,
+  c.path,
+  c.sort_no,
+  c.is_active,
+  ltree2text(subltree(c.id_path, 0, 1))::bigint AS root_id,
+  nlevel(c.id_path) - 1 AS level
+FROM public.classifications c;
+
+CREATE OR REPLACE VIEW public.v_classifications_under_root AS
+SELECT
+  c.project_id, c.id, c.parent_id, c.name, c.depth, c.path, c.sort_no, c.is_active,
+  r.id AS root_id, nlevel(c.id_path) - nlevel(r.id_path) AS level
+FROM public.classifications r
+JOIN public.classifications c
+  ON c.project_id = r.project_id
+ AND c.id_path <@ r.id_path
+WHERE r.parent_id IS NULL AND r.name = 'ROOT';
+
+COMMIT;
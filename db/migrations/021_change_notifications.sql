@@ -0,0 +1,77 @@
+-- 021_change_notifications.sql
+-- 목적: 프로젝트/분류/작업 변경을 LISTEN/NOTIFY 로 알려 각 API 워커의 인프로세스 캐시를 무효화
+--  - 채널: masterplan_projects / masterplan_classifications / masterplan_tasks
+--  - payload: {"op": "insert|update|delete", "project_ids": [...]} (statement-level, 문장당 1회)
+--  - 영향받은 프로젝트가 많으면 payload 크기 제한(8000 bytes) 때문에 project_ids 를 null 로 보냄 (= 전체 무효화)
+--  - NOTIFY 는 커밋 시점에 전달되며, 롤백된 트랜잭션의 알림은 전달되지 않음
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION public.masterplan_notify_change()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  key_col TEXT := TG_ARGV[0];  -- 프로젝트 ID 컬럼 (projects: id, 나머지: project_id)
+  ids BIGINT[];
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    EXECUTE format('SELECT array_agg(DISTINCT %I) FROM new_rows', key_col) INTO ids;
+  ELSIF TG_OP = 'UPDATE' THEN
+    EXECUTE format(
+      'SELECT array_agg(DISTINCT k) FROM (SELECT %1$I AS k FROM new_rows UNION SELECT %1$I FROM old_rows) s',
+      key_col
+    ) INTO ids;
+  ELSE
+    EXECUTE format('SELECT array_agg(DISTINCT %I) FROM old_rows', key_col) INTO ids;
+  END IF;
+
+  -- 영향받은 행이 없는 문장은 알리지 않음
+  IF ids IS NULL THEN
+    RETURN NULL;
+  END IF;
+
+  PERFORM pg_notify(
+    'masterplan_' || TG_TABLE_NAME,
+    json_build_object(
+      'op', lower(TG_OP),
+      'project_ids', CASE WHEN cardinality(ids) > 500 THEN NULL ELSE ids END
+    )::text
+  );
+  RETURN NULL;
+END $$;
+
+DO $$
+DECLARE
+  t RECORD;
+BEGIN
+  FOR t IN
+    SELECT * FROM (VALUES ('projects', 'id'), ('classifications', 'project_id'), ('tasks', 'project_id')) AS v(tbl, key_col)
+  LOOP
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_' || t.tbl || '_notify_ai') THEN
+      EXECUTE format(
+        'CREATE TRIGGER %I AFTER INSERT ON public.%I REFERENCING NEW TABLE AS new_rows
+         FOR EACH STATEMENT EXECUTE FUNCTION public.masterplan_notify_change(%L)',
+        'trg_' || t.tbl || '_notify_ai', t.tbl, t.key_col
+      );
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_' || t.tbl || '_notify_au') THEN
+      EXECUTE format(
+        'CREATE TRIGGER %I AFTER UPDATE ON public.%I REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+         FOR EACH STATEMENT EXECUTE FUNCTION public.masterplan_notify_change(%L)',
+        'trg_' || t.tbl || '_notify_au', t.tbl, t.key_col
+      );
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_' || t.tbl || '_notify_ad') THEN
+      EXECUTE format(
+        'CREATE TRIGGER %I AFTER DELETE ON public.%I REFERENCING OLD TABLE AS old_rows
+         FOR EACH STATEMENT EXECUTE FUNCTION public.masterplan_notify_change(%L)',
+        'trg_' || t.tbl || '_notify_ad', t.tbl, t.key_col
+      );
+    END IF;
+  END LOOP;
+END $$;
+
+COMMIT;
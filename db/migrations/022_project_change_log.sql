@@ -0,0 +1,109 @@
+-- 022_project_change_log.sql
+-- 목적: 프로젝트별 변경 이벤트 로그 (SSE GET /projects/{id}/events 의 이벤트 원본)
+--  - tasks / classifications 변경 문장마다 프로젝트별 1행 기록 후 NOTIFY masterplan_project_changes
+--  - id 는 이벤트 ID (Last-Event-ID 로 재개: id > last_id 인 행을 다시 전송)
+--  - 같은 프로젝트의 기록은 트랜잭션 advisory lock 으로 직렬화 → 프로젝트 안에서는 id 순서 = 커밋 순서
+--    (늦게 커밋된 작은 id 를 재개 시 건너뛰는 일이 없도록; 같은 프로젝트 동시 쓰기는 커밋까지 대기)
+--  - 변경 행이 200개를 넘으면 entity_ids 는 NULL (클라이언트는 목록 전체를 다시 조회)
+--  - 오래된 행은 API 가 주기적으로 삭제 (CHANGE_LOG_RETENTION_HOURS)
+
+BEGIN;
+
+-- 프로젝트 삭제 시 CASCADE 로 지워지는 tasks/classifications 도 기록하므로 FK 를 두지 않음
+CREATE TABLE IF NOT EXISTS public.project_change_log (
+  id          BIGSERIAL PRIMARY KEY,
+  project_id  BIGINT NOT NULL,
+  entity      TEXT NOT NULL CHECK (entity IN ('task', 'classification')),
+  op          TEXT NOT NULL CHECK (op IN ('insert', 'update', 'delete')),
+  entity_ids  BIGINT[] NULL,
+  row_count   INT NOT NULL,
+  created_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS ix_project_change_log_project_id
+  ON public.project_change_log (project_id, id);
+
+CREATE INDEX IF NOT EXISTS ix_project_change_log_created_at
+  ON public.project_change_log (created_at);
+
+CREATE OR REPLACE FUNCTION public.project_change_log_record()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  entity_name TEXT := TG_ARGV[0];  -- 'task' | 'classification'
+  changed_sql TEXT;
+  r RECORD;
+  change_id BIGINT;
+  ids BIGINT[];
+BEGIN
+  changed_sql := CASE TG_OP
+    WHEN 'INSERT' THEN 'SELECT project_id, id FROM new_rows'
+    WHEN 'UPDATE' THEN 'SELECT project_id, id FROM new_rows UNION SELECT project_id, id FROM old_rows'
+    ELSE 'SELECT project_id, id FROM old_rows'
+  END;
+
+  -- 프로젝트 ID 순으로 lock (여러 프로젝트를 바꾸는 트랜잭션 간 교착 최소화)
+  FOR r IN EXECUTE
+    'SELECT project_id, array_agg(id ORDER BY id) AS ids FROM (' || changed_sql || ') s '
+    || 'GROUP BY project_id ORDER BY project_id'
+  LOOP
+    -- bigint 단일 키 (이름 hash << 32 | project_id): int 캐스팅은 id 가 2^31-1 을 넘으면 실패
+    PERFORM pg_advisory_xact_lock((hashtext('masterplan.project_change_log')::bigint << 32) | r.project_id);
+
+    ids := CASE WHEN cardinality(r.ids) > 200 THEN NULL ELSE r.ids END;
+    INSERT INTO public.project_change_log (project_id, entity, op, entity_ids, row_count)
+    VALUES (r.project_id, entity_name, lower(TG_OP), ids, cardinality(r.ids))
+    RETURNING id INTO change_id;
+
+    PERFORM pg_notify(
+      'masterplan_project_changes',
+      json_build_object(
+        'id', change_id,
+        'project_id', r.project_id,
+        'entity', entity_name,
+        'op', lower(TG_OP),
+        'entity_ids', ids,
+        'row_count', cardinality(r.ids),
+        'created_at', now()
+      )::text
+    );
+  END LOOP;
+
+  RETURN NULL;
+END $$;
+
+DO $$
+DECLARE
+  t RECORD;
+BEGIN
+  FOR t IN
+    SELECT * FROM (VALUES ('tasks', 'task'), ('classifications', 'classification')) AS v(tbl, entity)
+  LOOP
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_' || t.tbl || '_change_log_ai') THEN
+      EXECUTE format(
+        'CREATE TRIGGER %I AFTER INSERT ON public.%I REFERENCING NEW TABLE AS new_rows
+         FOR EACH STATEMENT EXECUTE FUNCTION public.project_change_log_record(%L)',
+        'trg_' || t.tbl || '_change_log_ai', t.tbl, t.entity
+      );
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_' || t.tbl || '_change_log_au') THEN
+      EXECUTE format(
+        'CREATE TRIGGER %I AFTER UPDATE ON public.%I REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+         FOR EACH STATEMENT EXECUTE FUNCTION public.project_change_log_record(%L)',
+        'trg_' || t.tbl || '_change_log_au', t.tbl, t.entity
+      );
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_' || t.tbl || '_change_log_ad') THEN
+      EXECUTE format(
+        'CREATE TRIGGER %I AFTER DELETE ON public.%I REFERENCING OLD TABLE AS old_rows
+         FOR EACH STATEMENT EXECUTE FUNCTION public.project_change_log_record(%L)',
+        'trg_' || t.tbl || '_change_log_ad', t.tbl, t.entity
+      );
+    END IF;
+  END LOOP;
+END $$;
+
+COMMIT;
@@ -0,0 +1,90 @@
+-- 023_task_dependencies.sql
+-- 목적: 작업 간 선후행 관계 (CPM 일정 계산, GET /projects/{id}/critical-path)
+--  - type: FS(완료→시작), SS(시작→시작), FF(완료→완료), SF(시작→완료), lag_days 는 음수(lead) 허용
+--  - 선행/후행 작업은 같은 프로젝트여야 하며 순환(cycle)은 거부
+--  - 같은 프로젝트의 관계 추가는 트랜잭션 advisory lock 으로 직렬화 (동시 추가로 순환이 생기지 않도록)
+--  - 대량 추가(POST /projects/{id}/dependencies)는 API 가 전체 그래프로 순환을 검사한 뒤
+--    SELECT set_config('masterplan.skip_dependency_cycle_check', 'on', true); 로 행별 검사를 건너뜀
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS public.task_dependencies (
+  id              BIGSERIAL PRIMARY KEY,
+  project_id      BIGINT NOT NULL REFERENCES public.projects(id) ON DELETE CASCADE,
+  predecessor_id  BIGINT NOT NULL REFERENCES public.tasks(id) ON DELETE CASCADE,
+  successor_id    BIGINT NOT NULL REFERENCES public.tasks(id) ON DELETE CASCADE,
+  type            TEXT NOT NULL DEFAULT 'FS' CHECK (type IN ('FS', 'SS', 'FF', 'SF')),
+  lag_days        INT NOT NULL DEFAULT 0,
+  created_at      TIMESTAMPTZ NOT NULL DEFAULT now(),
+  CONSTRAINT uq_task_dependencies_pair UNIQUE (predecessor_id, successor_id),
+  CONSTRAINT ck_task_dependencies_not_self CHECK (predecessor_id <> successor_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_task_dependencies_project_id
+  ON public.task_dependencies (project_id);
+
+CREATE INDEX IF NOT EXISTS ix_task_dependencies_successor_id
+  ON public.task_dependencies (successor_id);
+
+CREATE OR REPLACE FUNCTION public.task_dependencies_before_ins_upd()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  bad_count INT;
+  is_cycle BOOLEAN;
+BEGIN
+  -- 두 작업 모두 관계의 프로젝트에 속해야 함
+  SELECT COUNT(*) INTO bad_count
+  FROM public.tasks t
+  WHERE t.id IN (NEW.predecessor_id, NEW.successor_id)
+    AND t.project_id <> NEW.project_id;
+  IF bad_count > 0 THEN
+    RAISE EXCEPTION 'task dependency % -> % crosses projects (project_id=%)',
+      NEW.predecessor_id, NEW.successor_id, NEW.project_id;
+  END IF;
+
+  -- bigint 단일 키 (이름 hash << 32 | project_id): int 캐스팅은 id 가 2^31-1 을 넘으면 실패
+  PERFORM pg_advisory_xact_lock((hashtext('masterplan.task_dependencies')::bigint << 32) | NEW.project_id);
+
+  -- API 가 전체 그래프로 이미 검사한 경우 건너뜀
+  IF current_setting('masterplan.skip_dependency_cycle_check', true) = 'on' THEN
+    RETURN NEW;
+  END IF;
+
+  -- 순환 검사: NEW.successor_id 에서 후행 방향으로 NEW.predecessor_id 에 도달하면 순환
+  IF TG_OP = 'INSERT'
+     OR NEW.predecessor_id <> OLD.predecessor_id
+     OR NEW.successor_id <> OLD.successor_id THEN
+    WITH RECURSIVE reach AS (
+      SELECT d.successor_id
+      FROM public.task_dependencies d
+      WHERE d.predecessor_id = NEW.successor_id
+        AND d.id IS DISTINCT FROM NEW.id
+      UNION
+      SELECT d.successor_id
+      FROM public.task_dependencies d
+      JOIN reach r ON d.predecessor_id = r.successor_id
+      WHERE d.id IS DISTINCT FROM NEW.id
+    )
+    SELECT EXISTS (SELECT 1 FROM reach WHERE successor_id = NEW.predecessor_id) INTO is_cycle;
+
+    IF is_cycle THEN
+      RAISE EXCEPTION 'task dependency % -> % would create a cycle', NEW.predecessor_id, NEW.successor_id;
+    END IF;
+  END IF;
+
+  RETURN NEW;
+END $$;
+
+DO $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_task_dependencies_before_ins_upd') THEN
+    CREATE TRIGGER trg_task_dependencies_before_ins_upd
+    BEFORE INSERT OR UPDATE ON public.task_dependencies
+    FOR EACH ROW
+    EXECUTE FUNCTION public.task_dependencies_before_ins_upd();
+  END IF;
+END $$;
+
+COMMIT;
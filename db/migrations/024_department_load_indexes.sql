@@ -0,0 +1,12 @@
+-- 024_department_load_indexes.sql
+-- 목적: 부서 부하 조회(GET /departments/{id}/load) 인덱스
+--  - 담당 부서가 지정된 분류만 부분 인덱스 (대부분의 분류는 owner_dept_id 가 NULL)
+--  - 부서 소유 분류의 하위 노드는 id_path GiST 인덱스(020), 작업은 ix_tasks_classification_id(007) 사용
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_class_owner_dept
+  ON public.classifications (owner_dept_id, project_id)
+  WHERE owner_dept_id IS NOT NULL;
+
+COMMIT;